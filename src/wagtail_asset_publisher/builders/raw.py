@@ -20,4 +20,6 @@ class RawAssetBuilder(BaseAssetBuilder):
     ) -> str:
         if not extracted_content:
             return ""
+        if len(extracted_content) == 1:
+            return extracted_content[0]
         return "\n\n".join(extracted_content)
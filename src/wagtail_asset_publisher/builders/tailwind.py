@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 import subprocess
@@ -18,6 +19,33 @@ DEFAULT_TAILWIND_INPUT = '@import "tailwindcss";\n'
 SAFE_PLUGIN_NAME_RE = re.compile(r"^@?[\w./-]+$")
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_cli_path() -> str:
+    """Locate the CLI via django-tailwind-cli, else ``tailwindcss`` on PATH.
+
+    Cached for the life of the process: the import and ``get_config()``
+    would otherwise run on every build.
+    """
+    try:
+        from django_tailwind_cli.config import get_config  # type: ignore[import-not-found]  # noqa: I001
+
+        return str(get_config().cli_path)
+    except (ImportError, ValueError):
+        pass
+
+    return "tailwindcss"
+
+
+def _read_base_css(path: str) -> str:
+    """Read ``TAILWIND_BASE_CSS``, reusing the last read while it is unchanged."""
+    return _read_base_css_version(path, Path(path).stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_base_css_version(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
 class TailwindCSSBuilder(BaseAssetBuilder):
     """Builder that generates CSS using Tailwind CLI JIT compilation.
 
@@ -65,14 +93,7 @@ class TailwindCSSBuilder(BaseAssetBuilder):
         if configured:
             return configured
 
-        try:
-            from django_tailwind_cli.config import get_config  # type: ignore[import-not-found]  # noqa: I001
-
-            return str(get_config().cli_path)
-        except (ImportError, ValueError):
-            pass
-
-        return "tailwindcss"
+        return _detect_cli_path()
 
     def _validate_plugins(self, raw_value: object) -> list[str]:
         """Validate TAILWIND_PLUGINS and return only safe plugin names.
@@ -115,22 +136,22 @@ class TailwindCSSBuilder(BaseAssetBuilder):
         ``@import "tailwindcss"`` statement and the ``@source`` directive.
         """
         base_css_path: str | None = get_setting("TAILWIND_BASE_CSS")
+        parts: list[str] = []
         if base_css_path:
-            input_css = Path(base_css_path).read_text(encoding="utf-8")
+            parts.append(_read_base_css(base_css_path))
         else:
-            input_css = DEFAULT_TAILWIND_INPUT
+            parts.append(DEFAULT_TAILWIND_INPUT)
 
             plugins = self._validate_plugins(get_setting("TAILWIND_PLUGINS"))
-            for plugin in plugins:
-                input_css += f'@plugin "{plugin}";\n'
+            parts.extend(f'@plugin "{plugin}";\n' for plugin in plugins)
 
         if content_file is not None:
-            input_css += f'@source "{content_file}";\n'
+            parts.append(f'@source "{content_file}";\n')
 
         if custom_css:
-            input_css += f"\n{custom_css}\n"
+            parts.append(f"\n{custom_css}\n")
 
-        return input_css
+        return "".join(parts)
 
     def _build_command(
         self,
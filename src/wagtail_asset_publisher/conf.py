@@ -29,6 +29,8 @@ DEFAULTS: dict[str, Any] = {
     "MINIFY_HTML": True,
     # Extract assets from full rendered HTML (templates + StreamFields)
     "EXTRACT_FROM_TEMPLATES": True,
+    # Opt in to selectolax's lexbor parser for extraction (fast-parser extra)
+    "FAST_PARSER": False,
     # Tailwind preview CDN URL
     "TAILWIND_CDN_URL": "https://unpkg.com/@tailwindcss/browser@4",
 }
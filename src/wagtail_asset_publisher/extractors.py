@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
+import re
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from html.parser import HTMLParser
-from typing import NamedTuple
+from typing import Any, NamedTuple
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional: the ``fast-parser`` extra
+    LexborHTMLParser = None  # type: ignore[assignment, misc]
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +35,12 @@ class ExtractedAsset(NamedTuple):
     position: str = "body"  # "head" or "body"
 
 
-_JS_MIME_TYPES = frozenset(
+# <script type> values that are still executable JS: missing/empty type,
+# ES modules, and explicit JS MIME types. Anything else is left inline.
+_JS_SCRIPT_TYPES = frozenset(
     {
+        "",
+        "module",
         "text/javascript",
         "application/javascript",
     }
@@ -42,8 +54,13 @@ class AssetExtractor(HTMLParser):
     are left inline and not extracted.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
+    def reset(self) -> None:
+        """Reset the parser and drop everything collected so far.
+
+        ``HTMLParser.__init__`` calls this, and :func:`extract_assets` calls
+        it again to reuse one instance across documents.
+        """
+        super().reset()
         self._styles: list[ExtractedAsset] = []
         self._scripts: list[ExtractedAsset] = []
         self._current_tag: str | None = None
@@ -150,38 +167,62 @@ class AssetExtractor(HTMLParser):
         Sets ``_skip_current = True`` for non-JS types (importmap, etc.)
         so the tag is left inline.
         """
-        type_attr = (attr_dict.get("type") or "").strip().lower()
-
-        if not type_attr:
-            pass  # missing/empty type → normal JS
-        elif type_attr == "module":
-            pass  # handled below
-        elif type_attr in _JS_MIME_TYPES:
-            pass  # explicit MIME type → still normal JS
-        else:
-            # Non-JS type (importmap, speculationrules, etc.) -- skip extraction
+        loading = _loading_strategy(attr_dict)
+        if loading is None:
             self._skip_current = True
             return ""
+        return loading
 
-        has_async = "async" in attr_dict
-        has_defer = "defer" in attr_dict
 
-        if type_attr == "module":
-            return "module-async" if has_async else "module"
+def _loading_strategy(attr_dict: dict[str, str | None]) -> str | None:
+    """Map <script> attributes to a loading strategy, or None for non-JS types."""
+    type_attr = (attr_dict.get("type") or "").strip().lower()
+    if type_attr not in _JS_SCRIPT_TYPES:
+        # Non-JS type (importmap, speculationrules, etc.) -- skip extraction
+        return None
 
-        # Per HTML spec, async takes precedence when both are present
-        if has_async:
-            return "async"
-        if has_defer:
-            return "defer"
-        return ""
+    has_async = "async" in attr_dict
+    has_defer = "defer" in attr_dict
+
+    if type_attr == "module":
+        return "module-async" if has_async else "module"
+
+    # Per HTML spec, async takes precedence when both are present
+    if has_async:
+        return "async"
+    if has_defer:
+        return "defer"
+    return ""
+
+
+# Small inline bodies repeat across pages and requests. Larger ones are
+# hashed directly: per-request scripts (nonces, CSRF tokens, JSON state)
+# would only churn the cache, so it is capped at 256 entries of under
+# 4 KB each (about 1 MB per process at worst).
+_HASH_CACHE_MAX_CONTENT = 4096
 
 
 def compute_content_hash(content: str, length: int = 8) -> str:
     """Compute a short SHA-256 hash of content for matching and filenames."""
+    if len(content) < _HASH_CACHE_MAX_CONTENT:
+        return _cached_content_hash(content, length)
+    return _sha256_prefix(content, length)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_content_hash(content: str, length: int) -> str:
+    return _sha256_prefix(content, length)
+
+
+def _sha256_prefix(content: str, length: int) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()[:length]
 
 
+# Any <style>/<script> start tag.  HTML without one has nothing to extract,
+# so the (comparatively slow) HTMLParser pass can be skipped.
+_INLINE_TAG_RE = re.compile(r"<(?:style|script)\b", re.IGNORECASE)
+
+
 def extract_assets(html: str) -> tuple[list[ExtractedAsset], list[ExtractedAsset]]:
     """Extract inline <style> and <script> tags from HTML.
 
@@ -191,11 +232,171 @@ def extract_assets(html: str) -> tuple[list[ExtractedAsset], list[ExtractedAsset
     Returns:
         Tuple of (styles, scripts) where each is a list of ExtractedAsset.
     """
-    extractor = AssetExtractor()
+    if not _INLINE_TAG_RE.search(html):
+        return [], []
+
+    from .conf import get_setting
+
+    if (
+        LexborHTMLParser is not None
+        and get_setting("FAST_PARSER")
+        and not _lexbor_may_diverge(html)
+    ):
+        return _extract_with_lexbor(html)
+    return _extract_with_html_parser(html)
+
+
+def _extract_with_html_parser(
+    html: str,
+) -> tuple[list[ExtractedAsset], list[ExtractedAsset]]:
+    extractor = _get_extractor()
     extractor.feed(html)
     return extractor.styles, extractor.scripts
 
 
+_extractor_local = threading.local()
+
+
+def _get_extractor() -> AssetExtractor:
+    """Return this thread's parser, reset and ready for a new document."""
+    extractor: AssetExtractor | None = getattr(_extractor_local, "extractor", None)
+    if extractor is None:
+        extractor = _extractor_local.extractor = AssetExtractor()
+    else:
+        extractor.reset()
+    return extractor
+
+
+# An explicit <head> start tag (but not <header>).
+_HEAD_TAG_RE = re.compile(r"<head[\s>]", re.IGNORECASE)
+
+# Markup for which lexbor's HTML5 tree builder yields different inline
+# content or placement than html.parser -- and so than the middleware's
+# _TagStripper, whose hashes must match the published ones:
+#   - CR and NUL, which lexbor normalises to LF and U+FFFD
+#   - SVG/MathML, where lexbor decodes entities inside <style>
+#   - <template>, <frameset> and <plaintext>, whose contents it never
+#     exposes as style/script nodes
+#   - tags inside raw-text elements such as <title> or <textarea>
+#   - "<!--" inside a script, which starts lexbor's script-escape state
+#   - scripts between </head> and <body>, which lexbor moves into the head
+# The patterns run on lowercased HTML: case-insensitive matching is several
+# times slower and would eat into the speed-up lexbor is there for.
+_LEXBOR_DIVERGENT_RE = re.compile(
+    r"<(?:svg|math|template|frameset|plaintext)[\s/>]"
+    r"|<(title|textarea|iframe|xmp|noembed|noframes)\b[^>]*>"
+    r"(?:(?!</\1).)*?<(?:style|script)\b"
+    r"|<script\b[^>]*>(?:(?!</script).)*?<!--"
+    r"|</head\s*>(?:(?!<body[\s>]).)*?<script\b",
+    re.DOTALL,
+)
+_START_TAG_RE = re.compile(r"<(?:style|script)\b")
+_END_TAG_RE = re.compile(r"</(?:style|script)\b")
+
+# html.parser treats everything from <head> up to </head> or <body> as head
+# content. Lexbor only keeps head-only markup there: any other element or
+# text (a <div>, or an <img> in a <noscript> tracking pixel) closes the head
+# early, and anything but a doctype or <html> before <head> opens an implied
+# one. In either case the head/body split of scripts would differ.
+_BEFORE_HEAD_RE = re.compile(r"<!doctype[^>]*>|<html\b[^>]*>|<!--.*?-->|\s+", re.DOTALL)
+_HEAD_ONLY_RE = re.compile(
+    r"<(title|style|script)\b[^>]*>.*?</\1\s*>"
+    r"|</?(?:meta|link|base|noscript)\b[^>]*>"
+    r"|<!--.*?-->"
+    r"|\s+",
+    re.DOTALL,
+)
+_HEAD_END_RE = re.compile(r"</head\s*>|<body[\s>]")
+
+
+def _head_may_diverge(lowered: str) -> bool:
+    """Return True unless the explicit <head> holds only head-only markup."""
+    head = _HEAD_TAG_RE.search(lowered)
+    if head is None:
+        return False
+    if _BEFORE_HEAD_RE.sub("", lowered[: head.start()]):
+        return True
+    start = lowered.find(">", head.start()) + 1
+    end = _HEAD_END_RE.search(lowered, start)
+    region = lowered[start : end.start() if end else len(lowered)]
+    return bool(_HEAD_ONLY_RE.sub("", region))
+
+
+def _lexbor_may_diverge(html: str) -> bool:
+    """Return True when *html* must go through html.parser for exact parity."""
+    if "\r" in html or "\x00" in html:
+        return True
+    lowered = html.lower()
+    if _LEXBOR_DIVERGENT_RE.search(lowered) or _head_may_diverge(lowered):
+        return True
+    # html.parser drops an unclosed <style>/<script>; lexbor keeps it
+    return len(_START_TAG_RE.findall(lowered)) != len(_END_TAG_RE.findall(lowered))
+
+
+def _extract_with_lexbor(
+    html: str,
+) -> tuple[list[ExtractedAsset], list[ExtractedAsset]]:
+    """Extract assets with selectolax's lexbor parser, mirroring AssetExtractor.
+
+    Lexbor builds a full HTML5 tree, so tags at the start of a fragment end
+    up in an implied <head>.  As with AssetExtractor, a tag only counts as
+    being in the head when the document has an explicit <head> tag.
+    """
+    explicit_head = _HEAD_TAG_RE.search(html) is not None
+    styles: list[ExtractedAsset] = []
+    scripts: list[ExtractedAsset] = []
+
+    for node in LexborHTMLParser(html).css("style, script"):
+        attrs = node.attributes
+        if "data-no-extract" in attrs:
+            continue
+
+        loading = ""
+        position = "body"
+        if node.tag == "script":
+            if "src" in attrs:
+                continue
+            resolved = _loading_strategy(attrs)
+            if resolved is None:
+                continue
+            loading = resolved
+            if explicit_head and _in_head(node):
+                # Head scripts: skip by default, opt-in with data-extract
+                if "data-extract" not in attrs:
+                    continue
+                position = "head"
+            elif "data-head" in attrs:
+                position = "head"
+
+        content = (node.text() or "").strip()
+        if not content:
+            continue
+
+        content_hash = compute_content_hash(content)
+        if node.tag == "style":
+            styles.append(ExtractedAsset(content=content, content_hash=content_hash))
+        else:
+            scripts.append(
+                ExtractedAsset(
+                    content=content,
+                    content_hash=content_hash,
+                    loading=loading,
+                    position=position,
+                )
+            )
+
+    return styles, scripts
+
+
+def _in_head(node: Any) -> bool:
+    parent = node.parent
+    while parent is not None:
+        if parent.tag == "head":
+            return True
+        parent = parent.parent
+    return False
+
+
 def extract_assets_from_page(
     page: object,
 ) -> tuple[list[ExtractedAsset], list[ExtractedAsset]]:
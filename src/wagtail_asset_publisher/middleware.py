@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from html.parser import HTMLParser
-from typing import Any
+from typing import Any, AnyStr
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse
 
@@ -15,6 +21,17 @@ logger = logging.getLogger(__name__)
 CACHE_KEY_PREFIX = "wap:"
 CACHE_TIMEOUT = 300  # 5 minutes
 
+# Process-local LRU in front of the shared cache, keyed by (page_id,
+# version) with the version read from the shared cache.  Every rebuild
+# (page or snippet publish) bumps the version through invalidate_cache, so
+# all processes pick up the new assets on their next request.
+LOCAL_CACHE_SIZE = 1024
+
+_local_cache: OrderedDict[tuple[int, int], dict[str, Any]] = OrderedDict()
+_local_cache_lock = threading.Lock()
+
+_PAGE_ASSETS_ATTR = "_wap_published_assets"
+
 
 class AssetPublisherMiddleware:
     """Apply HTML minification to all Wagtail page responses.
@@ -28,17 +45,39 @@ class AssetPublisherMiddleware:
     so editors can see Tailwind utility classes rendered in real time.
     """
 
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
-    def __call__(self, request: HttpRequest) -> HttpResponse:
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         response = self.get_response(request)
+        return self._process_response(request, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Async entry point used when the middleware chain is async.
 
+        The asset lookup hits the cache/ORM and the HTML rewrite is CPU
+        bound, so both run via ``sync_to_async`` and the event loop keeps
+        serving other requests in the meantime.
+        """
+        response = await self.get_response(request)
+        return await sync_to_async(self._process_response)(request, response)
+
+    def _process_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
         content_type = response.get("Content-Type", "")
         if "text/html" not in content_type:
             return response
 
         if response.streaming:
+            logger.debug("Skipping streaming response for %s", request.path)
             return response
 
         if _is_preview_request(request):
@@ -49,19 +88,52 @@ class AssetPublisherMiddleware:
             return response
 
         charset = response.charset or "utf-8"
-        content = response.content.decode(charset)
-
-        assets = _get_published_assets(page.pk)
-        if assets:
-            content = _process_html(content, assets)
+        assets = _get_page_assets(page)
 
-        content = _minify_html(content)
-        response.content = content.encode(charset)
+        spliced = _splice_html_bytes(response.content, charset, assets)
+        if spliced is not None:
+            response.content = spliced
+        else:
+            content = response.content.decode(charset)
+            if assets:
+                content = _process_html(content, assets)
+            content = _minify_html(content)
+            response.content = content.encode(charset)
         response["Content-Length"] = len(response.content)
 
         return response
 
 
+class AssetPublisherCombinedMiddleware(AssetPublisherMiddleware):
+    """Wagtail's redirect middleware and asset publishing in one entry.
+
+    Drop-in replacement for this ``MIDDLEWARE`` pair, saving one middleware
+    layer per request::
+
+        "wagtail.contrib.redirects.middleware.RedirectMiddleware",
+        "wagtail_asset_publisher.middleware.AssetPublisherMiddleware",
+
+    Requires ``wagtail.contrib.redirects`` in ``INSTALLED_APPS``.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        from wagtail.contrib.redirects.middleware import RedirectMiddleware
+
+        super().__init__(get_response)
+        self._redirects = RedirectMiddleware(get_response)
+
+    def _process_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+        # Redirects only apply to 404s.  Look them up before any asset work
+        # so a matched redirect skips decoding and minifying the 404 page.
+        if response.status_code == 404:
+            redirect = self._redirects.process_response(request, response)
+            if redirect is not response:
+                return redirect  # type: ignore[no-any-return]
+        return super()._process_response(request, response)
+
+
 def _is_preview_request(request: HttpRequest) -> bool:
     """Check if this is a Wagtail page preview request.
 
@@ -106,14 +178,73 @@ def _get_page(request: HttpRequest) -> Any:
     return getattr(request, "wagtailpage", None)
 
 
-def _get_published_assets(page_id: int) -> dict[str, Any]:
+def _get_page_assets(page: Any) -> dict[str, Any]:
+    """Return the published assets for a page, memoized on the instance.
+
+    Reusing a page instance across requests (e.g. a page cached in-process)
+    then skips the local LRU as well.  Like the LRU, the memo is only reused
+    while the page's shared asset version is unchanged.
+    """
+    version = _asset_version(page.pk)
+    memo = page.__dict__.get(_PAGE_ASSETS_ATTR)
+    if memo is not None and memo[0] == version:
+        return memo[1]  # type: ignore[no-any-return]
+
+    assets = _get_published_assets(page.pk, version)
+    setattr(page, _PAGE_ASSETS_ATTR, (version, assets))
+    return assets
+
+
+def _get_published_assets(page_id: int, version: int | None = None) -> dict[str, Any]:
     """Look up published assets for a page, with caching.
 
+    Results are kept in a process-local LRU keyed by ``(page_id, version)``,
+    backed by the shared Django cache and finally the database.  *version*
+    defaults to the page's current shared version.
+
     CSS is stored as a single dict.  JS is stored as a list of dicts
     (one per loading/position combination) to support defer/async/module
-    grouping and head/body injection positioning.
+    grouping and head/body injection positioning.  The rendered
+    ``</head>``/``</body>`` tag blocks are cached under ``"injection"``.
+    """
+    if version is None:
+        version = _asset_version(page_id)
+    local_key = (page_id, version)
+    with _local_cache_lock:
+        local = _local_cache.get(local_key)
+        if local is not None:
+            _local_cache.move_to_end(local_key)
+            return local
+
+    assets = _intern_hashes(_get_shared_published_assets(page_id, version))
+
+    with _local_cache_lock:
+        _local_cache[local_key] = assets
+        _local_cache.move_to_end(local_key)
+        while len(_local_cache) > LOCAL_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+    return assets
+
+
+def _intern_hashes(assets: dict[str, Any]) -> dict[str, Any]:
+    """Intern content hashes so pages sharing a snippet share the strings.
+
+    Blocks reused across many pages produce the same hashes; each shared
+    cache read unpickles fresh copies, which would otherwise be held once
+    per page in the local cache.
     """
-    cache_key = f"{CACHE_KEY_PREFIX}{page_id}"
+    entries = list(assets.get("js", []))
+    if "css" in assets:
+        entries.append(assets["css"])
+    for entry in entries:
+        entry["content_hashes"] = {sys.intern(h) for h in entry["content_hashes"]}
+    return assets
+
+
+def _get_shared_published_assets(page_id: int, version: int) -> dict[str, Any]:
+    """Look up published assets in the shared cache, falling back to the DB."""
+    cache_key = f"{CACHE_KEY_PREFIX}{page_id}:v{version}"
     cached = cache.get(cache_key)
     if cached is not None:
         return cached  # type: ignore[no-any-return]
@@ -142,10 +273,35 @@ def _get_published_assets(page_id: int) -> dict[str, Any]:
     if js_entries:
         assets["js"] = js_entries
 
+    # Render the injected tags once per cache fill rather than per request.
+    if assets:
+        assets["injection"] = _render_injection(assets)
+
     cache.set(cache_key, assets, CACHE_TIMEOUT)
     return assets
 
 
+def _version_key(page_id: int) -> str:
+    return f"{CACHE_KEY_PREFIX}ver:{page_id}"
+
+
+def _asset_version(page_id: int) -> int:
+    """Return the current cache version for a page's assets.
+
+    A missing version (never invalidated, or evicted) is seeded with a
+    timestamp rather than read as 0, so a lookup can never land on an entry
+    cached under an earlier version.
+    """
+    version_key = _version_key(page_id)
+    version = cache.get(version_key)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(version_key, version, None):
+            # Another process seeded the version first.
+            version = cache.get(version_key, version)
+    return version  # type: ignore[no-any-return]
+
+
 # Loading strategy -> HTML attributes mapping
 _JS_LOADING_ATTRS: dict[str, str] = {
     "": "",
@@ -158,9 +314,29 @@ _JS_LOADING_ATTRS: dict[str, str] = {
 # Injection order: blocking first, then defer, module, async, module-async
 _JS_LOADING_ORDER = ["", "defer", "module", "async", "module-async"]
 
+# Sort key and tag template per loading strategy, built once at import so
+# rendering is a dict lookup instead of list scans and attribute branching.
+_JS_LOADING_RANK: dict[str, int] = {
+    loading: rank for rank, loading in enumerate(_JS_LOADING_ORDER)
+}
+_JS_TAG_TEMPLATES: dict[str, str] = {
+    loading: f'<script src="{{}}"{attrs}></script>'
+    for loading, attrs in _JS_LOADING_ATTRS.items()
+}
 
-def _process_html(html: str, assets: dict[str, Any]) -> str:
-    """Strip matched inline tags and inject static file references."""
+
+# Any inline <style>/<script> start tag.  Documents without one have nothing
+# for _TagStripper to remove, so the full parse can be skipped.
+_INLINE_TAG_RE = re.compile(r"<(?:style|script)\b", re.IGNORECASE)
+
+
+_INLINE_TAG_BYTES_RE = re.compile(rb"<(?:style|script)\b", re.IGNORECASE)
+
+_UTF8_CHARSETS = frozenset({"utf-8", "utf8"})
+
+
+def _asset_hashes(assets: dict[str, Any]) -> tuple[set[str], set[str]]:
+    """Return the CSS and JS content hashes whose inline tags get stripped."""
     css_hashes: set[str] = set()
     js_hashes: set[str] = set()
     if "css" in assets:
@@ -168,49 +344,121 @@ def _process_html(html: str, assets: dict[str, Any]) -> str:
     if "js" in assets:
         for entry in assets["js"]:
             js_hashes |= entry["content_hashes"]
+    return css_hashes, js_hashes
+
+
+def _splice_html_bytes(
+    raw: bytes, charset: str, assets: dict[str, Any]
+) -> bytes | None:
+    """Inject asset tags into the encoded body without decoding it.
+
+    Only possible when HTML minification is off, the body is UTF-8 and no
+    inline tag may need stripping; returns ``None`` otherwise so the caller
+    falls back to :func:`_process_html` on the decoded text.
+    """
+    from .conf import get_setting
+
+    if get_setting("MINIFY_HTML") or charset.lower() not in _UTF8_CHARSETS:
+        return None
+    if not assets:
+        return raw
+    if any(_asset_hashes(assets)) and _INLINE_TAG_BYTES_RE.search(raw):
+        return None
+
+    head_block, body_block = assets.get("injection") or _render_injection(assets)
+    head_at, body_at = _find_anchors(raw, b"</head>", b"</body>")
+    inserts = sorted(
+        (index, block.encode("utf-8"))
+        for index, block in ((head_at, head_block), (body_at, body_block))
+        if block and index != -1
+    )
+    if not inserts:
+        return raw
+
+    view = memoryview(raw)
+    parts: list[bytes | memoryview] = []
+    start = 0
+    for index, block in inserts:
+        parts.append(view[start:index])
+        parts.append(block)
+        start = index
+    parts.append(view[start:])
+    return b"".join(parts)
+
 
-    if css_hashes or js_hashes:
+def _process_html(html: str, assets: dict[str, Any]) -> str:
+    """Strip matched inline tags and inject static file references."""
+    css_hashes, js_hashes = _asset_hashes(assets)
+
+    if (css_hashes or js_hashes) and _INLINE_TAG_RE.search(html):
         html = _strip_matching_tags(html, css_hashes, js_hashes)
 
+    head_block, body_block = assets.get("injection") or _render_injection(assets)
+    head_at, body_at = _find_anchors(html, "</head>", "</body>")
+    inserts = sorted(
+        (index, block)
+        for index, block in ((head_at, head_block), (body_at, body_block))
+        if block and index != -1
+    )
+
+    parts: list[str] = []
+    start = 0
+    for index, block in inserts:
+        parts.append(html[start:index])
+        parts.append(block)
+        start = index
+    parts.append(html[start:])
+    return "".join(parts)
+
+
+def _find_anchors(
+    doc: AnyStr, head_marker: AnyStr, body_marker: AnyStr
+) -> tuple[int, int]:
+    """Return the offsets of the first head and body markers (-1 if absent).
+
+    ``</body>`` is searched from ``</head>`` onwards, so a well-formed
+    document is scanned once; only the head section is re-checked for a
+    stray ``</body>`` that would come first.
+    """
+    head_at = doc.find(head_marker)
+    body_at = doc.find(body_marker, 0, head_at) if head_at > 0 else -1
+    if body_at == -1:
+        body_at = doc.find(body_marker, max(head_at, 0))
+    return head_at, body_at
+
+
+def _render_injection(assets: dict[str, Any]) -> tuple[str, str]:
+    """Render the tag blocks injected before ``</head>`` and ``</body>``.
+
+    The CSS link comes first in the head block, followed by head-positioned
+    scripts; scripts are ordered by ``_JS_LOADING_ORDER``.  Each tag is
+    followed by a newline.
+    """
+    head_tags: list[str] = []
+    body_tags: list[str] = []
+
     if "css" in assets:
         css_url = assets["css"]["url"]
-        css_tag = f'<link rel="stylesheet" href="{_escape_attr(css_url)}">'
-        html = html.replace("</head>", f"{css_tag}\n</head>", 1)
+        head_tags.append(f'<link rel="stylesheet" href="{_escape_attr(css_url)}">')
 
     if "js" in assets:
+        unranked = len(_JS_LOADING_ORDER)
         js_entries = sorted(
             assets["js"],
-            key=lambda e: (
-                _JS_LOADING_ORDER.index(e["loading"])
-                if e["loading"] in _JS_LOADING_ORDER
-                else len(_JS_LOADING_ORDER)
-            ),
+            key=lambda e: _JS_LOADING_RANK.get(e["loading"], unranked),
         )
+        for entry in js_entries:
+            template = _JS_TAG_TEMPLATES.get(entry["loading"], _JS_TAG_TEMPLATES[""])
+            tag = template.format(_escape_attr(entry["url"]))
+            if entry.get("position") == "head":
+                head_tags.append(tag)
+            else:
+                body_tags.append(tag)
 
-        head_js = [e for e in js_entries if e.get("position") == "head"]
-        body_js = [e for e in js_entries if e.get("position", "body") != "head"]
-
-        if head_js:
-            head_tags = []
-            for entry in head_js:
-                attrs = _JS_LOADING_ATTRS.get(entry["loading"], "")
-                head_tags.append(
-                    f'<script src="{_escape_attr(entry["url"])}"{attrs}></script>'
-                )
-            head_block = "\n".join(head_tags)
-            html = html.replace("</head>", f"{head_block}\n</head>", 1)
-
-        if body_js:
-            body_tags = []
-            for entry in body_js:
-                attrs = _JS_LOADING_ATTRS.get(entry["loading"], "")
-                body_tags.append(
-                    f'<script src="{_escape_attr(entry["url"])}"{attrs}></script>'
-                )
-            body_block = "\n".join(body_tags)
-            html = html.replace("</body>", f"{body_block}\n</body>", 1)
-
-    return html
+    return (
+        "".join(f"{tag}\n" for tag in head_tags),
+        "".join(f"{tag}\n" for tag in body_tags),
+    )
 
 
 def _escape_attr(value: str) -> str:
@@ -371,7 +619,17 @@ def invalidate_cache(page_id: int) -> None:
     """Invalidate the middleware cache for a page.
 
     Called after publishing new assets to ensure the next request
-    picks up the new URLs.
+    picks up the new URLs.  Bumping the page's version moves lookups to a
+    fresh key; entries under older versions simply age out.
     """
-    cache_key = f"{CACHE_KEY_PREFIX}{page_id}"
-    cache.delete(cache_key)
+    version_key = _version_key(page_id)
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        # No version stored yet (or it was evicted).  Seed with a timestamp
+        # so the new version cannot collide with any previously used one.
+        cache.set(version_key, time.time_ns(), None)
+
+    with _local_cache_lock:
+        for key in [key for key in _local_cache if key[0] == page_id]:
+            del _local_cache[key]
@@ -100,6 +100,7 @@ def _process_js(page: Any, storage: Any, scripts: list[ExtractedAsset]) -> None:
         invalidate_cache(page.pk)
         return
 
+    records: list[PublishedAsset] = []
     for (loading, position), group_scripts in groups.items():
         extracted_js = [s.content for s in group_scripts]
         content_hashes = [s.content_hash for s in group_scripts]
@@ -119,12 +120,15 @@ def _process_js(page: Any, storage: Any, scripts: list[ExtractedAsset]) -> None:
 
         url = storage.save(filename, built_js)
 
-        PublishedAsset.objects.update_or_create(
-            page=page,
-            asset_type="js",
-            loading=loading,
-            position=position,
-            defaults={"url": url, "content_hashes": content_hashes},
+        records.append(
+            PublishedAsset(
+                page=page,
+                asset_type="js",
+                loading=loading,
+                position=position,
+                url=url,
+                content_hashes=content_hashes,
+            )
         )
         logger.info(
             "Published JS (%s, %s) for page %d: %s",
@@ -134,6 +138,11 @@ def _process_js(page: Any, storage: Any, scripts: list[ExtractedAsset]) -> None:
             url,
         )
 
+    # All JS rows for the page were cleared above, so every group is a new
+    # row and the whole set can be recorded with a single INSERT.
+    if records:
+        PublishedAsset.objects.bulk_create(records)
+
     invalidate_cache(page.pk)
 
 
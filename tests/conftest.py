@@ -3,21 +3,34 @@
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
 
+from wagtail_asset_publisher import middleware
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def _clear_asset_caches():
+    """Keep the middleware's asset caches from leaking between tests."""
+    middleware._local_cache.clear()
+    cache.clear()
+    yield
+    middleware._local_cache.clear()
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
 def sample_html_with_style():
     """HTML content with inline <style> tag."""
     return "<div><style>body { color: red; }</style><p>Hello</p></div>"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_with_script():
     """HTML content with inline <script> tag."""
     return '<div><script>console.log("hello");</script><p>Hello</p></div>'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_with_both():
     """HTML content with both <style> and <script> tags."""
     return (
@@ -29,7 +42,7 @@ def sample_html_with_both():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_with_no_extract():
     """HTML content with data-no-extract attribute."""
     return (
@@ -40,7 +53,7 @@ def sample_html_with_no_extract():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_with_external_script():
     """HTML content with external script (src attribute)."""
     return (
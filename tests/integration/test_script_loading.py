@@ -7,9 +7,12 @@ grouped by strategy, and injecting the correct HTML attributes via middleware.
 
 from __future__ import annotations
 
+import re
+from typing import Any
 from unittest import mock
 
 import pytest
+from django.http import HttpResponse
 from django.test import RequestFactory, override_settings
 from wagtail.models import Page
 
@@ -41,6 +44,19 @@ JS_ASYNC = "fetch('/api/data');"
 JS_MODULE = "import { foo } from './foo.js';"
 JS_MODULE_ASYNC = "const data = await fetch('/api');"
 
+_BASIC_HTML = "<html><head></head><body><p>hello</p></body></html>"
+_ROUNDTRIP_HTML = (
+    "<html><head><title>Test</title></head><body><p>content</p></body></html>"
+)
+_HTML_WITH_INLINE_DEFER = _BASIC_HTML.replace(
+    "<p>", f"<script defer>{JS_DEFER}</script><p>", 1
+)
+
+_SCRIPT_TAG_RE = re.compile(r"<script[^>]*>")
+
+# The only PublishedAsset columns these tests inspect.
+_ASSET_FIELDS = ("loading", "url", "content_hashes")
+
 
 def _asset(content: str, loading: str = "") -> ExtractedAsset:
     return ExtractedAsset(
@@ -50,6 +66,86 @@ def _asset(content: str, loading: str = "") -> ExtractedAsset:
     )
 
 
+def _assets_for(page: Page, assert_num_queries: Any) -> Any:
+    """Fetch the page's freshly built assets, bypassing the middleware cache."""
+    invalidate_cache(page.pk)
+    # All asset rows for a page must come back in a single query.
+    with assert_num_queries(1):
+        return _get_published_assets(page.pk)
+
+
+def _classify_script_tag(tag: str) -> str:
+    """Map an injected <script> start tag back to its loading strategy."""
+    if 'type="module" async' in tag:
+        return "module-async"
+    if 'type="module"' in tag:
+        return "module"
+    if " async" in tag:
+        return "async"
+    if " defer" in tag:
+        return "defer"
+    return ""
+
+
+# One shared ExtractedAsset per loading strategy.  ExtractedAsset is an
+# immutable NamedTuple and the pipeline only reads it, so tests can reuse
+# these instead of re-hashing the same content.
+_SCRIPTS: dict[str, ExtractedAsset] = {
+    loading: _asset(content, loading)
+    for loading, content in (
+        ("", JS_BLOCKING),
+        ("defer", JS_DEFER),
+        ("async", JS_ASYNC),
+        ("module", JS_MODULE),
+        ("module-async", JS_MODULE_ASYNC),
+    )
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _asset_publisher_settings():
+    """Apply SETTINGS_BASE once for the whole module; no test changes it."""
+    with override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE):
+        yield
+
+
+@pytest.fixture(scope="session")
+def shared_rf():
+    """One shared RequestFactory; it holds no per-request state."""
+    return RequestFactory()
+
+
+@pytest.fixture(scope="module")
+def middleware():
+    """One middleware instance; every call serves a fresh _ROUNDTRIP_HTML page."""
+    return AssetPublisherMiddleware(
+        lambda request: HttpResponse(
+            _ROUNDTRIP_HTML, content_type="text/html; charset=utf-8"
+        )
+    )
+
+
+_LOADINGS = ("", "defer", "async", "module", "module-async")
+
+
+@pytest.fixture(params=[1, 10, 100, 1000], ids=lambda n: f"{n}-scripts")
+def mock_assets(request):
+    """Patch page extraction to return ``request.param`` distinct scripts.
+
+    Scripts cycle through every loading strategy, so the built page has up
+    to five JS groups regardless of the count.
+    """
+    scripts = [
+        _asset(f"var s{i} = {i};", _LOADINGS[i % len(_LOADINGS)])
+        for i in range(request.param)
+    ]
+    with mock.patch(
+        "wagtail_asset_publisher.utils.extract_assets_from_page",
+        return_value=([], scripts),
+    ):
+        yield scripts
+
+
 @pytest.fixture
 def wagtail_page(db):
     root = Page.objects.first()
@@ -62,7 +158,6 @@ def wagtail_page(db):
 class TestFullPipelineMixedStrategies:
     """Extract + Build + DB record creation for mixed loading strategies."""
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_mixed_strategies_create_separate_records(self, wagtail_page):
         """Mixed script loading strategies create separate PublishedAsset records per group.
 
@@ -81,11 +176,11 @@ class TestFullPipelineMixedStrategies:
             4. Confirm each record has the correct loading field value
         """
         scripts = [
-            _asset(JS_BLOCKING, ""),
-            _asset(JS_DEFER, "defer"),
-            _asset(JS_ASYNC, "async"),
-            _asset(JS_MODULE, "module"),
-            _asset(JS_MODULE_ASYNC, "module-async"),
+            _SCRIPTS[""],
+            _SCRIPTS["defer"],
+            _SCRIPTS["async"],
+            _SCRIPTS["module"],
+            _SCRIPTS["module-async"],
         ]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
@@ -96,12 +191,37 @@ class TestFullPipelineMixedStrategies:
         js_assets = PublishedAsset.objects.filter(
             page=wagtail_page, asset_type="js"
         ).order_by("loading")
-        assert js_assets.count() == 5
-
-        loading_values = set(js_assets.values_list("loading", flat=True))
-        assert loading_values == {"", "defer", "async", "module", "module-async"}
+        loading_values = list(js_assets.values_list("loading", flat=True))
+        assert len(loading_values) == 5
+        assert set(loading_values) == {"", "defer", "async", "module", "module-async"}
+
+    def test_query_budget_for_mixed_strategies(
+        self, wagtail_page, django_assert_max_num_queries
+    ):
+        """Building five loading strategies stays within a fixed query budget.
+
+        Purpose: Verify that JS records for every loading group are written in
+            one batch instead of one round trip per group.
+        Category: Performance
+        Target: build_page_assets -> _process_js -> PublishedAsset.objects.bulk_create
+        Technique: Query count
+        Integration targets: build_page_assets -> _process_css + _process_js -> PublishedAsset
+        Test data: Five scripts, one per loading strategy
+        Verification scenario:
+            1. Inject 5 scripts with different loading strategies as extraction results
+            2. Execute build_page_assets
+            3. Confirm at most 3 queries run (CSS lookup, JS lookup, JS insert)
+        """
+        scripts = list(_SCRIPTS.values())
+        with (
+            mock.patch(
+                "wagtail_asset_publisher.utils.extract_assets_from_page",
+                return_value=([], scripts),
+            ),
+            django_assert_max_num_queries(3),
+        ):
+            build_page_assets(wagtail_page)
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_each_strategy_has_correct_content_hashes(self, wagtail_page):
         """Each PublishedAsset stores the content hash of scripts in its loading group.
 
@@ -118,8 +238,8 @@ class TestFullPipelineMixedStrategies:
             3. Confirm defer record contains only the defer script hash
         """
         scripts = [
-            _asset(JS_BLOCKING, ""),
-            _asset(JS_DEFER, "defer"),
+            _SCRIPTS[""],
+            _SCRIPTS["defer"],
         ]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
@@ -127,10 +247,10 @@ class TestFullPipelineMixedStrategies:
         ):
             build_page_assets(wagtail_page)
 
-        blocking_asset = PublishedAsset.objects.get(
+        blocking_asset = PublishedAsset.objects.only(*_ASSET_FIELDS).get(
             page=wagtail_page, asset_type="js", loading=""
         )
-        defer_asset = PublishedAsset.objects.get(
+        defer_asset = PublishedAsset.objects.only(*_ASSET_FIELDS).get(
             page=wagtail_page, asset_type="js", loading="defer"
         )
 
@@ -139,7 +259,6 @@ class TestFullPipelineMixedStrategies:
         assert compute_content_hash(JS_DEFER) in defer_asset.content_hashes
         assert compute_content_hash(JS_BLOCKING) not in defer_asset.content_hashes
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_loading_suffix_in_filename(self, wagtail_page):
         """Non-empty loading strategy is included as filename suffix.
 
@@ -156,8 +275,8 @@ class TestFullPipelineMixedStrategies:
             3. Confirm defer record URL contains the "-defer" suffix
         """
         scripts = [
-            _asset(JS_BLOCKING, ""),
-            _asset(JS_DEFER, "defer"),
+            _SCRIPTS[""],
+            _SCRIPTS["defer"],
         ]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
@@ -165,10 +284,10 @@ class TestFullPipelineMixedStrategies:
         ):
             build_page_assets(wagtail_page)
 
-        blocking_asset = PublishedAsset.objects.get(
+        blocking_asset = PublishedAsset.objects.only(*_ASSET_FIELDS).get(
             page=wagtail_page, asset_type="js", loading=""
         )
-        defer_asset = PublishedAsset.objects.get(
+        defer_asset = PublishedAsset.objects.only(*_ASSET_FIELDS).get(
             page=wagtail_page, asset_type="js", loading="defer"
         )
 
@@ -176,7 +295,6 @@ class TestFullPipelineMixedStrategies:
         assert "-defer" in defer_asset.url
         assert defer_asset.url.endswith(".js")
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_multiple_scripts_same_strategy_merged(self, wagtail_page):
         """Multiple scripts with the same loading strategy are merged into one record.
 
@@ -206,9 +324,10 @@ class TestFullPipelineMixedStrategies:
             build_page_assets(wagtail_page)
 
         js_assets = PublishedAsset.objects.filter(page=wagtail_page, asset_type="js")
-        assert js_assets.count() == 1
+        js_pks = list(js_assets.values_list("pk", flat=True))
+        assert len(js_pks) == 1
 
-        asset = js_assets.first()
+        asset = js_assets.only(*_ASSET_FIELDS).get(pk=js_pks[0])
         assert asset.loading == "defer"
         assert compute_content_hash(defer_a) in asset.content_hashes
         assert compute_content_hash(defer_b) in asset.content_hashes
@@ -218,8 +337,9 @@ class TestFullPipelineMixedStrategies:
 class TestMiddlewareScriptInjection:
     """Middleware strips inline scripts and injects <script> tags with correct attributes."""
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_defer_script_injected_with_defer_attribute(self, wagtail_page):
+    def test_defer_script_injected_with_defer_attribute(
+        self, wagtail_page, django_assert_num_queries
+    ):
         """Middleware injects <script defer> for defer-loaded assets.
 
         Purpose: Verify that after a defer script is saved as a PublishedAsset,
@@ -234,24 +354,23 @@ class TestMiddlewareScriptInjection:
             2. Run _process_html to transform the HTML
             3. Confirm the output HTML contains a <script src="..." defer> tag
         """
-        scripts = [_asset(JS_DEFER, "defer")]
+        scripts = [_SCRIPTS["defer"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
         ):
             build_page_assets(wagtail_page)
 
-        invalidate_cache(wagtail_page.pk)
-        assets = _get_published_assets(wagtail_page.pk)
+        assets = _assets_for(wagtail_page, django_assert_num_queries)
 
-        html = "<html><head></head><body><p>hello</p></body></html>"
-        result = _process_html(html, assets)
+        result = _process_html(_BASIC_HTML, assets)
 
         assert " defer>" in result
         assert "</body>" in result
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_async_script_injected_with_async_attribute(self, wagtail_page):
+    def test_async_script_injected_with_async_attribute(
+        self, wagtail_page, django_assert_num_queries
+    ):
         """Middleware injects <script async> for async-loaded assets.
 
         Purpose: Verify that after an async script is saved as a PublishedAsset,
@@ -266,24 +385,23 @@ class TestMiddlewareScriptInjection:
             2. Run _process_html to transform the HTML
             3. Confirm the output HTML contains a <script src="..." async> tag
         """
-        scripts = [_asset(JS_ASYNC, "async")]
+        scripts = [_SCRIPTS["async"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
         ):
             build_page_assets(wagtail_page)
 
-        invalidate_cache(wagtail_page.pk)
-        assets = _get_published_assets(wagtail_page.pk)
+        assets = _assets_for(wagtail_page, django_assert_num_queries)
 
-        html = "<html><head></head><body><p>hello</p></body></html>"
-        result = _process_html(html, assets)
+        result = _process_html(_BASIC_HTML, assets)
 
         assert " async>" in result
         assert "</body>" in result
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_module_script_injected_with_type_module(self, wagtail_page):
+    def test_module_script_injected_with_type_module(
+        self, wagtail_page, django_assert_num_queries
+    ):
         """Middleware injects <script type="module"> for module-loaded assets.
 
         Purpose: Verify that after a module script is saved as a PublishedAsset,
@@ -298,24 +416,23 @@ class TestMiddlewareScriptInjection:
             2. Run _process_html to transform the HTML
             3. Confirm the output HTML contains a <script src="..." type="module"> tag
         """
-        scripts = [_asset(JS_MODULE, "module")]
+        scripts = [_SCRIPTS["module"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
         ):
             build_page_assets(wagtail_page)
 
-        invalidate_cache(wagtail_page.pk)
-        assets = _get_published_assets(wagtail_page.pk)
+        assets = _assets_for(wagtail_page, django_assert_num_queries)
 
-        html = "<html><head></head><body><p>hello</p></body></html>"
-        result = _process_html(html, assets)
+        result = _process_html(_BASIC_HTML, assets)
 
         assert 'type="module"' in result
         assert " async>" not in result
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_module_async_script_injected_with_type_module_async(self, wagtail_page):
+    def test_module_async_script_injected_with_type_module_async(
+        self, wagtail_page, django_assert_num_queries
+    ):
         """Middleware injects <script type="module" async> for module-async assets.
 
         Purpose: Verify that after a module-async script is saved as a PublishedAsset,
@@ -330,23 +447,22 @@ class TestMiddlewareScriptInjection:
             2. Run _process_html to transform the HTML
             3. Confirm the output HTML contains both type="module" and async attributes
         """
-        scripts = [_asset(JS_MODULE_ASYNC, "module-async")]
+        scripts = [_SCRIPTS["module-async"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
         ):
             build_page_assets(wagtail_page)
 
-        invalidate_cache(wagtail_page.pk)
-        assets = _get_published_assets(wagtail_page.pk)
+        assets = _assets_for(wagtail_page, django_assert_num_queries)
 
-        html = "<html><head></head><body><p>hello</p></body></html>"
-        result = _process_html(html, assets)
+        result = _process_html(_BASIC_HTML, assets)
 
         assert 'type="module" async>' in result
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_blocking_script_injected_without_extra_attributes(self, wagtail_page):
+    def test_blocking_script_injected_without_extra_attributes(
+        self, wagtail_page, django_assert_num_queries
+    ):
         """Middleware injects plain <script> without extra attributes for blocking assets.
 
         Purpose: Verify that after a blocking (loading="") script is saved as a
@@ -362,27 +478,26 @@ class TestMiddlewareScriptInjection:
             2. Run _process_html to transform the HTML
             3. Confirm the output script tag has no defer/async/type attributes
         """
-        scripts = [_asset(JS_BLOCKING, "")]
+        scripts = [_SCRIPTS[""]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
         ):
             build_page_assets(wagtail_page)
 
-        invalidate_cache(wagtail_page.pk)
-        assets = _get_published_assets(wagtail_page.pk)
+        assets = _assets_for(wagtail_page, django_assert_num_queries)
 
-        html = "<html><head></head><body><p>hello</p></body></html>"
-        result = _process_html(html, assets)
+        result = _process_html(_BASIC_HTML, assets)
 
-        js_asset = PublishedAsset.objects.get(
+        js_asset = PublishedAsset.objects.only(*_ASSET_FIELDS).get(
             page=wagtail_page, asset_type="js", loading=""
         )
         expected_tag = f'<script src="{js_asset.url}"></script>'
         assert expected_tag in result
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_mixed_strategies_injection_order(self, wagtail_page):
+    def test_mixed_strategies_injection_order(
+        self, wagtail_page, django_assert_num_queries
+    ):
         """Script tags are injected in the defined order: blocking, defer, module, async, module-async.
 
         Purpose: Verify that when multiple loading strategies are present,
@@ -399,11 +514,11 @@ class TestMiddlewareScriptInjection:
             3. Confirm the script tag order in the output follows the defined order
         """
         scripts = [
-            _asset(JS_BLOCKING, ""),
-            _asset(JS_DEFER, "defer"),
-            _asset(JS_ASYNC, "async"),
-            _asset(JS_MODULE, "module"),
-            _asset(JS_MODULE_ASYNC, "module-async"),
+            _SCRIPTS[""],
+            _SCRIPTS["defer"],
+            _SCRIPTS["async"],
+            _SCRIPTS["module"],
+            _SCRIPTS["module-async"],
         ]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
@@ -411,22 +526,18 @@ class TestMiddlewareScriptInjection:
         ):
             build_page_assets(wagtail_page)
 
-        invalidate_cache(wagtail_page.pk)
-        assets = _get_published_assets(wagtail_page.pk)
-
-        html = "<html><head></head><body><p>hello</p></body></html>"
-        result = _process_html(html, assets)
+        assets = _assets_for(wagtail_page, django_assert_num_queries)
 
-        blocking_pos = result.find("></script>")
-        defer_pos = result.find(" defer>")
-        module_pos = result.find('type="module">')
-        async_pos = result.find(" async>")
-        module_async_pos = result.find('type="module" async>')
+        result = _process_html(_BASIC_HTML, assets)
 
-        assert blocking_pos < defer_pos < module_pos < async_pos < module_async_pos
+        strategies = [
+            _classify_script_tag(m.group()) for m in _SCRIPT_TAG_RE.finditer(result)
+        ]
+        assert strategies == ["", "defer", "module", "async", "module-async"]
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_inline_scripts_stripped_and_external_preserved(self, wagtail_page):
+    def test_inline_scripts_stripped_and_external_preserved(
+        self, wagtail_page, django_assert_num_queries
+    ):
         """Matching inline scripts are stripped; static file references injected before </body>.
 
         Purpose: Verify that the middleware strips inline scripts whose content
@@ -443,23 +554,16 @@ class TestMiddlewareScriptInjection:
             3. Confirm the inline script content is stripped
             4. Confirm an external file reference script tag is injected
         """
-        scripts = [_asset(JS_DEFER, "defer")]
+        scripts = [_SCRIPTS["defer"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
         ):
             build_page_assets(wagtail_page)
 
-        invalidate_cache(wagtail_page.pk)
-        assets = _get_published_assets(wagtail_page.pk)
+        assets = _assets_for(wagtail_page, django_assert_num_queries)
 
-        html = (
-            "<html><head></head><body>"
-            f"<script defer>{JS_DEFER}</script>"
-            "<p>content</p>"
-            "</body></html>"
-        )
-        result = _process_html(html, assets)
+        result = _process_html(_HTML_WITH_INLINE_DEFER, assets)
 
         assert JS_DEFER not in result
         assert "<script src=" in result
@@ -470,7 +574,6 @@ class TestMiddlewareScriptInjection:
 class TestRepublishUpdate:
     """Republishing clears old JS assets and creates new ones correctly."""
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_republish_clears_old_js_assets_and_creates_new(self, wagtail_page):
         """Republishing with different scripts replaces all JS PublishedAsset records.
 
@@ -490,8 +593,8 @@ class TestRepublishUpdate:
             3. Confirm only the loading="async" record exists
         """
         scripts_v1 = [
-            _asset(JS_BLOCKING, ""),
-            _asset(JS_DEFER, "defer"),
+            _SCRIPTS[""],
+            _SCRIPTS["defer"],
         ]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
@@ -499,12 +602,14 @@ class TestRepublishUpdate:
         ):
             build_page_assets(wagtail_page)
 
-        assert (
-            PublishedAsset.objects.filter(page=wagtail_page, asset_type="js").count()
-            == 2
+        js_pks = list(
+            PublishedAsset.objects.filter(
+                page=wagtail_page, asset_type="js"
+            ).values_list("pk", flat=True)
         )
+        assert len(js_pks) == 2
 
-        scripts_v2 = [_asset(JS_ASYNC, "async")]
+        scripts_v2 = [_SCRIPTS["async"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts_v2),
@@ -512,10 +617,8 @@ class TestRepublishUpdate:
             build_page_assets(wagtail_page)
 
         js_assets = PublishedAsset.objects.filter(page=wagtail_page, asset_type="js")
-        assert js_assets.count() == 1
-        assert js_assets.first().loading == "async"
+        assert list(js_assets.values_list("loading", flat=True)) == ["async"]
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_republish_with_no_js_clears_all_js_records(self, wagtail_page):
         """Republishing with no scripts removes all JS PublishedAsset records.
 
@@ -533,8 +636,8 @@ class TestRepublishUpdate:
             2. Rebuild with no scripts -> all records deleted
         """
         scripts = [
-            _asset(JS_DEFER, "defer"),
-            _asset(JS_MODULE, "module"),
+            _SCRIPTS["defer"],
+            _SCRIPTS["module"],
         ]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
@@ -542,10 +645,12 @@ class TestRepublishUpdate:
         ):
             build_page_assets(wagtail_page)
 
-        assert (
-            PublishedAsset.objects.filter(page=wagtail_page, asset_type="js").count()
-            == 2
+        js_pks = list(
+            PublishedAsset.objects.filter(
+                page=wagtail_page, asset_type="js"
+            ).values_list("pk", flat=True)
         )
+        assert len(js_pks) == 2
 
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
@@ -553,12 +658,10 @@ class TestRepublishUpdate:
         ):
             build_page_assets(wagtail_page)
 
-        assert (
-            PublishedAsset.objects.filter(page=wagtail_page, asset_type="js").count()
-            == 0
-        )
+        assert not PublishedAsset.objects.filter(
+            page=wagtail_page, asset_type="js"
+        ).exists()
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_republish_preserves_css_when_only_js_changes(self, wagtail_page):
         """CSS asset is preserved when only JS content changes on republish.
 
@@ -580,35 +683,41 @@ class TestRepublishUpdate:
             content_hash=compute_content_hash("body { color: red; }"),
         )
 
-        scripts_v1 = [_asset(JS_DEFER, "defer")]
+        scripts_v1 = [_SCRIPTS["defer"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([css_asset], scripts_v1),
         ):
             build_page_assets(wagtail_page)
 
-        css_url_v1 = PublishedAsset.objects.get(page=wagtail_page, asset_type="css").url
+        css_url_v1 = (
+            PublishedAsset.objects.only(*_ASSET_FIELDS)
+            .get(page=wagtail_page, asset_type="css")
+            .url
+        )
 
-        scripts_v2 = [_asset(JS_ASYNC, "async")]
+        scripts_v2 = [_SCRIPTS["async"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([css_asset], scripts_v2),
         ):
             build_page_assets(wagtail_page)
 
-        css_url_v2 = PublishedAsset.objects.get(page=wagtail_page, asset_type="css").url
+        css_url_v2 = (
+            PublishedAsset.objects.only(*_ASSET_FIELDS)
+            .get(page=wagtail_page, asset_type="css")
+            .url
+        )
         assert css_url_v1 == css_url_v2
 
         js_assets = PublishedAsset.objects.filter(page=wagtail_page, asset_type="js")
-        assert js_assets.count() == 1
-        assert js_assets.first().loading == "async"
+        assert list(js_assets.values_list("loading", flat=True)) == ["async"]
 
 
 @pytest.mark.django_db
 class TestNonJsTypeExclusion:
     """Non-JS script types (importmap, speculationrules) are not extracted."""
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_importmap_not_extracted_stays_inline(self, wagtail_page):
         """Scripts with type="importmap" are skipped by extraction and stay inline.
 
@@ -642,8 +751,35 @@ class TestNonJsTypeExclusion:
             page=wagtail_page, asset_type="js"
         ).exists()
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_speculationrules_not_extracted(self, wagtail_page):
+    def test_importmap_alongside_normal_js_builds_only_normal(self, wagtail_page):
+        """When importmap and normal JS coexist, only normal JS is built.
+
+        Purpose: Verify that when only the normal JS survives extraction next
+            to an importmap, build_page_assets records only that script.
+        Category: Normal case
+        Target: build_page_assets -> PublishedAsset
+        Technique: Model lifecycle
+        Integration targets: build_page_assets -> PublishedAsset
+        Test data: The defer script extracted from importmap + defer HTML
+        Verification scenario:
+            1. Inject the defer script as the extraction result and build
+            2. Confirm build_page_assets creates only a defer JS PublishedAsset
+        """
+        extracted_scripts = [_SCRIPTS["defer"]]
+        with mock.patch(
+            "wagtail_asset_publisher.utils.extract_assets_from_page",
+            return_value=([], extracted_scripts),
+        ):
+            build_page_assets(wagtail_page)
+
+        js_assets = PublishedAsset.objects.filter(page=wagtail_page, asset_type="js")
+        assert list(js_assets.values_list("loading", flat=True)) == ["defer"]
+
+
+class TestExtractionOnly:
+    """Extraction-only checks for non-JS script types; no database access."""
+
+    def test_speculationrules_not_extracted(self):
         """Scripts with type="speculationrules" are skipped by extraction.
 
         Purpose: Verify that script tags with type="speculationrules" are
@@ -667,22 +803,20 @@ class TestNonJsTypeExclusion:
         _, scripts = extract_assets(speculation_html)
         assert len(scripts) == 0
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_importmap_alongside_normal_js_only_normal_extracted(self, wagtail_page):
+    def test_importmap_alongside_normal_js_only_normal_extracted(self):
         """When importmap and normal JS coexist, only normal JS is extracted.
 
         Purpose: Verify that when importmap and normal JS scripts coexist on a
-            page, only the normal JS is extracted and built, while the importmap
-            stays inline.
+            page, only the normal JS is extracted, while the importmap stays
+            inline.
         Category: Normal case
-        Target: extract_assets -> build_page_assets -> PublishedAsset
-        Technique: Model lifecycle
-        Integration targets: extract_assets -> build_page_assets -> PublishedAsset
+        Target: extract_assets -> _resolve_loading_strategy
+        Technique: API endpoint
+        Integration targets: extract_assets -> _resolve_loading_strategy
         Test data: One type="importmap" script and one normal defer script
         Verification scenario:
             1. Run extraction on HTML with importmap + defer script
             2. Confirm only the defer script is extracted
-            3. Confirm build_page_assets creates only a defer JS PublishedAsset
         """
         from wagtail_asset_publisher.extractors import extract_assets
 
@@ -694,23 +828,11 @@ class TestNonJsTypeExclusion:
         assert len(scripts) == 1
         assert scripts[0].loading == "defer"
 
-        extracted_scripts = [_asset(JS_DEFER, "defer")]
-        with mock.patch(
-            "wagtail_asset_publisher.utils.extract_assets_from_page",
-            return_value=([], extracted_scripts),
-        ):
-            build_page_assets(wagtail_page)
-
-        js_assets = PublishedAsset.objects.filter(page=wagtail_page, asset_type="js")
-        assert js_assets.count() == 1
-        assert js_assets.first().loading == "defer"
-
 
 @pytest.mark.django_db
 class TestBackwardCompatibility:
     """Pages with only plain <script> tags (no defer/async) work as before."""
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_plain_scripts_create_single_blocking_record(self, wagtail_page):
         """Plain scripts without defer/async create a single PublishedAsset with loading="".
 
@@ -740,11 +862,11 @@ class TestBackwardCompatibility:
             build_page_assets(wagtail_page)
 
         js_assets = PublishedAsset.objects.filter(page=wagtail_page, asset_type="js")
-        assert js_assets.count() == 1
-        assert js_assets.first().loading == ""
+        assert list(js_assets.values_list("loading", flat=True)) == [""]
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_plain_script_middleware_injects_plain_tag(self, wagtail_page):
+    def test_plain_script_middleware_injects_plain_tag(
+        self, wagtail_page, django_assert_num_queries
+    ):
         """Middleware injects <script src="..."></script> without extra attributes for plain scripts.
 
         Purpose: Verify that for plain blocking scripts, the middleware injects
@@ -760,58 +882,60 @@ class TestBackwardCompatibility:
             2. Run _process_html to transform the HTML
             3. Confirm the script tag has no defer/async/type attributes
         """
-        scripts = [_asset(JS_BLOCKING, "")]
+        scripts = [_SCRIPTS[""]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
         ):
             build_page_assets(wagtail_page)
 
-        invalidate_cache(wagtail_page.pk)
-        assets = _get_published_assets(wagtail_page.pk)
+        assets = _assets_for(wagtail_page, django_assert_num_queries)
 
-        html = "<html><head></head><body><p>hello</p></body></html>"
-        result = _process_html(html, assets)
+        result = _process_html(_BASIC_HTML, assets)
 
         assert "<script src=" in result
         assert " defer>" not in result
         assert " async>" not in result
         assert 'type="module"' not in result
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
     def test_idempotent_rebuild_plain_scripts(self, wagtail_page):
         """Rebuilding with the same plain scripts does not create duplicate records.
 
         Purpose: Verify that building twice with the same plain scripts does not
             create duplicate PublishedAsset records, ensuring idempotency.
         Category: Idempotency
-        Target: build_page_assets -> update_or_create -> PublishedAsset
+        Target: build_page_assets -> bulk_create -> PublishedAsset
         Technique: Model lifecycle
-        Integration targets: build_page_assets -> update_or_create -> PublishedAsset
+        Integration targets: build_page_assets -> bulk_create -> PublishedAsset
         Test data: One plain script built twice
         Verification scenario:
             1. Execute first build with a plain script
             2. Execute second build with the same plain script
             3. Confirm only one JS PublishedAsset record exists
+            4. Confirm the JS record URL is unchanged
         """
-        scripts = [_asset(JS_BLOCKING, "")]
+        scripts = [_SCRIPTS[""]]
+        js_assets = PublishedAsset.objects.filter(page=wagtail_page, asset_type="js")
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
         ):
             build_page_assets(wagtail_page)
+            urls_before = list(js_assets.values_list("url", flat=True))
             build_page_assets(wagtail_page)
 
-        js_assets = PublishedAsset.objects.filter(page=wagtail_page, asset_type="js")
-        assert js_assets.count() == 1
+        urls_after = list(js_assets.values_list("url", flat=True))
+        assert len(urls_after) == 1
+        assert urls_after == urls_before
 
 
 @pytest.mark.django_db
 class TestMiddlewareRoundTrip:
     """Full middleware round-trip: request → response with injected scripts."""
 
-    @override_settings(WAGTAIL_ASSET_PUBLISHER=SETTINGS_BASE)
-    def test_middleware_full_roundtrip_with_defer(self, wagtail_page):
+    def test_middleware_full_roundtrip_with_defer(
+        self, shared_rf, middleware, wagtail_page, django_assert_num_queries
+    ):
         """Full middleware round-trip injects defer script tag into HTML response.
 
         Purpose: Verify that a full round-trip through AssetPublisherMiddleware
@@ -829,7 +953,7 @@ class TestMiddlewareRoundTrip:
             2. Pass the request with wagtailpage attribute through the middleware
             3. Confirm the response HTML contains a script tag with the defer attribute
         """
-        scripts = [_asset(JS_DEFER, "defer")]
+        scripts = [_SCRIPTS["defer"]]
         with mock.patch(
             "wagtail_asset_publisher.utils.extract_assets_from_page",
             return_value=([], scripts),
@@ -838,24 +962,50 @@ class TestMiddlewareRoundTrip:
 
         invalidate_cache(wagtail_page.pk)
 
-        from django.http import HttpResponse
-
-        request = RequestFactory().get("/test-page/")
+        request = shared_rf.get("/test-page/")
         request.wagtailpage = wagtail_page
 
-        response_html = (
-            "<html><head><title>Test</title></head><body><p>content</p></body></html>"
-        )
-        inner_response = HttpResponse(
-            response_html, content_type="text/html; charset=utf-8"
-        )
-
-        def get_response(req):
-            return inner_response
-
-        middleware = AssetPublisherMiddleware(get_response)
-        result = middleware(request)
+        with django_assert_num_queries(1):
+            result = middleware(request)
 
         content = result.content.decode("utf-8")
         assert "<script src=" in content
         assert " defer>" in content
+
+
+@pytest.mark.django_db
+class TestMiddlewareBenchmark:
+    """Timing harness for the middleware across growing script counts."""
+
+    def test_middleware_call(self, benchmark, shared_rf, wagtail_page, mock_assets):
+        """Time AssetPublisherMiddleware.__call__ on a page with N inline scripts.
+
+        Purpose: Provide a repeatable measurement of the request-time cost
+            of stripping inline scripts and injecting the published ones.
+        Category: Performance
+        Target: AssetPublisherMiddleware.__call__(request)
+        Technique: Benchmark (pytest-benchmark)
+        Integration targets: build_page_assets -> AssetPublisherMiddleware.__call__
+        Test data:
+            - 1, 10, 100 and 1000 scripts spread over all loading strategies
+            - HTML response containing every script inline
+        Verification scenario:
+            1. Build the page's assets from the patched extraction
+            2. Benchmark the middleware on a response embedding all scripts
+            3. Confirm every inline script was stripped from the output
+        """
+        build_page_assets(wagtail_page)
+
+        inline = "".join(f"<script>{s.content}</script>" for s in mock_assets)
+        html = _BASIC_HTML.replace("<p>", f"{inline}<p>", 1)
+        middleware = AssetPublisherMiddleware(
+            lambda request: HttpResponse(html, content_type="text/html; charset=utf-8")
+        )
+        request = shared_rf.get("/test-page/")
+        request.wagtailpage = wagtail_page
+
+        result = benchmark(middleware, request)
+
+        content = result.content.decode("utf-8")
+        assert "<script>" not in content
+        assert content.count("<script src=") == min(len(mock_assets), len(_LOADINGS))
@@ -26,8 +26,11 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
@@ -37,43 +40,89 @@ from wagtail_asset_publisher.builders.tailwind import (
     DEFAULT_TAILWIND_INPUT,
     SAFE_PLUGIN_NAME_RE,
     TailwindCSSBuilder,
+    _detect_cli_path,
 )
 
+_INPUT_FILE = Path("/tmp/input.css")
+_OUTPUT_FILE = Path("/tmp/output.css")
 
-class TestRawAssetBuilder:
-    def test_concatenates_css(self):
-        """RawAssetBuilder joins multiple CSS strings with double newlines (DT1).
 
-        Purpose: Verify that build() concatenates extracted CSS content
-                 with double newlines as separator.
-        Category: Normal case
-        Target: RawAssetBuilder.build(html_content, extracted_content, asset_type)
-        Technique: Equivalence partitioning
-        Test data: Two CSS rule blocks
-        """
-        builder = RawAssetBuilder()
+@pytest.fixture(scope="module")
+def raw_builder():
+    """Shared RawAssetBuilder; builders hold no per-build state."""
+    return RawAssetBuilder()
+
+
+@pytest.fixture(scope="module")
+def tailwind_builder():
+    """Shared TailwindCSSBuilder; builders hold no per-build state.
+
+    Tests that stub a method by plain attribute assignment use their own
+    instance instead, since nothing would undo the stub on this one.
+    """
+    return TailwindCSSBuilder()
+
+
+@pytest.fixture
+def set_setting(monkeypatch):
+    """Swap the Tailwind builder's ``get_setting`` for the test's duration.
+
+    ``set_setting(value)`` answers every key with *value*;
+    ``set_setting(KEY=value, ...)`` answers per key, ``None`` for the rest.
+    """
+
+    def _set(value=None, /, **settings):
+        if settings:
+            getter = lambda key, *args: settings.get(key)  # noqa: E731
+        else:
+            getter = lambda *args: value  # noqa: E731
+        monkeypatch.setattr(
+            "wagtail_asset_publisher.builders.tailwind.get_setting", getter
+        )
+
+    return _set
+
 
-        result = builder.build(None, ["a{}", "b{}"], "css")
+@pytest.fixture
+def stub_module(monkeypatch):
+    """Install a stand-in for one ``sys.modules`` entry for the test's duration.
 
-        assert result == "a{}\n\nb{}"
+    Only the patched key is restored on teardown, not the whole dict.
+    """
+
+    def _stub(name, module):
+        monkeypatch.setitem(sys.modules, name, module)
+
+    return _stub
 
-    def test_concatenates_js(self):
-        """RawAssetBuilder joins multiple JS strings with double newlines (DT2).
 
-        Purpose: Verify that build() concatenates extracted JS content
-                 with double newlines as separator.
+class TestRawAssetBuilder:
+    @pytest.mark.parametrize(
+        ("extracted", "asset_type", "expected"),
+        [
+            pytest.param(["a{}", "b{}"], "css", "a{}\n\nb{}", id="DT1-css"),
+            pytest.param(
+                ["alert(1)", "alert(2)"], "js", "alert(1)\n\nalert(2)", id="DT2-js"
+            ),
+            pytest.param(["single"], "css", "single", id="DT4-single-item"),
+        ],
+    )
+    def test_concatenates_content(self, raw_builder, extracted, asset_type, expected):
+        """RawAssetBuilder joins extracted content with double newlines.
+
+        Purpose: Verify that build() concatenates extracted CSS or JS
+                 content with double newlines as separator, and returns a
+                 single item as-is without any separator.
         Category: Normal case
         Target: RawAssetBuilder.build(html_content, extracted_content, asset_type)
-        Technique: Equivalence partitioning
-        Test data: Two JS statements
+        Technique: Decision table (DT1, DT2, DT4)
+        Test data: Two CSS rule blocks, two JS statements, one item
         """
-        builder = RawAssetBuilder()
+        result = raw_builder.build(None, extracted, asset_type)
 
-        result = builder.build(None, ["alert(1)", "alert(2)"], "js")
-
-        assert result == "alert(1)\n\nalert(2)"
+        assert result == expected
 
-    def test_empty_content_returns_empty(self):
+    def test_empty_content_returns_empty(self, raw_builder):
         """RawAssetBuilder returns empty string for empty list (DT3).
 
         Purpose: Verify that build() returns empty string when
@@ -83,29 +132,25 @@ class TestRawAssetBuilder:
         Technique: Boundary value analysis (empty input)
         Test data: Empty list
         """
-        builder = RawAssetBuilder()
-
-        result = builder.build(None, [], "css")
+        result = raw_builder.build(None, [], "css")
 
         assert result == ""
 
-    def test_single_item_returned_as_is(self):
-        """RawAssetBuilder returns single item without separator (DT4).
+    def test_single_item_short_circuit(self, raw_builder):
+        """A single extracted item is returned without building a new string.
 
-        Purpose: Verify that build() returns a single item as-is
-                 without adding any separator.
-        Category: Normal case
+        Purpose: Verify that build() hands back the very same object for a
+                 one-element list instead of going through str.join.
+        Category: Boundary value
         Target: RawAssetBuilder.build(html_content, extracted_content, asset_type)
         Technique: Boundary value analysis (single element)
-        Test data: List with one item
+        Test data: List with one dynamically built item
         """
-        builder = RawAssetBuilder()
+        item = "".join(["a{", "}"])
 
-        result = builder.build(None, ["single"], "css")
+        assert raw_builder.build(None, [item], "css") is item
 
-        assert result == "single"
-
-    def test_ignores_html_content(self):
+    def test_ignores_html_content(self, raw_builder):
         """RawAssetBuilder ignores html_content parameter (DT5).
 
         Purpose: Verify that html_content is not used by RawAssetBuilder
@@ -115,14 +160,12 @@ class TestRawAssetBuilder:
         Technique: Equivalence partitioning
         Test data: Non-None html_content with extracted_content
         """
-        builder = RawAssetBuilder()
-
-        result_with_html = builder.build("<html>content</html>", ["a{}"], "css")
-        result_without_html = builder.build(None, ["a{}"], "css")
+        result_with_html = raw_builder.build("<html>content</html>", ["a{}"], "css")
+        result_without_html = raw_builder.build(None, ["a{}"], "css")
 
         assert result_with_html == result_without_html == "a{}"
 
-    def test_requires_html_content_is_false(self):
+    def test_requires_html_content_is_false(self, raw_builder):
         """RawAssetBuilder.requires_html_content defaults to False.
 
         Purpose: Verify that RawAssetBuilder does not request HTML content
@@ -132,13 +175,11 @@ class TestRawAssetBuilder:
         Technique: Equivalence partitioning
         Test data: N/A
         """
-        builder = RawAssetBuilder()
-
-        assert builder.requires_html_content is False
+        assert raw_builder.requires_html_content is False
 
 
 class TestTailwindCSSBuilder:
-    def test_requires_html_content_is_true(self):
+    def test_requires_html_content_is_true(self, tailwind_builder):
         """TailwindCSSBuilder.requires_html_content is True.
 
         Purpose: Verify that TailwindCSSBuilder declares it needs HTML
@@ -148,11 +189,9 @@ class TestTailwindCSSBuilder:
         Technique: Equivalence partitioning
         Test data: N/A
         """
-        builder = TailwindCSSBuilder()
-
-        assert builder.requires_html_content is True
+        assert tailwind_builder.requires_html_content is True
 
-    def test_non_css_falls_back_to_raw(self):
+    def test_non_css_falls_back_to_raw(self, tailwind_builder):
         """For non-CSS asset types, TailwindCSSBuilder concatenates like raw (DT6).
 
         Purpose: Verify that build() with asset_type="js" falls back to
@@ -162,13 +201,11 @@ class TestTailwindCSSBuilder:
         Technique: Equivalence partitioning
         Test data: JS content with asset_type="js"
         """
-        builder = TailwindCSSBuilder()
-
-        result = builder.build(None, ["alert(1)", "alert(2)"], "js")
+        result = tailwind_builder.build(None, ["alert(1)", "alert(2)"], "js")
 
         assert result == "alert(1)\n\nalert(2)"
 
-    def test_non_css_empty_returns_empty(self):
+    def test_non_css_empty_returns_empty(self, tailwind_builder):
         """For non-CSS asset types with empty content, returns empty string.
 
         Purpose: Verify that build() with asset_type="js" and empty list
@@ -178,13 +215,11 @@ class TestTailwindCSSBuilder:
         Technique: Boundary value analysis
         Test data: Empty list with asset_type="js"
         """
-        builder = TailwindCSSBuilder()
-
-        result = builder.build(None, [], "js")
+        result = tailwind_builder.build(None, [], "js")
 
         assert result == ""
 
-    def test_empty_inputs_returns_empty(self):
+    def test_empty_inputs_returns_empty(self, tailwind_builder):
         """No HTML and no extracted content returns empty string (DT7).
 
         Purpose: Verify that build() returns empty string when both
@@ -194,13 +229,11 @@ class TestTailwindCSSBuilder:
         Technique: Boundary value analysis (all empty)
         Test data: None html_content and empty list
         """
-        builder = TailwindCSSBuilder()
-
-        result = builder.build(None, [], "css")
+        result = tailwind_builder.build(None, [], "css")
 
         assert result == ""
 
-    def test_empty_html_and_empty_extracted_returns_empty(self):
+    def test_empty_html_and_empty_extracted_returns_empty(self, tailwind_builder):
         """Empty string HTML and empty extracted returns empty string.
 
         Purpose: Verify that build() returns empty when html_content
@@ -210,12 +243,27 @@ class TestTailwindCSSBuilder:
         Technique: Boundary value analysis
         Test data: Empty string html_content
         """
-        builder = TailwindCSSBuilder()
-
-        result = builder.build("", [], "css")
+        result = tailwind_builder.build("", [], "css")
 
         assert result == ""
 
+    @pytest.mark.parametrize("html_content", [None, ""], ids=["none", "empty"])
+    def test_empty_inputs_skip_cli(self, html_content):
+        """Empty inputs return before any CLI lookup or file I/O.
+
+        Purpose: Verify that build() short-circuits the no-op case without
+                 resolving the CLI path or running Tailwind.
+        Category: Edge case
+        Target: TailwindCSSBuilder.build(html_content, [], "css")
+        Technique: Boundary value analysis (all empty)
+        Test data: None and empty string html_content, no extracted content
+        """
+        builder = TailwindCSSBuilder()
+        builder._get_cli_path = mock.Mock(side_effect=AssertionError)
+        builder._run_tailwind = mock.Mock(side_effect=AssertionError)
+
+        assert builder.build(html_content, [], "css") == ""
+
     def test_runs_tailwind_cli(self):
         """build() runs Tailwind CLI via _run_tailwind (DT8).
 
@@ -227,15 +275,15 @@ class TestTailwindCSSBuilder:
         Test data: HTML content with Tailwind classes
         """
         builder = TailwindCSSBuilder()
+        builder._run_tailwind = mock_run = mock.Mock(
+            return_value=".bg-red-500{background:red}"
+        )
 
-        with mock.patch.object(
-            builder, "_run_tailwind", return_value=".bg-red-500{background:red}"
-        ) as mock_run:
-            result = builder.build(
-                "<div class='bg-red-500'>test</div>",
-                [".custom { color: red; }"],
-                "css",
-            )
+        result = builder.build(
+            "<div class='bg-red-500'>test</div>",
+            [".custom { color: red; }"],
+            "css",
+        )
 
         assert result == ".bg-red-500{background:red}"
         mock_run.assert_called_once_with(
@@ -243,74 +291,46 @@ class TestTailwindCSSBuilder:
             ".custom { color: red; }",
         )
 
-    def test_fallback_on_file_not_found_error(self):
-        """FileNotFoundError falls back to extracted CSS (DT9).
-
-        Purpose: Verify that when Tailwind CLI binary is not found,
-                 build() falls back to returning stripped custom CSS.
-        Category: Error case
-        Target: TailwindCSSBuilder.build(html_content, extracted_content, "css")
-        Technique: Error guessing
-        Test data: FileNotFoundError from _run_tailwind
-        """
-        builder = TailwindCSSBuilder()
-
-        with mock.patch.object(
-            builder, "_run_tailwind", side_effect=FileNotFoundError("not found")
-        ):
-            result = builder.build(
-                "<div>test</div>",
-                [".fallback { color: blue; }"],
-                "css",
-            )
-
-        assert result == ".fallback { color: blue; }"
-
-    def test_fallback_on_subprocess_error(self):
-        """SubprocessError falls back to extracted CSS.
-
-        Purpose: Verify that when Tailwind CLI fails with SubprocessError,
-                 build() returns stripped custom CSS as fallback.
-        Category: Error case
-        Target: TailwindCSSBuilder.build(html_content, extracted_content, "css")
-        Technique: Error guessing
-        Test data: SubprocessError from _run_tailwind
-        """
-        builder = TailwindCSSBuilder()
-
-        with mock.patch.object(
-            builder, "_run_tailwind", side_effect=subprocess.SubprocessError("failed")
-        ):
-            result = builder.build(
-                "<div>test</div>",
-                [" .fallback { color: green; } "],
-                "css",
-            )
-
-        assert result == ".fallback { color: green; }"
-
-    def test_fallback_on_os_error(self):
-        """OSError falls back to extracted CSS.
+    @pytest.mark.parametrize(
+        ("error", "extracted", "expected"),
+        [
+            pytest.param(
+                FileNotFoundError("not found"),
+                ".fallback { color: blue; }",
+                ".fallback { color: blue; }",
+                id="DT9-file-not-found",
+            ),
+            pytest.param(
+                subprocess.SubprocessError("failed"),
+                " .fallback { color: green; } ",
+                ".fallback { color: green; }",
+                id="DT9-subprocess-error",
+            ),
+            pytest.param(
+                OSError("permission denied"),
+                ".fallback { color: yellow; }",
+                ".fallback { color: yellow; }",
+                id="DT9-os-error",
+            ),
+        ],
+    )
+    def test_fallback_on_cli_error(self, error, extracted, expected):
+        """CLI errors fall back to the stripped extracted CSS (DT9).
 
-        Purpose: Verify that OSError (e.g., permission denied) triggers
-                 fallback to extracted CSS content.
+        Purpose: Verify that when the Tailwind CLI is missing, fails, or
+                 cannot be executed, build() returns the stripped custom CSS.
         Category: Error case
         Target: TailwindCSSBuilder.build(html_content, extracted_content, "css")
         Technique: Error guessing
-        Test data: OSError from _run_tailwind
+        Test data: FileNotFoundError, SubprocessError and OSError from
+                   _run_tailwind
         """
         builder = TailwindCSSBuilder()
+        builder._run_tailwind = mock.Mock(side_effect=error)
 
-        with mock.patch.object(
-            builder, "_run_tailwind", side_effect=OSError("permission denied")
-        ):
-            result = builder.build(
-                "<div>test</div>",
-                [".fallback { color: yellow; }"],
-                "css",
-            )
+        result = builder.build("<div>test</div>", [extracted], "css")
 
-        assert result == ".fallback { color: yellow; }"
+        assert result == expected
 
     def test_fallback_with_no_custom_css_returns_empty(self):
         """Error fallback with no custom CSS returns empty string.
@@ -323,17 +343,21 @@ class TestTailwindCSSBuilder:
         Test data: HTML only, no extracted content, CLI failure
         """
         builder = TailwindCSSBuilder()
+        builder._run_tailwind = mock.Mock(side_effect=FileNotFoundError("not found"))
 
-        with mock.patch.object(
-            builder, "_run_tailwind", side_effect=FileNotFoundError("not found")
-        ):
-            result = builder.build("<div class='text-red'>test</div>", [], "css")
+        result = builder.build("<div class='text-red'>test</div>", [], "css")
 
         assert result == ""
 
 
 class TestTailwindGetCliPath:
-    def test_cli_path_from_settings(self):
+    @pytest.fixture(autouse=True)
+    def _clear_detected_cli_path(self):
+        _detect_cli_path.cache_clear()
+        yield
+        _detect_cli_path.cache_clear()
+
+    def test_cli_path_from_settings(self, tailwind_builder, set_setting):
         """TAILWIND_CLI_PATH setting is used when configured.
 
         Purpose: Verify that _get_cli_path() returns the value from
@@ -343,17 +367,14 @@ class TestTailwindGetCliPath:
         Technique: Equivalence partitioning
         Test data: Configured CLI path
         """
-        builder = TailwindCSSBuilder()
-
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            return_value="/usr/local/bin/tailwindcss",
-        ):
-            result = builder._get_cli_path()
+        set_setting("/usr/local/bin/tailwindcss")
+        result = tailwind_builder._get_cli_path()
 
         assert result == "/usr/local/bin/tailwindcss"
 
-    def test_cli_path_from_django_tailwind_cli(self):
+    def test_cli_path_from_django_tailwind_cli(
+        self, tailwind_builder, set_setting, stub_module
+    ):
         """Auto-detects CLI path from django-tailwind-cli when available.
 
         Purpose: Verify that _get_cli_path() uses django-tailwind-cli's
@@ -363,31 +384,19 @@ class TestTailwindGetCliPath:
         Technique: Equivalence partitioning
         Test data: django-tailwind-cli installed environment
         """
-        builder = TailwindCSSBuilder()
+        config = SimpleNamespace(cli_path=Path("/home/user/.cache/tailwindcss"))
+        mock_config_module = SimpleNamespace(get_config=lambda: config)
 
-        mock_config_obj = mock.MagicMock()
-        mock_config_obj.cli_path = Path("/home/user/.cache/tailwindcss")
-        mock_config_module = mock.MagicMock()
-        mock_config_module.get_config.return_value = mock_config_obj
-
-        with (
-            mock.patch(
-                "wagtail_asset_publisher.builders.tailwind.get_setting",
-                return_value=None,
-            ),
-            mock.patch.dict(
-                "sys.modules",
-                {
-                    "django_tailwind_cli": mock.MagicMock(),
-                    "django_tailwind_cli.config": mock_config_module,
-                },
-            ),
-        ):
-            result = builder._get_cli_path()
+        set_setting(None)
+        stub_module("django_tailwind_cli", SimpleNamespace())
+        stub_module("django_tailwind_cli.config", mock_config_module)
+        result = tailwind_builder._get_cli_path()
 
         assert result == "/home/user/.cache/tailwindcss"
 
-    def test_cli_path_fallback_on_value_error(self):
+    def test_cli_path_fallback_on_value_error(
+        self, tailwind_builder, set_setting, stub_module
+    ):
         """Falls back to 'tailwindcss' when get_config() raises ValueError.
 
         Purpose: Verify that _get_cli_path() catches ValueError from
@@ -398,31 +407,22 @@ class TestTailwindGetCliPath:
         Technique: Error guessing
         Test data: get_config() raising ValueError
         """
-        builder = TailwindCSSBuilder()
 
-        mock_config_module = mock.MagicMock()
-        mock_config_module.get_config.side_effect = ValueError(
-            "STATICFILES_DIRS is not configured"
-        )
+        def get_config():
+            raise ValueError("STATICFILES_DIRS is not configured")
 
-        with (
-            mock.patch(
-                "wagtail_asset_publisher.builders.tailwind.get_setting",
-                return_value=None,
-            ),
-            mock.patch.dict(
-                "sys.modules",
-                {
-                    "django_tailwind_cli": mock.MagicMock(),
-                    "django_tailwind_cli.config": mock_config_module,
-                },
-            ),
-        ):
-            result = builder._get_cli_path()
+        mock_config_module = SimpleNamespace(get_config=get_config)
+
+        set_setting(None)
+        stub_module("django_tailwind_cli", SimpleNamespace())
+        stub_module("django_tailwind_cli.config", mock_config_module)
+        result = tailwind_builder._get_cli_path()
 
         assert result == "tailwindcss"
 
-    def test_cli_path_fallback_to_command_name(self):
+    def test_cli_path_fallback_to_command_name(
+        self, tailwind_builder, set_setting, stub_module
+    ):
         """Falls back to 'tailwindcss' command when no other option available.
 
         Purpose: Verify that _get_cli_path() returns 'tailwindcss' (PATH lookup)
@@ -432,22 +432,38 @@ class TestTailwindGetCliPath:
         Technique: Error guessing
         Test data: No configuration, no django-tailwind-cli
         """
-        builder = TailwindCSSBuilder()
-
-        with (
-            mock.patch(
-                "wagtail_asset_publisher.builders.tailwind.get_setting",
-                return_value=None,
-            ),
-            mock.patch.dict("sys.modules", {"django_tailwind_cli": None}),
-        ):
-            result = builder._get_cli_path()
+        set_setting(None)
+        stub_module("django_tailwind_cli", None)
+        result = tailwind_builder._get_cli_path()
 
         assert result == "tailwindcss"
 
+    def test_detected_cli_path_cached(self, tailwind_builder, set_setting, stub_module):
+        """django-tailwind-cli is consulted only once per process.
+
+        Purpose: Verify that repeated builds reuse the detected CLI path
+                 instead of importing and calling get_config() each time.
+        Category: Normal case
+        Target: TailwindCSSBuilder._get_cli_path()
+        Technique: State transition (miss -> hit)
+        Test data: get_config() returning a CLI path, two lookups
+        """
+        mock_config_module = SimpleNamespace(
+            get_config=mock.Mock(return_value=SimpleNamespace(cli_path="/bin/tw"))
+        )
+
+        set_setting(None)
+        stub_module("django_tailwind_cli", SimpleNamespace())
+        stub_module("django_tailwind_cli.config", mock_config_module)
+        first = tailwind_builder._get_cli_path()
+        second = tailwind_builder._get_cli_path()
+
+        assert first == second == "/bin/tw"
+        mock_config_module.get_config.assert_called_once()
+
 
 class TestTailwindBuildInputCss:
-    def test_uses_default_input_when_no_base_css(self):
+    def test_uses_default_input_when_no_base_css(self, tailwind_builder, set_setting):
         """Uses DEFAULT_TAILWIND_INPUT when TAILWIND_BASE_CSS is not set.
 
         Purpose: Verify that _build_input_css() uses the default Tailwind
@@ -457,17 +473,12 @@ class TestTailwindBuildInputCss:
         Technique: Equivalence partitioning
         Test data: No TAILWIND_BASE_CSS, no custom CSS, content_file=None
         """
-        builder = TailwindCSSBuilder()
-
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            return_value=None,
-        ):
-            result = builder._build_input_css("", content_file=None)
+        set_setting(None)
+        result = tailwind_builder._build_input_css("", content_file=None)
 
         assert result == DEFAULT_TAILWIND_INPUT
 
-    def test_appends_custom_css_to_input(self):
+    def test_appends_custom_css_to_input(self, tailwind_builder, set_setting):
         """Custom CSS is appended to the Tailwind input.
 
         Purpose: Verify that _build_input_css() appends custom CSS content
@@ -477,20 +488,17 @@ class TestTailwindBuildInputCss:
         Technique: Equivalence partitioning
         Test data: Custom CSS string, content_file=None
         """
-        builder = TailwindCSSBuilder()
-
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            return_value=None,
-        ):
-            result = builder._build_input_css(
-                ".custom { color: red; }", content_file=None
-            )
+        set_setting(None)
+        result = tailwind_builder._build_input_css(
+            ".custom { color: red; }", content_file=None
+        )
 
         assert DEFAULT_TAILWIND_INPUT in result
         assert ".custom { color: red; }" in result
 
-    def test_reads_base_css_file_when_configured(self):
+    def test_reads_base_css_file_when_configured(
+        self, tailwind_builder, set_setting, tmp_path
+    ):
         """Reads base CSS from file when TAILWIND_BASE_CSS is set.
 
         Purpose: Verify that _build_input_css() reads a file specified
@@ -498,27 +506,48 @@ class TestTailwindBuildInputCss:
         Category: Normal case
         Target: TailwindCSSBuilder._build_input_css(custom_css, content_file)
         Technique: Equivalence partitioning
-        Test data: Mock base CSS file, content_file=None
+        Test data: Base CSS file on disk, content_file=None
         """
-        builder = TailwindCSSBuilder()
         base_css_content = '@import "tailwindcss";\n@layer components {}'
+        base_css = tmp_path / "base.css"
+        base_css.write_text(base_css_content, encoding="utf-8")
 
-        with (
-            mock.patch(
-                "wagtail_asset_publisher.builders.tailwind.get_setting",
-                return_value="/path/to/base.css",
-            ),
-            mock.patch.object(
-                Path,
-                "read_text",
-                return_value=base_css_content,
-            ),
-        ):
-            result = builder._build_input_css("", content_file=None)
+        set_setting(str(base_css))
+        result = tailwind_builder._build_input_css("", content_file=None)
 
         assert result == base_css_content
 
-    def test_adds_source_directive_for_content_file(self):
+    def test_base_css_reread_after_change(
+        self, tailwind_builder, set_setting, tmp_path
+    ):
+        """Base CSS is read once and read again only after it changes.
+
+        Purpose: Verify that repeated builds reuse the cached base CSS and
+                 that editing the file (new mtime) is picked up.
+        Category: Normal case
+        Target: TailwindCSSBuilder._build_input_css(custom_css, content_file)
+        Technique: State transition (cached -> modified -> re-read)
+        Test data: Base CSS file rewritten with a later mtime
+        """
+        base_css = tmp_path / "base.css"
+        base_css.write_text("/* v1 */", encoding="utf-8")
+        os.utime(base_css, ns=(1_000_000_000, 1_000_000_000))
+        set_setting(str(base_css))
+
+        with mock.patch.object(Path, "read_text", wraps=base_css.read_text) as read:
+            first = tailwind_builder._build_input_css("")
+            second = tailwind_builder._build_input_css("")
+        base_css.write_text("/* v2 */", encoding="utf-8")
+        os.utime(base_css, ns=(2_000_000_000, 2_000_000_000))
+        third = tailwind_builder._build_input_css("")
+
+        assert first == second == "/* v1 */"
+        assert read.call_count == 1
+        assert third == "/* v2 */"
+
+    def test_adds_source_directive_for_content_file(
+        self, tailwind_builder, set_setting
+    ):
         """Adds @source directive when content_file is provided.
 
         Purpose: Verify that _build_input_css() inserts an @source directive
@@ -529,19 +558,15 @@ class TestTailwindBuildInputCss:
         Technique: Equivalence partitioning
         Test data: content_file=/tmp/content.html, no custom CSS
         """
-        builder = TailwindCSSBuilder()
         content_file = Path("/tmp/content.html")
 
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            return_value=None,
-        ):
-            result = builder._build_input_css("", content_file=content_file)
+        set_setting(None)
+        result = tailwind_builder._build_input_css("", content_file=content_file)
 
         assert '@source "/tmp/content.html";' in result
         assert DEFAULT_TAILWIND_INPUT in result
 
-    def test_source_directive_with_custom_css(self):
+    def test_source_directive_with_custom_css(self, tailwind_builder, set_setting):
         """Ordering: base CSS, then @source directive, then custom CSS.
 
         Purpose: Verify that _build_input_css() produces output in the correct
@@ -552,22 +577,22 @@ class TestTailwindBuildInputCss:
         Technique: Statement coverage (C0)
         Test data: content_file with custom CSS
         """
-        builder = TailwindCSSBuilder()
         content_file = Path("/tmp/content.html")
         custom_css = ".custom { color: red; }"
 
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            return_value=None,
-        ):
-            result = builder._build_input_css(custom_css, content_file=content_file)
+        set_setting(None)
+        result = tailwind_builder._build_input_css(
+            custom_css, content_file=content_file
+        )
 
         base_pos = result.index('@import "tailwindcss"')
         source_pos = result.index('@source "/tmp/content.html"')
         custom_pos = result.index(".custom { color: red; }")
         assert base_pos < source_pos < custom_pos
 
-    def test_no_plugins_injected_when_not_configured(self):
+    def test_no_plugins_injected_when_not_configured(
+        self, tailwind_builder, set_setting
+    ):
         """No @plugin directives when TAILWIND_PLUGINS is empty (default).
 
         Purpose: Verify that _build_input_css() does not inject any @plugin
@@ -577,24 +602,16 @@ class TestTailwindBuildInputCss:
         Technique: Equivalence partitioning
         Test data: TAILWIND_PLUGINS=[], TAILWIND_BASE_CSS=None
         """
-        builder = TailwindCSSBuilder()
-
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": None,
-                "TAILWIND_PLUGINS": [],
-            }
-            return settings.get(key)
+        set_setting(
+            TAILWIND_BASE_CSS=None,
+            TAILWIND_PLUGINS=[],
+        )
 
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            side_effect=mock_get_setting,
-        ):
-            result = builder._build_input_css("", content_file=None)
+        result = tailwind_builder._build_input_css("", content_file=None)
 
         assert "@plugin" not in result
 
-    def test_single_plugin_injected(self):
+    def test_single_plugin_injected(self, tailwind_builder, set_setting):
         """Single @plugin directive injected for one configured plugin.
 
         Purpose: Verify that _build_input_css() injects a single @plugin
@@ -604,24 +621,16 @@ class TestTailwindBuildInputCss:
         Technique: Equivalence partitioning
         Test data: TAILWIND_PLUGINS=["@tailwindcss/typography"]
         """
-        builder = TailwindCSSBuilder()
+        set_setting(
+            TAILWIND_BASE_CSS=None,
+            TAILWIND_PLUGINS=["@tailwindcss/typography"],
+        )
 
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": None,
-                "TAILWIND_PLUGINS": ["@tailwindcss/typography"],
-            }
-            return settings.get(key)
-
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            side_effect=mock_get_setting,
-        ):
-            result = builder._build_input_css("", content_file=None)
+        result = tailwind_builder._build_input_css("", content_file=None)
 
         assert '@plugin "@tailwindcss/typography";' in result
 
-    def test_multiple_plugins_injected_in_order(self):
+    def test_multiple_plugins_injected_in_order(self, tailwind_builder, set_setting):
         """Multiple @plugin directives injected in configured order.
 
         Purpose: Verify that _build_input_css() injects @plugin directives
@@ -631,27 +640,22 @@ class TestTailwindBuildInputCss:
         Technique: Equivalence partitioning
         Test data: TAILWIND_PLUGINS with typography and forms
         """
-        builder = TailwindCSSBuilder()
         plugins = ["@tailwindcss/typography", "@tailwindcss/forms"]
 
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": None,
-                "TAILWIND_PLUGINS": plugins,
-            }
-            return settings.get(key)
+        set_setting(
+            TAILWIND_BASE_CSS=None,
+            TAILWIND_PLUGINS=plugins,
+        )
 
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            side_effect=mock_get_setting,
-        ):
-            result = builder._build_input_css("", content_file=None)
+        result = tailwind_builder._build_input_css("", content_file=None)
 
         typography_pos = result.index('@plugin "@tailwindcss/typography"')
         forms_pos = result.index('@plugin "@tailwindcss/forms"')
         assert typography_pos < forms_pos
 
-    def test_plugins_ignored_when_base_css_set(self):
+    def test_plugins_ignored_when_base_css_set(
+        self, tailwind_builder, set_setting, tmp_path
+    ):
         """TAILWIND_PLUGINS is ignored when TAILWIND_BASE_CSS is set.
 
         Purpose: Verify that _build_input_css() does not inject @plugin
@@ -662,32 +666,20 @@ class TestTailwindBuildInputCss:
         Technique: Decision coverage (C1)
         Test data: TAILWIND_BASE_CSS set, TAILWIND_PLUGINS non-empty
         """
-        builder = TailwindCSSBuilder()
-        base_css_content = '@import "tailwindcss";\n@layer components {}'
-
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": "/path/to/base.css",
-                "TAILWIND_PLUGINS": ["@tailwindcss/typography"],
-            }
-            return settings.get(key)
+        base_css = tmp_path / "base.css"
+        base_css.write_text(
+            '@import "tailwindcss";\n@layer components {}', encoding="utf-8"
+        )
 
-        with (
-            mock.patch(
-                "wagtail_asset_publisher.builders.tailwind.get_setting",
-                side_effect=mock_get_setting,
-            ),
-            mock.patch.object(
-                Path,
-                "read_text",
-                return_value=base_css_content,
-            ),
-        ):
-            result = builder._build_input_css("", content_file=None)
+        set_setting(
+            TAILWIND_BASE_CSS=str(base_css),
+            TAILWIND_PLUGINS=["@tailwindcss/typography"],
+        )
+        result = tailwind_builder._build_input_css("", content_file=None)
 
         assert "@plugin" not in result
 
-    def test_plugin_directive_ordering(self):
+    def test_plugin_directive_ordering(self, tailwind_builder, set_setting):
         """Ordering: @import < @plugin directives < @source < custom CSS.
 
         Purpose: Verify that _build_input_css() produces output in the correct
@@ -698,22 +690,17 @@ class TestTailwindBuildInputCss:
         Technique: Statement coverage (C0)
         Test data: Plugin + content_file + custom CSS
         """
-        builder = TailwindCSSBuilder()
         content_file = Path("/tmp/content.html")
         custom_css = ".custom { color: red; }"
 
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": None,
-                "TAILWIND_PLUGINS": ["@tailwindcss/typography"],
-            }
-            return settings.get(key)
+        set_setting(
+            TAILWIND_BASE_CSS=None,
+            TAILWIND_PLUGINS=["@tailwindcss/typography"],
+        )
 
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            side_effect=mock_get_setting,
-        ):
-            result = builder._build_input_css(custom_css, content_file=content_file)
+        result = tailwind_builder._build_input_css(
+            custom_css, content_file=content_file
+        )
 
         import_pos = result.index('@import "tailwindcss"')
         plugin_pos = result.index('@plugin "@tailwindcss/typography"')
@@ -721,7 +708,7 @@ class TestTailwindBuildInputCss:
         custom_pos = result.index(".custom { color: red; }")
         assert import_pos < plugin_pos < source_pos < custom_pos
 
-    def test_plugin_directives_have_semicolons(self):
+    def test_plugin_directives_have_semicolons(self, tailwind_builder, set_setting):
         """Each @plugin directive ends with a semicolon.
 
         Purpose: Verify that every @plugin line has a trailing semicolon,
@@ -731,21 +718,14 @@ class TestTailwindBuildInputCss:
         Technique: Error guessing (missing semicolons)
         Test data: Multiple plugins
         """
-        builder = TailwindCSSBuilder()
         plugins = ["@tailwindcss/typography", "@tailwindcss/forms"]
 
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": None,
-                "TAILWIND_PLUGINS": plugins,
-            }
-            return settings.get(key)
+        set_setting(
+            TAILWIND_BASE_CSS=None,
+            TAILWIND_PLUGINS=plugins,
+        )
 
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            side_effect=mock_get_setting,
-        ):
-            result = builder._build_input_css("", content_file=None)
+        result = tailwind_builder._build_input_css("", content_file=None)
 
         plugin_lines = [
             line for line in result.splitlines() if line.startswith("@plugin")
@@ -762,7 +742,7 @@ class TestValidatePlugins:
     injecting them into generated CSS.
     """
 
-    def test_none_returns_empty_list(self):
+    def test_none_returns_empty_list(self, tailwind_builder):
         """None value returns empty list without warning.
 
         Purpose: Verify that _validate_plugins(None) returns an empty list
@@ -772,13 +752,11 @@ class TestValidatePlugins:
         Technique: Boundary value analysis (None input)
         Test data: None
         """
-        builder = TailwindCSSBuilder()
-
-        result = builder._validate_plugins(None)
+        result = tailwind_builder._validate_plugins(None)
 
         assert result == []
 
-    def test_valid_list_passes_through(self):
+    def test_valid_list_passes_through(self, tailwind_builder):
         """A list of valid plugin names is returned as-is.
 
         Purpose: Verify that _validate_plugins() passes through a valid list
@@ -788,14 +766,13 @@ class TestValidatePlugins:
         Technique: Equivalence partitioning
         Test data: List with two valid scoped package names
         """
-        builder = TailwindCSSBuilder()
         plugins = ["@tailwindcss/typography", "@tailwindcss/forms"]
 
-        result = builder._validate_plugins(plugins)
+        result = tailwind_builder._validate_plugins(plugins)
 
         assert result == plugins
 
-    def test_string_value_returns_empty_and_warns(self, caplog):
+    def test_string_value_returns_empty_and_warns(self, caplog, tailwind_builder):
         """A string value (common misconfiguration) is rejected with warning.
 
         Purpose: Verify that _validate_plugins() returns an empty list and
@@ -806,16 +783,14 @@ class TestValidatePlugins:
         Technique: Error guessing (common misconfiguration)
         Test data: "tailwindcss/typography" (string instead of list)
         """
-        builder = TailwindCSSBuilder()
-
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins("tailwindcss/typography")
+            result = tailwind_builder._validate_plugins("tailwindcss/typography")
 
         assert result == []
         assert "TAILWIND_PLUGINS must be a list" in caplog.text
         assert "str" in caplog.text
 
-    def test_tuple_value_returns_empty_and_warns(self, caplog):
+    def test_tuple_value_returns_empty_and_warns(self, caplog, tailwind_builder):
         """A tuple value is rejected with warning.
 
         Purpose: Verify that _validate_plugins() rejects non-list iterables
@@ -825,16 +800,14 @@ class TestValidatePlugins:
         Technique: Error guessing (wrong iterable type)
         Test data: Tuple of plugin names
         """
-        builder = TailwindCSSBuilder()
-
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins(("@tailwindcss/typography",))
+            result = tailwind_builder._validate_plugins(("@tailwindcss/typography",))
 
         assert result == []
         assert "TAILWIND_PLUGINS must be a list" in caplog.text
         assert "tuple" in caplog.text
 
-    def test_integer_value_returns_empty_and_warns(self, caplog):
+    def test_integer_value_returns_empty_and_warns(self, caplog, tailwind_builder):
         """An integer value is rejected with warning.
 
         Purpose: Verify that _validate_plugins() rejects non-iterable types.
@@ -843,15 +816,13 @@ class TestValidatePlugins:
         Technique: Error guessing (wrong type)
         Test data: Integer 42
         """
-        builder = TailwindCSSBuilder()
-
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins(42)
+            result = tailwind_builder._validate_plugins(42)
 
         assert result == []
         assert "TAILWIND_PLUGINS must be a list" in caplog.text
 
-    def test_plugin_name_with_double_quote_skipped(self, caplog):
+    def test_plugin_name_with_double_quote_skipped(self, caplog, tailwind_builder):
         """Plugin name containing a double-quote is skipped with warning.
 
         Purpose: Verify that a plugin name with an embedded double-quote
@@ -861,15 +832,13 @@ class TestValidatePlugins:
         Technique: Error guessing (CSS injection via quote)
         Test data: ['bad"name']
         """
-        builder = TailwindCSSBuilder()
-
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins(['bad"name'])
+            result = tailwind_builder._validate_plugins(['bad"name'])
 
         assert result == []
         assert "Invalid plugin name skipped" in caplog.text
 
-    def test_plugin_name_with_semicolon_skipped(self, caplog):
+    def test_plugin_name_with_semicolon_skipped(self, caplog, tailwind_builder):
         """Plugin name containing a semicolon is skipped with warning.
 
         Purpose: Verify that a plugin name with a semicolon is rejected,
@@ -879,15 +848,13 @@ class TestValidatePlugins:
         Technique: Error guessing (CSS injection via semicolon)
         Test data: ['bad;name']
         """
-        builder = TailwindCSSBuilder()
-
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins(["bad;name"])
+            result = tailwind_builder._validate_plugins(["bad;name"])
 
         assert result == []
         assert "Invalid plugin name skipped" in caplog.text
 
-    def test_plugin_name_with_space_skipped(self, caplog):
+    def test_plugin_name_with_space_skipped(self, caplog, tailwind_builder):
         """Plugin name containing a space is skipped with warning.
 
         Purpose: Verify that a plugin name with spaces is rejected.
@@ -896,15 +863,13 @@ class TestValidatePlugins:
         Technique: Error guessing (whitespace in name)
         Test data: ['bad name']
         """
-        builder = TailwindCSSBuilder()
-
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins(["bad name"])
+            result = tailwind_builder._validate_plugins(["bad name"])
 
         assert result == []
         assert "Invalid plugin name skipped" in caplog.text
 
-    def test_non_string_entry_skipped(self, caplog):
+    def test_non_string_entry_skipped(self, caplog, tailwind_builder):
         """Non-string entries in the list are skipped with warning.
 
         Purpose: Verify that non-string items (e.g. integers) within
@@ -914,15 +879,15 @@ class TestValidatePlugins:
         Technique: Error guessing (mixed types in list)
         Test data: [123, "@tailwindcss/typography"]
         """
-        builder = TailwindCSSBuilder()
-
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins([123, "@tailwindcss/typography"])
+            result = tailwind_builder._validate_plugins(
+                [123, "@tailwindcss/typography"]
+            )
 
         assert result == ["@tailwindcss/typography"]
         assert "Invalid plugin name skipped" in caplog.text
 
-    def test_mixed_valid_and_invalid_entries(self, caplog):
+    def test_mixed_valid_and_invalid_entries(self, caplog, tailwind_builder):
         """Valid entries pass through while invalid ones are skipped.
 
         Purpose: Verify that _validate_plugins() filters out only the
@@ -932,7 +897,6 @@ class TestValidatePlugins:
         Technique: Equivalence partitioning (mixed input)
         Test data: Mix of valid and invalid plugin names
         """
-        builder = TailwindCSSBuilder()
         plugins = [
             "@tailwindcss/typography",
             'bad"quote',
@@ -940,12 +904,12 @@ class TestValidatePlugins:
         ]
 
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins(plugins)
+            result = tailwind_builder._validate_plugins(plugins)
 
         assert result == ["@tailwindcss/typography", "@tailwindcss/forms"]
         assert "Invalid plugin name skipped" in caplog.text
 
-    def test_empty_string_entry_skipped(self, caplog):
+    def test_empty_string_entry_skipped(self, caplog, tailwind_builder):
         """Empty string plugin name is skipped with warning.
 
         Purpose: Verify that an empty string entry is rejected because
@@ -955,10 +919,8 @@ class TestValidatePlugins:
         Technique: Boundary value analysis (empty string)
         Test data: [""]
         """
-        builder = TailwindCSSBuilder()
-
         with caplog.at_level("WARNING"):
-            result = builder._validate_plugins([""])
+            result = tailwind_builder._validate_plugins([""])
 
         assert result == []
         assert "Invalid plugin name skipped" in caplog.text
@@ -1015,7 +977,9 @@ class TestValidatePlugins:
 class TestBuildInputCssPluginValidation:
     """Integration tests: _build_input_css with invalid TAILWIND_PLUGINS values."""
 
-    def test_string_plugins_produces_no_directives(self, caplog):
+    def test_string_plugins_produces_no_directives(
+        self, caplog, tailwind_builder, set_setting
+    ):
         """String TAILWIND_PLUGINS produces no @plugin directives.
 
         Purpose: Verify that _build_input_css() does not produce broken
@@ -1026,29 +990,21 @@ class TestBuildInputCssPluginValidation:
         Technique: Error guessing (common misconfiguration)
         Test data: TAILWIND_PLUGINS="tailwindcss/typography" (string)
         """
-        builder = TailwindCSSBuilder()
-
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": None,
-                "TAILWIND_PLUGINS": "tailwindcss/typography",
-            }
-            return settings.get(key)
+        set_setting(
+            TAILWIND_BASE_CSS=None,
+            TAILWIND_PLUGINS="tailwindcss/typography",
+        )
 
-        with (
-            caplog.at_level("WARNING"),
-            mock.patch(
-                "wagtail_asset_publisher.builders.tailwind.get_setting",
-                side_effect=mock_get_setting,
-            ),
-        ):
-            result = builder._build_input_css("", content_file=None)
+        with caplog.at_level("WARNING"):
+            result = tailwind_builder._build_input_css("", content_file=None)
 
         assert "@plugin" not in result
         assert result == DEFAULT_TAILWIND_INPUT
         assert "TAILWIND_PLUGINS must be a list" in caplog.text
 
-    def test_plugin_with_quote_skipped_in_output(self, caplog):
+    def test_plugin_with_quote_skipped_in_output(
+        self, caplog, tailwind_builder, set_setting
+    ):
         """Plugin name with double-quote is excluded from generated CSS.
 
         Purpose: Verify that _build_input_css() does not produce a broken
@@ -1058,29 +1014,19 @@ class TestBuildInputCssPluginValidation:
         Technique: Error guessing (CSS injection)
         Test data: TAILWIND_PLUGINS=['bad"name', '@tailwindcss/forms']
         """
-        builder = TailwindCSSBuilder()
-
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": None,
-                "TAILWIND_PLUGINS": ['bad"name', "@tailwindcss/forms"],
-            }
-            return settings.get(key)
+        set_setting(
+            TAILWIND_BASE_CSS=None,
+            TAILWIND_PLUGINS=['bad"name', "@tailwindcss/forms"],
+        )
 
-        with (
-            caplog.at_level("WARNING"),
-            mock.patch(
-                "wagtail_asset_publisher.builders.tailwind.get_setting",
-                side_effect=mock_get_setting,
-            ),
-        ):
-            result = builder._build_input_css("", content_file=None)
+        with caplog.at_level("WARNING"):
+            result = tailwind_builder._build_input_css("", content_file=None)
 
         assert '@plugin "@tailwindcss/forms";' in result
         assert "bad" not in result
         assert "Invalid plugin name skipped" in caplog.text
 
-    def test_none_plugins_produces_no_directives(self):
+    def test_none_plugins_produces_no_directives(self, tailwind_builder, set_setting):
         """None TAILWIND_PLUGINS produces no @plugin directives.
 
         Purpose: Verify that _build_input_css() gracefully handles
@@ -1090,107 +1036,65 @@ class TestBuildInputCssPluginValidation:
         Technique: Boundary value analysis (None)
         Test data: TAILWIND_PLUGINS=None
         """
-        builder = TailwindCSSBuilder()
-
-        def mock_get_setting(key):
-            settings = {
-                "TAILWIND_BASE_CSS": None,
-                "TAILWIND_PLUGINS": None,
-            }
-            return settings.get(key)
+        set_setting(
+            TAILWIND_BASE_CSS=None,
+            TAILWIND_PLUGINS=None,
+        )
 
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            side_effect=mock_get_setting,
-        ):
-            result = builder._build_input_css("", content_file=None)
+        result = tailwind_builder._build_input_css("", content_file=None)
 
         assert "@plugin" not in result
         assert result == DEFAULT_TAILWIND_INPUT
 
 
 class TestTailwindBuildCommand:
-    def test_builds_basic_command(self):
-        """Builds correct CLI command with input/output/minify flags (no --content).
-
-        Purpose: Verify that _build_command() produces the correct Tailwind CLI
-                 command arguments. In v4, --content is no longer used because
-                 content scanning is handled via @source directive in input CSS.
+    @pytest.mark.parametrize(
+        ("config_path", "config_args"),
+        [
+            pytest.param(None, [], id="no-config"),
+            pytest.param(
+                "/path/to/tailwind.config.js",
+                ["--config", "/path/to/tailwind.config.js"],
+                id="config",
+            ),
+        ],
+    )
+    def test_builds_command(
+        self, tailwind_builder, set_setting, config_path, config_args
+    ):
+        """Builds the CLI command, adding --config only when configured.
+
+        Purpose: Verify that _build_command() produces the input/output/minify
+                 arguments, appends --config when TAILWIND_CONFIG is set, and
+                 never includes --content (content scanning is handled via
+                 the @source directive since the v4 migration).
         Category: Normal case
         Target: TailwindCSSBuilder._build_command(cli_path, input_file, output_file)
-        Technique: Equivalence partitioning
-        Test data: Standard path arguments
+        Technique: Decision coverage (C1) - config_path branch
+        Test data: TAILWIND_CONFIG unset and set
         """
-        builder = TailwindCSSBuilder()
-        input_f = Path("/tmp/input.css")
-        output_f = Path("/tmp/output.css")
-
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            return_value=None,
-        ):
-            result = builder._build_command("tailwindcss", input_f, output_f)
+        set_setting(config_path)
+        result = tailwind_builder._build_command(
+            "tailwindcss", _INPUT_FILE, _OUTPUT_FILE
+        )
 
         assert result == [
             "tailwindcss",
             "--input",
-            str(input_f),
+            str(_INPUT_FILE),
             "--output",
-            str(output_f),
+            str(_OUTPUT_FILE),
             "--minify",
+            *config_args,
         ]
-
-    def test_config_passed_to_cli(self):
-        """TAILWIND_CONFIG adds --config flag to CLI command.
-
-        Purpose: Verify that _build_command() appends --config when
-                 TAILWIND_CONFIG setting is configured.
-        Category: Normal case
-        Target: TailwindCSSBuilder._build_command()
-        Technique: Decision coverage (C1) - config_path branch
-        Test data: TAILWIND_CONFIG=/path/to/tailwind.config.js
-        """
-        builder = TailwindCSSBuilder()
-        input_f = Path("/tmp/input.css")
-        output_f = Path("/tmp/output.css")
-
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            return_value="/path/to/tailwind.config.js",
-        ):
-            result = builder._build_command("tailwindcss", input_f, output_f)
-
-        assert "--config" in result
-        assert "/path/to/tailwind.config.js" in result
-
-    def test_no_config_when_setting_is_none(self):
-        """No --config or --content flags when TAILWIND_CONFIG is None.
-
-        Purpose: Verify that _build_command() does not add --config
-                 when the setting is None, and never includes --content
-                 (removed in v4 migration).
-        Category: Normal case
-        Target: TailwindCSSBuilder._build_command()
-        Technique: Decision coverage (C1) - no config branch
-        Test data: TAILWIND_CONFIG=None
-        """
-        builder = TailwindCSSBuilder()
-        input_f = Path("/tmp/input.css")
-        output_f = Path("/tmp/output.css")
-
-        with mock.patch(
-            "wagtail_asset_publisher.builders.tailwind.get_setting",
-            return_value=None,
-        ):
-            result = builder._build_command("tailwindcss", input_f, output_f)
-
-        assert "--config" not in result
         assert "--content" not in result
 
 
 class TestTailwindRunTailwind:
     @mock.patch("wagtail_asset_publisher.builders.tailwind.subprocess.run")
-    def test_run_tailwind_nonzero_exit_raises(self, mock_subprocess_run):
+    def test_run_tailwind_nonzero_exit_raises(
+        self, mock_subprocess_run, tailwind_builder
+    ):
         """Non-zero exit code raises SubprocessError.
 
         Purpose: Verify that _run_tailwind() raises SubprocessError
@@ -1202,21 +1106,57 @@ class TestTailwindRunTailwind:
         Technique: Error guessing
         Test data: subprocess.run returning exit code 1
         """
-        builder = TailwindCSSBuilder()
-
         mock_result = mock.Mock()
         mock_result.returncode = 1
         mock_result.stderr = "Error: something went wrong"
         mock_subprocess_run.return_value = mock_result
 
         with (
-            mock.patch.object(builder, "_get_cli_path", return_value="tailwindcss"),
             mock.patch.object(
-                builder,
+                tailwind_builder, "_get_cli_path", return_value="tailwindcss"
+            ),
+            mock.patch.object(
+                tailwind_builder,
                 "_build_input_css",
                 return_value='@import "tailwindcss";\n@source "/tmp/content.html";',
             ),
             mock.patch("wagtail_asset_publisher.builders.tailwind.Path.write_text"),
             pytest.raises(subprocess.SubprocessError, match="Tailwind CLI failed"),
         ):
-            builder._run_tailwind("<div>test</div>", ".custom{}")
+            tailwind_builder._run_tailwind("<div>test</div>", ".custom{}")
+
+    def test_removes_tempdir_after_each_run(self, set_setting):
+        """Each run compiles in its own scratch directory, removed afterwards.
+
+        Purpose: Verify that _run_tailwind() cleans up its temporary files
+                 as soon as the run finishes, and that consecutive runs never
+                 see each other's output.
+        Category: Normal case
+        Target: TailwindCSSBuilder._run_tailwind(html_content, custom_css)
+        Technique: State transition (first run -> second run)
+        Test data: CLI writing output on the first run only
+        """
+        builder = TailwindCSSBuilder()
+        set_setting(None)
+        outputs = iter([".a{}", None])
+
+        def fake_run(cmd, **kwargs):
+            content = next(outputs)
+            if content is not None:
+                Path(cmd[cmd.index("--output") + 1]).write_text(content)
+            return mock.Mock(returncode=0)
+
+        with mock.patch(
+            "wagtail_asset_publisher.builders.tailwind.subprocess.run",
+            side_effect=fake_run,
+        ) as mock_run:
+            first = builder._run_tailwind("<div></div>", "")
+            second = builder._run_tailwind("<div></div>", "")
+
+        input_dirs = [
+            Path(call.args[0][call.args[0].index("--input") + 1]).parent
+            for call in mock_run.call_args_list
+        ]
+        assert input_dirs[0] != input_dirs[1]
+        assert not any(path.exists() for path in input_dirs)
+        assert (first, second) == (".a{}", "")
@@ -12,16 +12,51 @@
 | DT6 | absent      | _UNSET      | absent      | None                   |
 """
 
-from unittest import mock
+from types import SimpleNamespace
 
 import pytest
 
+from wagtail_asset_publisher import conf as conf_module
 from wagtail_asset_publisher.conf import DEFAULTS, get_setting
 
+_DEFAULT_CSS_BUILDER = DEFAULTS["CSS_BUILDER"]
+_V2_REQUIRED_KEYS = frozenset(
+    {
+        "CSS_BUILDER",
+        "JS_BUILDER",
+        "STORAGE_BACKEND",
+        "CSS_PREFIX",
+        "JS_PREFIX",
+        "HASH_LENGTH",
+        "TAILWIND_CDN_URL",
+        "TAILWIND_CLI_PATH",
+        "TAILWIND_CONFIG",
+        "TAILWIND_BASE_CSS",
+        "TAILWIND_PLUGINS",
+        "MINIFY_HTML",
+        "OBFUSCATE_JS",
+        "MINIFY_CSS",
+        "TERSER_PATH",
+        "TERSER_OPTIONS",
+        "EXTRACT_FROM_TEMPLATES",
+        "FAST_PARSER",
+    }
+)
+_OPTIMIZATION_KEYS = frozenset(
+    {"OBFUSCATE_JS", "MINIFY_CSS", "TERSER_PATH", "TERSER_OPTIONS"}
+)
+
 
 class TestGetSettingDecisionTable:
     """Decision table coverage for get_setting() priority logic."""
 
+    @pytest.fixture
+    def settings_stub(self, monkeypatch):
+        """Replace conf.settings with a plain object the rows can write to."""
+        stub = SimpleNamespace(WAGTAIL_ASSET_PUBLISHER={})
+        monkeypatch.setattr(conf_module, "settings", stub)
+        return stub
+
     @pytest.mark.parametrize(
         "user_settings,key,kwargs,expected",
         [
@@ -43,7 +78,7 @@ class TestGetSettingDecisionTable:
                 {},
                 "CSS_BUILDER",
                 {},
-                DEFAULTS["CSS_BUILDER"],
+                _DEFAULT_CSS_BUILDER,
                 id="DT3-no-user-setting-returns-defaults-value",
             ),
             pytest.param(
@@ -69,7 +104,7 @@ class TestGetSettingDecisionTable:
             ),
         ],
     )
-    def test_get_setting(self, user_settings, key, kwargs, expected):
+    def test_get_setting(self, settings_stub, user_settings, key, kwargs, expected):
         """DT-GET-SETTING: verify priority of user settings > default arg > DEFAULTS.
 
         Purpose: Verify get_setting() returns the correct value based on the
@@ -79,10 +114,9 @@ class TestGetSettingDecisionTable:
         Technique: Decision table (DT-GET-SETTING)
         Test data: All 6 combinations from decision table
         """
-        with mock.patch("wagtail_asset_publisher.conf.settings") as mock_settings:
-            mock_settings.WAGTAIL_ASSET_PUBLISHER = user_settings
+        settings_stub.WAGTAIL_ASSET_PUBLISHER = user_settings
 
-            result = get_setting(key, **kwargs)
+        result = get_setting(key, **kwargs)
 
         assert result == expected
 
@@ -90,7 +124,7 @@ class TestGetSettingDecisionTable:
 class TestGetSettingEdgeCases:
     """Edge cases for get_setting()."""
 
-    def test_get_setting_without_wagtail_asset_publisher_attr(self):
+    def test_get_setting_without_wagtail_asset_publisher_attr(self, monkeypatch):
         """Settings object without WAGTAIL_ASSET_PUBLISHER returns DEFAULTS value.
 
         Purpose: Verify graceful handling when WAGTAIL_ASSET_PUBLISHER is not
@@ -98,16 +132,17 @@ class TestGetSettingEdgeCases:
         Category: Edge case
         Target: get_setting(key)
         Technique: Error guessing (missing attribute)
-        Test data: Mock settings without WAGTAIL_ASSET_PUBLISHER attribute
+        Test data: Settings without WAGTAIL_ASSET_PUBLISHER attribute
         """
-        mock_settings = mock.Mock(spec=[])
+        monkeypatch.delattr(
+            conf_module.settings, "WAGTAIL_ASSET_PUBLISHER", raising=False
+        )
 
-        with mock.patch("wagtail_asset_publisher.conf.settings", mock_settings):
-            result = get_setting("CSS_BUILDER")
+        result = get_setting("CSS_BUILDER")
 
-        assert result == DEFAULTS["CSS_BUILDER"]
+        assert result == _DEFAULT_CSS_BUILDER
 
-    def test_get_setting_user_value_is_falsy_but_present(self):
+    def test_get_setting_user_value_is_falsy_but_present(self, monkeypatch):
         """User setting with falsy value (empty string) is still returned.
 
         Purpose: Verify that falsy but present user values are not confused
@@ -117,14 +152,18 @@ class TestGetSettingEdgeCases:
         Technique: Boundary value analysis (falsy but present)
         Test data: Empty string as user setting
         """
-        with mock.patch("wagtail_asset_publisher.conf.settings") as mock_settings:
-            mock_settings.WAGTAIL_ASSET_PUBLISHER = {"CSS_PREFIX": ""}
+        monkeypatch.setattr(
+            conf_module.settings,
+            "WAGTAIL_ASSET_PUBLISHER",
+            {"CSS_PREFIX": ""},
+            raising=False,
+        )
 
-            result = get_setting("CSS_PREFIX")
+        result = get_setting("CSS_PREFIX")
 
         assert result == ""
 
-    def test_get_setting_user_value_is_zero(self):
+    def test_get_setting_user_value_is_zero(self, monkeypatch):
         """User setting with zero value is returned (not treated as missing).
 
         Purpose: Verify that numeric zero user values are respected.
@@ -133,10 +172,14 @@ class TestGetSettingEdgeCases:
         Technique: Boundary value analysis (zero value)
         Test data: 0 as user setting for HASH_LENGTH
         """
-        with mock.patch("wagtail_asset_publisher.conf.settings") as mock_settings:
-            mock_settings.WAGTAIL_ASSET_PUBLISHER = {"HASH_LENGTH": 0}
+        monkeypatch.setattr(
+            conf_module.settings,
+            "WAGTAIL_ASSET_PUBLISHER",
+            {"HASH_LENGTH": 0},
+            raising=False,
+        )
 
-            result = get_setting("HASH_LENGTH")
+        result = get_setting("HASH_LENGTH")
 
         assert result == 0
 
@@ -190,27 +233,7 @@ class TestDefaultValues:
         Technique: Equivalence partitioning
         Test data: Set of required key names
         """
-        required_keys = {
-            "CSS_BUILDER",
-            "JS_BUILDER",
-            "STORAGE_BACKEND",
-            "CSS_PREFIX",
-            "JS_PREFIX",
-            "HASH_LENGTH",
-            "TAILWIND_CDN_URL",
-            "TAILWIND_CLI_PATH",
-            "TAILWIND_CONFIG",
-            "TAILWIND_BASE_CSS",
-            "TAILWIND_PLUGINS",
-            "MINIFY_HTML",
-            "OBFUSCATE_JS",
-            "MINIFY_CSS",
-            "TERSER_PATH",
-            "TERSER_OPTIONS",
-            "EXTRACT_FROM_TEMPLATES",
-        }
-
-        assert required_keys.issubset(set(DEFAULTS.keys()))
+        assert _V2_REQUIRED_KEYS.issubset(DEFAULTS)
 
 
 class TestAssetOptimizationDefaults:
@@ -269,11 +292,4 @@ class TestAssetOptimizationDefaults:
         Technique: Equivalence partitioning
         Test data: Set of key names required for asset optimization
         """
-        optimization_keys = {
-            "OBFUSCATE_JS",
-            "MINIFY_CSS",
-            "TERSER_PATH",
-            "TERSER_OPTIONS",
-        }
-
-        assert optimization_keys.issubset(set(DEFAULTS.keys()))
+        assert _OPTIMIZATION_KEYS.issubset(DEFAULTS)
@@ -5,14 +5,22 @@ extract_assets, extract_assets_from_page functions,
 and _resolve_loading_strategy for script loading attributes.
 """
 
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
+import wagtail.fields
+from django.conf import settings
 
 from wagtail_asset_publisher.extractors import (
     ExtractedAsset,
+    _cached_content_hash,
     _extract_assets_from_streamfields,
+    _extract_with_html_parser,
+    _extract_with_lexbor,
+    _get_extractor,
     _get_page_hostname,
+    _lexbor_may_diverge,
     _rendered_html_cache,
     cached_render,
     compute_content_hash,
@@ -21,12 +29,98 @@ from wagtail_asset_publisher.extractors import (
     get_page_html_for_tailwind,
     render_page_html,
 )
+from wagtail_asset_publisher.middleware import _strip_matching_tags
+
+_RED_BODY_HASH = compute_content_hash("body { color: red; }")
+_MULTI_STYLE_HTML = {
+    n: "".join(f"<style>.tag{i} {{}}</style>" for i in range(n)) for n in (1, 3, 50)
+}
+# Markup where lexbor's tree builder sees other content than html.parser,
+# so FAST_PARSER must fall back to keep hashes in step with the middleware.
+_LEXBOR_DIVERGENT_CASES = (
+    pytest.param("<script>var a=1;\r\nvar b=2;</script>", id="crlf"),
+    pytest.param("<style>a{}\rb{}</style>", id="bare-cr"),
+    pytest.param("<script>var a='\x00';</script>", id="nul"),
+    pytest.param(
+        "<svg><style>a::after{content:'&amp;'}</style></svg>", id="svg-entity"
+    ),
+    pytest.param("<math><style>a{}&lt;</style></math>", id="mathml-entity"),
+    pytest.param("<template><style>.t{}</style></template>", id="template"),
+    pytest.param("<TEMPLATE><STYLE>.t{}</STYLE></TEMPLATE>", id="template-uppercase"),
+    pytest.param(
+        "<html><head></head><script>x()</script><body></body></html>",
+        id="script-after-head",
+    ),
+    pytest.param("<title><style>.t{}</style></title>", id="raw-text-element"),
+    pytest.param(
+        "<script><!--<script>a</script>b--></script>", id="script-escape-comment"
+    ),
+    pytest.param("<p>x</p><style>a{}", id="unclosed-style"),
+    pytest.param(
+        "<html><head><noscript><img src=a></noscript><script>theme()</script>"
+        "</head><body></body></html>",
+        id="noscript-img-in-head",
+    ),
+    pytest.param(
+        "<html><head><div></div><script>theme()</script></head><body></body></html>",
+        id="element-in-head",
+    ),
+    pytest.param(
+        "<html><head>text<script>theme()</script></head><body></body></html>",
+        id="text-in-head",
+    ),
+    pytest.param(
+        "<html><script>early()</script><head></head><body></body></html>",
+        id="script-before-head",
+    ),
+    pytest.param(
+        "<p>x</p><html><head><script>theme()</script></head><body></body></html>",
+        id="element-before-head",
+    ),
+)
+
+
+@pytest.fixture(scope="module", params=["html.parser", "lexbor"])
+def extraction_backend(request):
+    """Run the module once per extraction backend, toggled via FAST_PARSER."""
+    if request.param == "lexbor":
+        pytest.importorskip("selectolax.lexbor")
+    user_settings = getattr(settings, "WAGTAIL_ASSET_PUBLISHER", {})
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            settings,
+            "WAGTAIL_ASSET_PUBLISHER",
+            {**user_settings, "FAST_PARSER": request.param == "lexbor"},
+            raising=False,
+        )
+        yield request.param
+
+
+pytestmark = pytest.mark.usefixtures("extraction_backend")
+
+
+@pytest.fixture(scope="module")
+def parsed_html_with_style(extraction_backend, sample_html_with_style):
+    """``extract_assets(sample_html_with_style)``, parsed once; do not mutate."""
+    return extract_assets(sample_html_with_style)
+
+
+@pytest.fixture(scope="module")
+def parsed_html_with_script(extraction_backend, sample_html_with_script):
+    """``extract_assets(sample_html_with_script)``, parsed once; do not mutate."""
+    return extract_assets(sample_html_with_script)
+
+
+@pytest.fixture(scope="module")
+def parsed_html_with_both(extraction_backend, sample_html_with_both):
+    """``extract_assets(sample_html_with_both)``, parsed once; do not mutate."""
+    return extract_assets(sample_html_with_both)
 
 
 class TestExtractAssetsSingleTags:
     """Tests for extracting individual <style> and <script> tags."""
 
-    def test_extract_single_style(self, sample_html_with_style):
+    def test_extract_single_style(self, parsed_html_with_style):
         """Single inline <style> tag is extracted with correct content and hash.
 
         Purpose: Verify the core extraction of a single <style> tag from HTML,
@@ -36,14 +130,14 @@ class TestExtractAssetsSingleTags:
         Technique: Equivalence partitioning (valid HTML with one style tag)
         Test data: HTML with one <style> containing 'body { color: red; }'
         """
-        styles, scripts = extract_assets(sample_html_with_style)
+        styles, scripts = parsed_html_with_style
 
         assert len(styles) == 1
         assert styles[0].content == "body { color: red; }"
-        assert styles[0].content_hash == compute_content_hash("body { color: red; }")
+        assert styles[0].content_hash == _RED_BODY_HASH
         assert scripts == []
 
-    def test_extract_single_script(self, sample_html_with_script):
+    def test_extract_single_script(self, parsed_html_with_script):
         """Single inline <script> tag is extracted with correct content and hash.
 
         Purpose: Verify the core extraction of a single <script> tag from HTML.
@@ -52,13 +146,13 @@ class TestExtractAssetsSingleTags:
         Technique: Equivalence partitioning (valid HTML with one script tag)
         Test data: HTML with one <script> containing console.log("hello");
         """
-        styles, scripts = extract_assets(sample_html_with_script)
+        styles, scripts = parsed_html_with_script
 
         assert styles == []
         assert len(scripts) == 1
         assert scripts[0].content == 'console.log("hello");'
 
-    def test_extract_style_and_script(self, sample_html_with_both):
+    def test_extract_style_and_script(self, parsed_html_with_both):
         """Both <style> and <script> tags are extracted from same HTML.
 
         Purpose: Verify that mixed asset types are correctly separated
@@ -68,7 +162,7 @@ class TestExtractAssetsSingleTags:
         Technique: Equivalence partitioning (HTML with both tag types)
         Test data: HTML with one <style> and one <script>
         """
-        styles, scripts = extract_assets(sample_html_with_both)
+        styles, scripts = parsed_html_with_both
 
         assert len(styles) == 1
         assert styles[0].content == ".hero { color: red; }"
@@ -79,28 +173,22 @@ class TestExtractAssetsSingleTags:
 class TestExtractAssetsMultipleTags:
     """Tests for extracting multiple tags of same type."""
 
-    def test_extract_multiple_styles(self):
+    @pytest.mark.parametrize("n", list(_MULTI_STYLE_HTML))
+    def test_extract_multiple_styles(self, n):
         """Multiple <style> tags are all extracted in order.
 
         Purpose: Verify that all <style> tags are captured when multiple
-            exist in the HTML, preserving order.
+            exist in the HTML, preserving order, including longer inputs.
         Category: Normal case
         Target: extract_assets(html)
-        Technique: Equivalence partitioning (multiple same-type tags)
-        Test data: HTML with three <style> tags
+        Technique: Equivalence partitioning (multiple same-type tags),
+            boundary value analysis (tag count)
+        Test data: HTML with 1, 3 and 50 <style> tags
         """
-        html = (
-            "<style>a { color: red; }</style>"
-            "<style>b { color: blue; }</style>"
-            "<style>c { color: green; }</style>"
-        )
-
-        styles, scripts = extract_assets(html)
+        styles, scripts = extract_assets(_MULTI_STYLE_HTML[n])
 
-        assert len(styles) == 3
-        assert styles[0].content == "a { color: red; }"
-        assert styles[1].content == "b { color: blue; }"
-        assert styles[2].content == "c { color: green; }"
+        assert [s.content for s in styles] == [f".tag{i} {{}}" for i in range(n)]
+        assert scripts == []
 
     def test_sequential_same_type_tags(self):
         """Consecutive <style> tags are both extracted individually.
@@ -175,6 +263,61 @@ class TestExtractAssetsSkipBehavior:
         assert scripts[0].content == 'console.log("inline");'
 
 
+# DT-LOADING-STRATEGY rows whose script is extracted: (tag, loading, id).
+# Each body is distinct so a result can only come from its own tag.
+_LOADING_CASES = (
+    ("<script>code(1);</script>", "", "DT1-no-attrs"),
+    ("<script defer>code(2);</script>", "defer", "DT2-defer"),
+    ("<script async>code(3);</script>", "async", "DT3-async"),
+    ("<script async defer>code(4);</script>", "async", "DT4-async-defer-async-wins"),
+    ('<script type="module">code(5);</script>', "module", "DT5-module"),
+    (
+        '<script type="module" async>code(6);</script>',
+        "module-async",
+        "DT6-module-async",
+    ),
+    (
+        '<script type="module" defer>code(7);</script>',
+        "module",
+        "DT7-module-defer-inherently-deferred",
+    ),
+    (
+        '<script type="text/javascript">code(8);</script>',
+        "",
+        "DT8-text-javascript-mime",
+    ),
+    (
+        '<script type="application/javascript">code(9);</script>',
+        "",
+        "DT9-application-javascript-mime",
+    ),
+    (
+        '<script type="module" async defer>code(13);</script>',
+        "module-async",
+        "DT13-module-async-defer",
+    ),
+)
+# DT-LOADING-STRATEGY rows whose script is left inline: (tag, id).
+_NON_JS_CASES = (
+    ('<script type="importmap">{"imports": {}}</script>', "DT10-importmap-skipped"),
+    (
+        '<script type="speculationrules">{"prefetch": []}</script>',
+        "DT11-speculationrules-skipped",
+    ),
+    (
+        '<script type="text/template"><div>template</div></script>',
+        "DT12-text-template-skipped",
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def batched_loading_scripts(extraction_backend):
+    """Scripts extracted from all ``_LOADING_CASES`` tags in a single parse."""
+    _, scripts = extract_assets("".join(tag for tag, _, _ in _LOADING_CASES))
+    return scripts
+
+
 class TestResolveLoadingStrategy:
     """Tests for _resolve_loading_strategy via extract_assets.
 
@@ -198,49 +341,15 @@ class TestResolveLoadingStrategy:
     """
 
     @pytest.mark.parametrize(
-        "tag,expected_loading",
+        "index,expected_loading",
         [
-            pytest.param("<script>code();</script>", "", id="DT1-no-attrs"),
-            pytest.param("<script defer>code();</script>", "defer", id="DT2-defer"),
-            pytest.param("<script async>code();</script>", "async", id="DT3-async"),
-            pytest.param(
-                "<script async defer>code();</script>",
-                "async",
-                id="DT4-async-defer-async-wins",
-            ),
-            pytest.param(
-                '<script type="module">code();</script>',
-                "module",
-                id="DT5-module",
-            ),
-            pytest.param(
-                '<script type="module" async>code();</script>',
-                "module-async",
-                id="DT6-module-async",
-            ),
-            pytest.param(
-                '<script type="module" defer>code();</script>',
-                "module",
-                id="DT7-module-defer-inherently-deferred",
-            ),
-            pytest.param(
-                '<script type="text/javascript">code();</script>',
-                "",
-                id="DT8-text-javascript-mime",
-            ),
-            pytest.param(
-                '<script type="application/javascript">code();</script>',
-                "",
-                id="DT9-application-javascript-mime",
-            ),
-            pytest.param(
-                '<script type="module" async defer>code();</script>',
-                "module-async",
-                id="DT13-module-async-defer",
-            ),
+            pytest.param(i, expected, id=case_id)
+            for i, (_, expected, case_id) in enumerate(_LOADING_CASES)
         ],
     )
-    def test_loading_strategy_for_extracted_scripts(self, tag, expected_loading):
+    def test_loading_strategy_for_extracted_scripts(
+        self, batched_loading_scripts, index, expected_loading
+    ):
         """Correct loading value is set for each script attribute combination (DT-LOADING-STRATEGY).
 
         Purpose: Verify that the correct loading strategy is resolved based on
@@ -248,29 +357,17 @@ class TestResolveLoadingStrategy:
         Category: Normal case
         Target: AssetExtractor._resolve_loading_strategy(attr_dict)
         Technique: Decision table
-        Test data: DT-LOADING-STRATEGY patterns DT1-DT9, DT13
+        Test data: DT-LOADING-STRATEGY patterns DT1-DT9, DT13, parsed as one
+            document
         """
-        _, scripts = extract_assets(tag)
+        script = batched_loading_scripts[index]
 
-        assert len(scripts) == 1
-        assert scripts[0].loading == expected_loading
+        assert len(batched_loading_scripts) == len(_LOADING_CASES)
+        assert f">{script.content}<" in _LOADING_CASES[index][0]
+        assert script.loading == expected_loading
 
     @pytest.mark.parametrize(
-        "tag",
-        [
-            pytest.param(
-                '<script type="importmap">{"imports": {}}</script>',
-                id="DT10-importmap-skipped",
-            ),
-            pytest.param(
-                '<script type="speculationrules">{"prefetch": []}</script>',
-                id="DT11-speculationrules-skipped",
-            ),
-            pytest.param(
-                '<script type="text/template"><div>template</div></script>',
-                id="DT12-text-template-skipped",
-            ),
-        ],
+        "tag", [pytest.param(tag, id=case_id) for tag, case_id in _NON_JS_CASES]
     )
     def test_non_js_type_scripts_not_extracted(self, tag):
         """Non-JS type scripts are excluded from extraction (DT-LOADING-STRATEGY).
@@ -372,117 +469,118 @@ class TestExtractedAssetLoadingField:
 
         assert asset.loading == ""
 
-    def test_extracted_asset_loading_explicit(self):
-        """ExtractedAsset loading field can be set explicitly.
+    @pytest.mark.parametrize(
+        "loading", ["", "defer", "async", "module", "module-async"]
+    )
+    def test_extracted_asset_loading_participates_in_equality(self, loading):
+        """The loading field is stored and takes part in equality.
 
-        Purpose: Verify that the loading field of ExtractedAsset NamedTuple
-            can be explicitly set to a specific value.
+        Purpose: Verify that every loading value can be set explicitly, that
+            assets with the same loading are equal, and that assets differing
+            only in loading are not.
         Category: Normal case
         Target: ExtractedAsset(content, content_hash, loading)
-        Technique: Equivalence partitioning (explicit loading value)
-        Test data: ExtractedAsset with loading="defer"
+        Technique: Equivalence partitioning (each loading strategy)
+        Test data: Every loading value produced by the extractor
         """
-        asset = ExtractedAsset(
-            content="body {}", content_hash="abc12345", loading="defer"
-        )
-
-        assert asset.loading == "defer"
-
-    def test_extracted_asset_equality_with_loading(self):
-        """Two ExtractedAssets with the same loading value are equal.
+        asset = ExtractedAsset(content="x", content_hash="h", loading=loading)
 
-        Purpose: Verify that ExtractedAsset equality works correctly when the
-            loading field is included.
-        Category: Normal case
-        Target: ExtractedAsset equality
-        Technique: Equivalence partitioning
-        Test data: Two instances with identical content, content_hash, and loading
-        """
-        asset1 = ExtractedAsset(content="x", content_hash="h", loading="module")
-        asset2 = ExtractedAsset(content="x", content_hash="h", loading="module")
-
-        assert asset1 == asset2
-
-    def test_extracted_asset_inequality_by_loading(self):
-        """Two ExtractedAssets with different loading values are not equal.
-
-        Purpose: Verify that ExtractedAssets differing only in the loading
-            field are considered unequal.
-        Category: Normal case
-        Target: ExtractedAsset inequality
-        Technique: Equivalence partitioning (different loading values)
-        Test data: Two instances differing only in loading value
-        """
-        asset1 = ExtractedAsset(content="x", content_hash="h", loading="defer")
-        asset2 = ExtractedAsset(content="x", content_hash="h", loading="async")
-
-        assert asset1 != asset2
+        assert asset.loading == loading
+        assert asset == ExtractedAsset(content="x", content_hash="h", loading=loading)
+        assert asset != asset._replace(loading=f"{loading}-other")
 
 
 class TestExtractAssetsEdgeCases:
     """Edge case tests for the extraction pipeline."""
 
-    def test_empty_style_not_extracted(self):
-        """Empty <style></style> produces no extracted asset.
+    @pytest.mark.parametrize(
+        "html",
+        [
+            pytest.param("<style></style>", id="empty-style"),
+            pytest.param("<script></script>", id="empty-script"),
+            pytest.param("<style>   \n\t  </style>", id="whitespace-only-style"),
+            pytest.param("", id="empty-html"),
+            pytest.param("<div><p>Hello World</p></div>", id="no-tags"),
+        ],
+    )
+    def test_extract_returns_empty(self, html):
+        """Empty, whitespace-only or absent tags produce no extracted assets.
 
-        Purpose: Verify that empty style tags are ignored, avoiding creation
-            of empty asset files.
+        Purpose: Verify that empty tags are ignored (avoiding empty asset
+            files), that whitespace-only content is treated as empty after
+            stripping, and that empty input or HTML without extractable
+            tags is handled gracefully.
         Category: Edge case
         Target: extract_assets(html)
-        Technique: Boundary value analysis (empty content)
-        Test data: <style></style> with no content
+        Technique: Boundary value analysis (empty content),
+            equivalence partitioning (no extractable tags)
+        Test data: Empty and whitespace-only tags, empty string, plain HTML
         """
-        html = "<style></style>"
-
         styles, scripts = extract_assets(html)
 
         assert styles == []
+        assert scripts == []
 
-    def test_empty_script_not_extracted(self):
-        """Empty <script></script> produces no extracted asset.
+    def test_html_without_inline_tags_skips_parser(self):
+        """HTML with no <style>/<script> start tag is not parsed at all.
 
-        Purpose: Verify that empty script tags are ignored.
+        Purpose: Verify that the regex pre-check short-circuits extraction
+            for the common case of blocks without inline assets.
         Category: Edge case
         Target: extract_assets(html)
-        Technique: Boundary value analysis (empty content)
-        Test data: <script></script> with no content
+        Technique: Equivalence partitioning (no extractable tags)
+        Test data: Plain HTML mentioning "script" only as text
         """
-        html = "<script></script>"
-
-        styles, scripts = extract_assets(html)
+        with (
+            mock.patch(
+                "wagtail_asset_publisher.extractors._extract_with_html_parser"
+            ) as mock_html_parser,
+            mock.patch(
+                "wagtail_asset_publisher.extractors._extract_with_lexbor"
+            ) as mock_lexbor,
+        ):
+            styles, scripts = extract_assets("<p>A script, not a tag</p>")
 
-        assert scripts == []
+        assert (styles, scripts) == ([], [])
+        mock_html_parser.assert_not_called()
+        mock_lexbor.assert_not_called()
 
-    def test_empty_html_returns_empty(self):
-        """Empty string input returns empty lists for both styles and scripts.
+    def test_parser_reused_without_leaking_state(self):
+        """Consecutive calls share one parser but not its results.
 
-        Purpose: Verify graceful handling of empty input.
+        Purpose: Verify that the html.parser backend reuses the thread's
+            parser instance and that reset() drops assets and any unfinished
+            tag left by the previous document.
         Category: Edge case
-        Target: extract_assets(html)
-        Technique: Boundary value analysis (empty input)
-        Test data: Empty string
+        Target: _extract_with_html_parser(html), AssetExtractor.reset()
+        Technique: State transition (truncated document -> new document)
+        Test data: A document ending inside an open <style>, then a script
         """
-        styles, scripts = extract_assets("")
+        _extract_with_html_parser("<style>a{}</style><style>unfinished")
+        first = _get_extractor()
 
+        styles, scripts = _extract_with_html_parser("<script>b()</script>")
+
+        assert _get_extractor() is first
         assert styles == []
-        assert scripts == []
+        assert [s.content for s in scripts] == ["b()"]
 
-    def test_html_without_any_tags_returns_empty(self):
-        """HTML with no <style> or <script> tags returns empty lists.
+    def test_uppercase_tags_still_extracted(self):
+        """Uppercase tag names pass the pre-check and are extracted.
 
-        Purpose: Verify that normal HTML content without extractable tags
-            returns empty results.
+        Purpose: Verify that the case-insensitive pre-check does not drop
+            tags HTMLParser would otherwise recognise.
         Category: Edge case
         Target: extract_assets(html)
-        Technique: Equivalence partitioning (no extractable tags)
-        Test data: Plain HTML paragraph
+        Technique: Equivalence partitioning (tag name case)
+        Test data: <STYLE> and <Script> tags
         """
-        html = "<div><p>Hello World</p></div>"
+        html = "<STYLE>a{}</STYLE><Script>b()</Script>"
 
         styles, scripts = extract_assets(html)
 
-        assert styles == []
-        assert scripts == []
+        assert [s.content for s in styles] == ["a{}"]
+        assert [s.content for s in scripts] == ["b()"]
 
     def test_whitespace_stripped_from_content(self):
         """Whitespace is stripped from extracted content.
@@ -501,132 +599,296 @@ class TestExtractAssetsEdgeCases:
         assert len(styles) == 1
         assert styles[0].content == "body { color: red; }"
 
-    def test_whitespace_only_style_not_extracted(self):
-        """<style> containing only whitespace is not extracted.
 
-        Purpose: Verify that whitespace-only content is treated as empty
-            after stripping.
-        Category: Edge case
-        Target: extract_assets(html)
-        Technique: Boundary value analysis (whitespace-only content)
-        Test data: <style> with only spaces and newlines
-        """
-        html = "<style>   \n\t  </style>"
+class TestLexborBackend:
+    """Parity of the selectolax/lexbor backend with the html.parser backend."""
 
-        styles, _ = extract_assets(html)
+    @pytest.mark.parametrize(
+        "html",
+        [
+            pytest.param(
+                "<div><style>.a{}</style><script>a()</script></div>",
+                id="fragment",
+            ),
+            pytest.param("<style>.bare{}</style>", id="bare-style-implied-head"),
+            pytest.param(
+                "<html><head><style>h{}</style><script>skip()</script>"
+                "<script data-extract defer>opt()</script></head>"
+                "<body><script data-head>late()</script>"
+                "<script>b()</script></body></html>",
+                id="full-document-head-rules",
+            ),
+            pytest.param(
+                "<style data-no-extract>k{}</style>"
+                '<script src="/x.js"></script>'
+                '<script type="importmap">{}</script>'
+                "<script></script><style>   </style>",
+                id="skipped-tags",
+            ),
+            pytest.param(
+                "".join(tag for tag, _, _ in _LOADING_CASES), id="loading-strategies"
+            ),
+            pytest.param(
+                "<header><script>in_header()</script></header>",
+                id="header-is-not-head",
+            ),
+        ],
+    )
+    def test_matches_html_parser(self, html):
+        """Both backends extract the same assets from the same HTML.
 
-        assert styles == []
+        Purpose: Verify that the lexbor fast path produces exactly what the
+            stdlib AssetExtractor produces, including head/body position,
+            loading strategy and skip rules.
+        Category: Normal case
+        Target: _extract_with_lexbor(html)
+        Technique: Equivalence partitioning (backend parity)
+        Test data: Fragments, full documents and skip-rule cases
+        """
+        pytest.importorskip("selectolax.lexbor")
 
+        assert _extract_with_lexbor(html) == _extract_with_html_parser(html)
 
-class TestComputeContentHash:
-    """Tests for the compute_content_hash utility function."""
+    @pytest.mark.parametrize("html", _LEXBOR_DIVERGENT_CASES)
+    def test_divergent_markup_matches_html_parser(self, html):
+        """Markup lexbor would read differently is extracted as html.parser does.
 
-    def test_content_hash_consistency(self):
-        """Same content always produces same hash.
+        Purpose: Verify that extract_assets falls back to html.parser for
+            input where lexbor normalises or relocates inline content, so
+            the published hashes never depend on the backend.
+        Category: Edge case
+        Target: extract_assets(html) with FAST_PARSER on and off
+        Technique: Error guessing (HTML5 tree-builder differences)
+        Test data: CR/NUL, foreign content, <template>, raw-text elements,
+            script escapes, tags after </head>, unclosed tags
+        """
+        assert extract_assets(html) == _extract_with_html_parser(html)
 
-        Purpose: Verify hash determinism -- the same input must always yield
-            the same output for cache matching to work.
-        Category: Normal case
-        Target: compute_content_hash(content, length)
-        Technique: Equivalence partitioning (deterministic output)
-        Test data: Fixed string computed twice
+    @pytest.mark.parametrize("html", _LEXBOR_DIVERGENT_CASES)
+    def test_extracted_hashes_strip_inline_tags(self, html):
+        """The middleware strips every tag whose asset was extracted.
+
+        Purpose: Verify that hashes computed at extraction time match the
+            ones _TagStripper computes per request, so nothing extractable
+            is left inline next to its published copy (and run twice).
+        Category: Edge case
+        Target: extract_assets(html), _strip_matching_tags(html, ...)
+        Technique: Error guessing (extraction/stripping hash parity)
+        Test data: The same inputs as the divergent-markup parity test
         """
-        content = "body { color: red; }"
+        styles, scripts = extract_assets(html)
 
-        hash1 = compute_content_hash(content)
-        hash2 = compute_content_hash(content)
+        stripped = _strip_matching_tags(
+            html,
+            {asset.content_hash for asset in styles},
+            {asset.content_hash for asset in scripts},
+        )
 
-        assert hash1 == hash2
+        assert _extract_with_html_parser(stripped) == ([], [])
 
-    def test_content_hash_different_for_different_content(self):
-        """Different content produces different hashes.
+    def test_head_only_markup_stays_on_lexbor(self):
+        """A conventional <head> does not force the html.parser fallback.
 
-        Purpose: Verify that hash collisions do not occur for distinct inputs
-            (within practical limits of SHA-256 truncation).
+        Purpose: Verify that the head parity check only rejects markup that
+            lexbor would move out of the head, so typical full pages keep
+            the fast path.
         Category: Normal case
-        Target: compute_content_hash(content, length)
-        Technique: Equivalence partitioning (different inputs)
-        Test data: Two distinct CSS strings
+        Target: _lexbor_may_diverge(html)
+        Technique: Equivalence partitioning (head-only content)
+        Test data: Doctype, meta, title, link, comment, style, scripts and a
+            <noscript><link></noscript> fallback in the head
         """
-        hash1 = compute_content_hash("body { color: red; }")
-        hash2 = compute_content_hash("body { color: blue; }")
+        html = (
+            "<!DOCTYPE html><html lang='en'><head><meta charset='utf-8'>"
+            "<title>T</title><link rel=stylesheet href=a.css><!-- c -->"
+            "<style>h{}</style><script>theme()</script>"
+            "<script data-extract defer>opt()</script>"
+            "<noscript><link rel=stylesheet href=b.css></noscript></head>"
+            "<body><script>b()</script></body></html>"
+        )
 
-        assert hash1 != hash2
+        assert not _lexbor_may_diverge(html)
 
-    def test_content_hash_default_length(self):
-        """Default hash length is 8 characters.
+    def test_fast_parser_is_opt_in(self, monkeypatch):
+        """html.parser stays the backend unless FAST_PARSER is enabled.
 
-        Purpose: Verify the default truncation length matches HASH_LENGTH default.
+        Purpose: Verify that installing selectolax alone does not switch
+            extraction to lexbor.
         Category: Normal case
-        Target: compute_content_hash(content)
-        Technique: Boundary value analysis (default parameter)
-        Test data: Any non-empty string
+        Target: extract_assets(html)
+        Technique: Decision table (FAST_PARSER off)
+        Test data: One style tag with FAST_PARSER=False
         """
-        result = compute_content_hash("test content")
+        monkeypatch.setattr(
+            settings,
+            "WAGTAIL_ASSET_PUBLISHER",
+            {**settings.WAGTAIL_ASSET_PUBLISHER, "FAST_PARSER": False},
+        )
+        with mock.patch(
+            "wagtail_asset_publisher.extractors._extract_with_lexbor"
+        ) as mock_lexbor:
+            styles, _ = extract_assets("<style>.opt-in{}</style>")
+
+        mock_lexbor.assert_not_called()
+        assert [s.content for s in styles] == [".opt-in{}"]
+
+
+_RED_CSS = "body { color: red; }"
+
 
-        assert len(result) == 8
+class TestComputeContentHash:
+    """Tests for the compute_content_hash utility function."""
 
-    def test_content_hash_custom_length(self):
-        """Custom length parameter truncates hash correctly.
+    @pytest.mark.parametrize(
+        ("kwargs", "check"),
+        [
+            pytest.param(
+                {},
+                lambda digest: digest == compute_content_hash(_RED_CSS),
+                id="deterministic",
+            ),
+            pytest.param(
+                {},
+                lambda digest: digest != compute_content_hash("body { color: blue; }"),
+                id="distinct",
+            ),
+            pytest.param({}, lambda digest: len(digest) == 8, id="default-length"),
+            pytest.param(
+                {"length": 12}, lambda digest: len(digest) == 12, id="custom-length"
+            ),
+            pytest.param(
+                {},
+                lambda digest: digest.strip("0123456789abcdef") == "",
+                id="hex",
+            ),
+        ],
+    )
+    def test_content_hash_property(self, kwargs, check):
+        """Hashes are deterministic, distinct, hex and truncated to length.
 
-        Purpose: Verify that the length parameter controls output length.
+        Purpose: Verify that the same input always yields the same hash (so
+            cache matching works), that distinct inputs differ, that output
+            is SHA-256 hex, and that length controls truncation with a
+            default matching the HASH_LENGTH default.
         Category: Normal case
         Target: compute_content_hash(content, length)
-        Technique: Boundary value analysis (non-default parameter)
-        Test data: length=12
+        Technique: Equivalence partitioning, boundary value analysis
+            (default and non-default length)
+        Test data: Two distinct CSS strings, length=12
         """
-        result = compute_content_hash("test content", length=12)
+        digest = compute_content_hash(_RED_CSS, **kwargs)
 
-        assert len(result) == 12
+        assert check(digest), digest
 
-    def test_content_hash_is_hex(self):
-        """Hash output contains only hexadecimal characters.
+    def test_small_bodies_are_memoized(self):
+        """Repeated small bodies hit the LRU; oversized bodies bypass it.
 
-        Purpose: Verify the hash is valid hex (from SHA-256).
-        Category: Normal case
-        Target: compute_content_hash(content)
-        Technique: Error guessing (invalid characters in hash)
-        Test data: Any non-empty string
+        Purpose: Verify that the middleware's per-request hashing of the same
+            inline bodies is served from the cache, and that bodies past the
+            size limit are hashed directly without being retained.
+        Category: Normal case, boundary value
+        Target: compute_content_hash(content, length)
+        Technique: Boundary value analysis (cache size limit)
+        Test data: A short CSS body hashed twice, a 4,096 character body
         """
-        result = compute_content_hash("any content")
+        _cached_content_hash.cache_clear()
+        compute_content_hash("body { color: red; }")
+        compute_content_hash("body { color: red; }")
+        info = _cached_content_hash.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
 
-        assert all(c in "0123456789abcdef" for c in result)
+        large = "a" * 4096
+        assert compute_content_hash(large) == compute_content_hash(large)
+        assert _cached_content_hash.cache_info().currsize == 1
 
 
 class TestExtractedAssetNamedTuple:
     """Tests for the ExtractedAsset NamedTuple."""
 
-    def test_extracted_asset_fields(self):
-        """ExtractedAsset has content and content_hash fields.
+    def test_extracted_asset_contract(self):
+        """ExtractedAsset exposes its fields and compares and hashes by value.
 
-        Purpose: Verify the NamedTuple structure is correct.
+        Purpose: Verify the NamedTuple structure and the equality semantics
+            that test assertions and de-duplication rely on.
         Category: Normal case
         Target: ExtractedAsset
         Technique: Equivalence partitioning
-        Test data: Simple content and hash
+        Test data: Two identical ExtractedAsset instances
         """
-        asset = ExtractedAsset(content="body {}", content_hash="abc12345")
+        asset1 = ExtractedAsset(content="body {}", content_hash="abc12345")
+        asset2 = ExtractedAsset(content="body {}", content_hash="abc12345")
 
-        assert asset.content == "body {}"
-        assert asset.content_hash == "abc12345"
+        assert asset1.content == "body {}"
+        assert asset1.content_hash == "abc12345"
+        assert asset1 == asset2
+        assert hash(asset1) == hash(asset2)
 
-    def test_extracted_asset_equality(self):
-        """Two ExtractedAssets with same fields are equal.
 
-        Purpose: Verify NamedTuple equality semantics for test assertions.
-        Category: Normal case
-        Target: ExtractedAsset
-        Technique: Equivalence partitioning
-        Test data: Two identical ExtractedAsset instances
-        """
-        asset1 = ExtractedAsset(content="body {}", content_hash="abc")
-        asset2 = ExtractedAsset(content="body {}", content_hash="abc")
+class _FakeStreamField:
+    """Stands in for ``wagtail.fields.StreamField`` in isinstance checks."""
 
-        assert asset1 == asset2
+    __slots__ = ("name",)
 
+    def __init__(self, name):
+        self.name = name
 
+
+class _StreamLike:
+    """Stands in for a ``StreamValue``: renders via ``str()``, may be falsy."""
+
+    __slots__ = ("_html", "_truthy")
+
+    def __init__(self, html, truthy=True):
+        self._html = html
+        self._truthy = truthy
+
+    def __str__(self):
+        return self._html
+
+    def __bool__(self):
+        return self._truthy
+
+
+class _StubMeta:
+    __slots__ = ("_fields",)
+
+    def __init__(self, fields):
+        self._fields = fields
+
+    def get_fields(self):
+        return self._fields
+
+
+class _Recorder:
+    """Callable double that returns a fixed value and records its argument."""
+
+    __slots__ = ("calls", "return_value")
+
+    def __init__(self, return_value):
+        self.calls = []
+        self.return_value = return_value
+
+    def __call__(self, arg):
+        self.calls.append(arg)
+        return self.return_value
+
+
+def _stub_page(fields, **values):
+    """Build a page stub whose ``_meta.get_fields()`` returns *fields*."""
+    return SimpleNamespace(_meta=_StubMeta(fields), **values)
+
+
+@pytest.fixture(scope="class")
+def fake_streamfield():
+    """Swap ``wagtail.fields.StreamField`` once for a whole test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(wagtail.fields, "StreamField", _FakeStreamField)
+        yield
+
+
+@pytest.mark.usefixtures("fake_streamfield")
 class TestExtractAssetsFromStreamfields:
-    """Tests for _extract_assets_from_streamfields with mocked Wagtail pages."""
+    """Tests for _extract_assets_from_streamfields with stub Wagtail pages."""
 
     def test_extract_from_streamfield_with_style(self):
         """Page with StreamField containing style tags yields extracted styles.
@@ -636,30 +898,14 @@ class TestExtractAssetsFromStreamfields:
         Category: Normal case
         Target: _extract_assets_from_streamfields(page)
         Technique: Equivalence partitioning (page with StreamField)
-        Test data: Mock page with one StreamField containing HTML with style
+        Test data: Stub page with one StreamField containing HTML with style
         """
-        mock_field = mock.Mock()
-        mock_field.name = "body"
-
-        mock_stream_value = mock.Mock()
-        mock_stream_value.__str__ = mock.Mock(
-            return_value="<style>.hero { color: red; }</style><p>Hello</p>"
+        page = _stub_page(
+            [_FakeStreamField("body")],
+            body=_StreamLike("<style>.hero { color: red; }</style><p>Hello</p>"),
         )
-        mock_stream_value.__bool__ = mock.Mock(return_value=True)
-
-        mock_page = mock.Mock()
-        mock_page._meta.get_fields.return_value = [mock_field]
-        mock_page.body = mock_stream_value
 
-        class FakeStreamFieldMeta(type):
-            def __instancecheck__(cls, instance):
-                return instance is mock_field
-
-        class FakeStreamField(metaclass=FakeStreamFieldMeta):
-            pass
-
-        with mock.patch("wagtail.fields.StreamField", FakeStreamField):
-            styles, scripts = _extract_assets_from_streamfields(mock_page)
+        styles, scripts = _extract_assets_from_streamfields(page)
 
         assert len(styles) == 1
         assert styles[0].content == ".hero { color: red; }"
@@ -672,23 +918,11 @@ class TestExtractAssetsFromStreamfields:
         Category: Edge case
         Target: _extract_assets_from_streamfields(page)
         Technique: Equivalence partitioning (page without StreamField)
-        Test data: Mock page with non-StreamField fields only
+        Test data: Stub page with non-StreamField fields only
         """
-        mock_field = mock.Mock()
-        mock_field.name = "title"
-
-        mock_page = mock.Mock()
-        mock_page._meta.get_fields.return_value = [mock_field]
-
-        class FakeStreamFieldMeta(type):
-            def __instancecheck__(cls, instance):
-                return False
+        page = _stub_page([SimpleNamespace(name="title")], title="<style>x</style>")
 
-        class FakeStreamField(metaclass=FakeStreamFieldMeta):
-            pass
-
-        with mock.patch("wagtail.fields.StreamField", FakeStreamField):
-            styles, scripts = _extract_assets_from_streamfields(mock_page)
+        styles, scripts = _extract_assets_from_streamfields(page)
 
         assert styles == []
         assert scripts == []
@@ -701,27 +935,14 @@ class TestExtractAssetsFromStreamfields:
         Category: Edge case
         Target: _extract_assets_from_streamfields(page)
         Technique: Boundary value analysis (empty StreamField)
-        Test data: Mock page with StreamField returning empty/falsy value
+        Test data: Stub page with StreamField returning empty/falsy value
         """
-        mock_field = mock.Mock()
-        mock_field.name = "body"
-
-        mock_stream_value = mock.Mock()
-        mock_stream_value.__bool__ = mock.Mock(return_value=False)
-
-        mock_page = mock.Mock()
-        mock_page._meta.get_fields.return_value = [mock_field]
-        mock_page.body = mock_stream_value
-
-        class FakeStreamFieldMeta(type):
-            def __instancecheck__(cls, instance):
-                return instance is mock_field
-
-        class FakeStreamField(metaclass=FakeStreamFieldMeta):
-            pass
+        page = _stub_page(
+            [_FakeStreamField("body")],
+            body=_StreamLike("<style>.hero { color: red; }</style>", truthy=False),
+        )
 
-        with mock.patch("wagtail.fields.StreamField", FakeStreamField):
-            styles, scripts = _extract_assets_from_streamfields(mock_page)
+        styles, scripts = _extract_assets_from_streamfields(page)
 
         assert styles == []
         assert scripts == []
@@ -739,11 +960,35 @@ class TestExtractAssetsFromPage:
     | DT3 | False                  | N/A                     | StreamField-only extraction  |
     """
 
-    @mock.patch("wagtail_asset_publisher.extractors.render_page_html")
-    @mock.patch("wagtail_asset_publisher.conf.get_setting")
-    def test_template_extraction_when_enabled_and_render_succeeds(
-        self, mock_get_setting, mock_render
-    ):
+    @pytest.fixture
+    def stub_pipeline(self, monkeypatch):
+        """Set EXTRACT_FROM_TEMPLATES; record the renderer and StreamField scan."""
+
+        def install(*, extract_from_templates, rendered="", streamfield=([], [])):
+            render = _Recorder(rendered)
+            scan = _Recorder(streamfield)
+            # Override this one key; FAST_PARSER and the rest keep the values
+            # chosen by extraction_backend and the test settings.
+            monkeypatch.setattr(
+                settings,
+                "WAGTAIL_ASSET_PUBLISHER",
+                {
+                    **settings.WAGTAIL_ASSET_PUBLISHER,
+                    "EXTRACT_FROM_TEMPLATES": extract_from_templates,
+                },
+            )
+            monkeypatch.setattr(
+                "wagtail_asset_publisher.extractors.render_page_html", render
+            )
+            monkeypatch.setattr(
+                "wagtail_asset_publisher.extractors._extract_assets_from_streamfields",
+                scan,
+            )
+            return render, scan
+
+        return install
+
+    def test_template_extraction_when_enabled_and_render_succeeds(self, stub_pipeline):
         """Full HTML extraction is used when EXTRACT_FROM_TEMPLATES=True and render succeeds (DT1).
 
         Purpose: Verify that extract_assets_from_page uses the full rendered HTML
@@ -752,29 +997,27 @@ class TestExtractAssetsFromPage:
         Category: Normal case
         Target: extract_assets_from_page(page)
         Technique: Decision table (DT-EXTRACT-MODE DT1)
-        Test data: Mock page with rendered HTML containing style and script tags
+        Test data: Opaque page with rendered HTML containing style and script tags
         """
-        mock_get_setting.return_value = True
-        mock_render.return_value = (
-            "<html><head><style>body{color:red}</style></head>"
-            "<body><script>alert(1);</script></body></html>"
+        render, scan = stub_pipeline(
+            extract_from_templates=True,
+            rendered=(
+                "<html><head><style>body{color:red}</style></head>"
+                "<body><script>alert(1);</script></body></html>"
+            ),
         )
-        mock_page = mock.Mock()
+        page = object()
 
-        styles, scripts = extract_assets_from_page(mock_page)
+        styles, scripts = extract_assets_from_page(page)
 
-        mock_render.assert_called_once_with(mock_page)
+        assert render.calls == [page]
+        assert scan.calls == []
         assert len(styles) == 1
         assert styles[0].content == "body{color:red}"
         assert len(scripts) == 1
         assert scripts[0].content == "alert(1);"
 
-    @mock.patch("wagtail_asset_publisher.extractors._extract_assets_from_streamfields")
-    @mock.patch("wagtail_asset_publisher.extractors.render_page_html")
-    @mock.patch("wagtail_asset_publisher.conf.get_setting")
-    def test_fallback_to_streamfield_when_render_returns_empty(
-        self, mock_get_setting, mock_render, mock_sf_extract
-    ):
+    def test_fallback_to_streamfield_when_render_returns_empty(self, stub_pipeline):
         """Falls back to StreamField extraction when render returns empty (DT2).
 
         Purpose: Verify that extract_assets_from_page falls back to
@@ -783,24 +1026,22 @@ class TestExtractAssetsFromPage:
         Category: Error case
         Target: extract_assets_from_page(page)
         Technique: Decision table (DT-EXTRACT-MODE DT2)
-        Test data: Mock page where render_page_html returns ""
+        Test data: Opaque page where render_page_html returns ""
         """
-        mock_get_setting.return_value = True
-        mock_render.return_value = ""
         expected_styles = [ExtractedAsset(content="sf{}", content_hash="sf123")]
-        mock_sf_extract.return_value = (expected_styles, [])
-        mock_page = mock.Mock()
+        render, scan = stub_pipeline(
+            extract_from_templates=True, streamfield=(expected_styles, [])
+        )
+        page = object()
 
-        styles, scripts = extract_assets_from_page(mock_page)
+        styles, scripts = extract_assets_from_page(page)
 
-        mock_render.assert_called_once_with(mock_page)
-        mock_sf_extract.assert_called_once_with(mock_page)
+        assert render.calls == [page]
+        assert scan.calls == [page]
         assert styles == expected_styles
         assert scripts == []
 
-    @mock.patch("wagtail_asset_publisher.extractors._extract_assets_from_streamfields")
-    @mock.patch("wagtail_asset_publisher.conf.get_setting")
-    def test_streamfield_only_when_disabled(self, mock_get_setting, mock_sf_extract):
+    def test_streamfield_only_when_disabled(self, stub_pipeline):
         """StreamField-only extraction is used when EXTRACT_FROM_TEMPLATES=False (DT3).
 
         Purpose: Verify that extract_assets_from_page uses only StreamField
@@ -809,18 +1050,20 @@ class TestExtractAssetsFromPage:
         Category: Normal case
         Target: extract_assets_from_page(page)
         Technique: Decision table (DT-EXTRACT-MODE DT3)
-        Test data: Mock page with EXTRACT_FROM_TEMPLATES=False
+        Test data: Opaque page with EXTRACT_FROM_TEMPLATES=False
         """
-        mock_get_setting.return_value = False
         expected_scripts = [
             ExtractedAsset(content="console.log(1);", content_hash="js123")
         ]
-        mock_sf_extract.return_value = ([], expected_scripts)
-        mock_page = mock.Mock()
+        render, scan = stub_pipeline(
+            extract_from_templates=False, streamfield=([], expected_scripts)
+        )
+        page = object()
 
-        styles, scripts = extract_assets_from_page(mock_page)
+        styles, scripts = extract_assets_from_page(page)
 
-        mock_sf_extract.assert_called_once_with(mock_page)
+        assert render.calls == []
+        assert scan.calls == [page]
         assert styles == []
         assert scripts == expected_scripts
 
@@ -1,6 +1,6 @@
 """Tests for wagtail_hooks module."""
 
-from django.http import HttpRequest
+from types import SimpleNamespace
 
 from wagtail_asset_publisher.wagtail_hooks import set_page_on_request
 
@@ -10,7 +10,7 @@ class TestSetPageOnRequest:
 
     def test_sets_wagtailpage_attribute(self):
         """Hook sets request.wagtailpage to the served page."""
-        request = HttpRequest()
+        request = SimpleNamespace()
         page = object()
 
         result = set_page_on_request(page, request, args=(), kwargs={})
@@ -20,8 +20,7 @@ class TestSetPageOnRequest:
 
     def test_overwrites_existing_attribute(self):
         """Hook overwrites any pre-existing wagtailpage attribute."""
-        request = HttpRequest()
-        request.wagtailpage = "old"
+        request = SimpleNamespace(wagtailpage="old")
         page = object()
 
         set_page_on_request(page, request, args=(), kwargs={})
@@ -7,10 +7,48 @@ Verifies the command correctly resolves pages, handles --all / --page-ids
 from __future__ import annotations
 
 from io import StringIO
+from types import SimpleNamespace
 from unittest import mock
 
+import pytest
+
 from wagtail_asset_publisher.management.commands.rebuild_assets import Command
 
+# handle() only styles its summary line; pass text through unstyled.
+_PLAIN_STYLE = SimpleNamespace(SUCCESS=str)
+
+# Read-only page stubs; the command only reads ``pk`` and ``title``.
+_PAGES = tuple(SimpleNamespace(pk=i, title=f"Page {i}") for i in range(1, 4))
+
+
+@pytest.fixture
+def mock_page_cls(monkeypatch):
+    """``Page`` in the rebuild_assets command; matches no pages by default."""
+    page_cls = mock.Mock()
+    page_cls.objects.filter.return_value.specific.return_value = []
+    monkeypatch.setattr(
+        "wagtail_asset_publisher.management.commands.rebuild_assets.Page", page_cls
+    )
+    return page_cls
+
+
+@pytest.fixture
+def mock_build(monkeypatch):
+    """``build_page_assets``, imported lazily by the command from utils."""
+    build = mock.Mock()
+    monkeypatch.setattr("wagtail_asset_publisher.utils.build_page_assets", build)
+    return build
+
+
+@pytest.fixture
+def mock_published_asset(monkeypatch):
+    """``PublishedAsset``, imported lazily by the command from models."""
+    published_asset = mock.Mock()
+    monkeypatch.setattr(
+        "wagtail_asset_publisher.models.PublishedAsset", published_asset
+    )
+    return published_asset
+
 
 class TestRebuildAssetsCommand:
     def _run_command(self, **options):
@@ -18,8 +56,7 @@ class TestRebuildAssetsCommand:
         cmd = Command()
         cmd.stdout = StringIO()
         cmd.stderr = StringIO()
-        cmd.style = mock.Mock()
-        cmd.style.SUCCESS = lambda x: x
+        cmd.style = _PLAIN_STYLE
         defaults = {
             "page_ids": None,
             "rebuild_all": False,
@@ -29,8 +66,6 @@ class TestRebuildAssetsCommand:
         cmd.handle(**defaults)
         return cmd.stdout.getvalue(), cmd.stderr.getvalue()
 
-    @mock.patch("wagtail_asset_publisher.utils.build_page_assets")
-    @mock.patch("wagtail_asset_publisher.management.commands.rebuild_assets.Page")
     def test_rebuild_specific_pages(self, mock_page_cls, mock_build):
         """--page-ids 1 2 rebuilds only those specific pages.
 
@@ -41,8 +76,7 @@ class TestRebuildAssetsCommand:
         Technique: Equivalence partitioning
         Test data: Two specific page IDs
         """
-        page1 = mock.Mock(pk=1, title="Page 1")
-        page2 = mock.Mock(pk=2, title="Page 2")
+        page1, page2 = _PAGES[:2]
         mock_page_cls.objects.filter.return_value.specific.return_value = [page1, page2]
 
         stdout, stderr = self._run_command(page_ids=[1, 2])
@@ -53,8 +87,6 @@ class TestRebuildAssetsCommand:
         mock_build.assert_any_call(page2)
         assert "Rebuilt: 2" in stdout
 
-    @mock.patch("wagtail_asset_publisher.utils.build_page_assets")
-    @mock.patch("wagtail_asset_publisher.management.commands.rebuild_assets.Page")
     def test_rebuild_all_live_pages(self, mock_page_cls, mock_build):
         """--all rebuilds assets for ALL live pages.
 
@@ -65,7 +97,7 @@ class TestRebuildAssetsCommand:
         Technique: Equivalence partitioning
         Test data: Three live pages
         """
-        pages = [mock.Mock(pk=i, title=f"Page {i}") for i in range(1, 4)]
+        pages = _PAGES
         mock_page_cls.objects.filter.return_value.specific.return_value = pages
 
         stdout, _ = self._run_command(rebuild_all=True)
@@ -74,11 +106,6 @@ class TestRebuildAssetsCommand:
         assert mock_build.call_count == 3
         assert "Rebuilt: 3" in stdout
 
-    @mock.patch("wagtail_asset_publisher.utils.build_page_assets")
-    @mock.patch("wagtail_asset_publisher.management.commands.rebuild_assets.Page")
-    @mock.patch(
-        "wagtail_asset_publisher.models.PublishedAsset",
-    )
     def test_rebuild_existing_assets_only(
         self, mock_published_asset, mock_page_cls, mock_build
     ):
@@ -96,8 +123,7 @@ class TestRebuildAssetsCommand:
             2,
         ]
 
-        page1 = mock.Mock(pk=1, title="Page 1")
-        page2 = mock.Mock(pk=2, title="Page 2")
+        page1, page2 = _PAGES[:2]
         mock_page_cls.objects.filter.return_value.specific.return_value = [page1, page2]
 
         stdout, _ = self._run_command()
@@ -105,8 +131,6 @@ class TestRebuildAssetsCommand:
         assert mock_build.call_count == 2
         assert "Rebuilt: 2" in stdout
 
-    @mock.patch("wagtail_asset_publisher.utils.build_page_assets")
-    @mock.patch("wagtail_asset_publisher.management.commands.rebuild_assets.Page")
     def test_dry_run_no_actual_build(self, mock_page_cls, mock_build):
         """--dry-run shows what would be rebuilt without calling build_page_assets.
 
@@ -117,7 +141,7 @@ class TestRebuildAssetsCommand:
         Technique: Equivalence partitioning
         Test data: Two pages in dry-run mode
         """
-        pages = [mock.Mock(pk=i, title=f"Page {i}") for i in range(1, 3)]
+        pages = _PAGES[:2]
         mock_page_cls.objects.filter.return_value.specific.return_value = pages
 
         stdout, _ = self._run_command(page_ids=[1, 2], dry_run=True)
@@ -126,8 +150,6 @@ class TestRebuildAssetsCommand:
         assert "[DRY RUN]" in stdout
         assert "Rebuilt: 2" in stdout
 
-    @mock.patch("wagtail_asset_publisher.utils.build_page_assets")
-    @mock.patch("wagtail_asset_publisher.management.commands.rebuild_assets.Page")
     def test_error_handling_continues(self, mock_page_cls, mock_build):
         """Build error for one page doesn't stop processing others.
 
@@ -138,9 +160,9 @@ class TestRebuildAssetsCommand:
         Technique: Error guessing
         Test data: Three pages where the second raises an exception
         """
-        page1 = mock.Mock(pk=1, title="Page 1")
-        page2 = mock.Mock(pk=2, title="Page 2 (error)")
-        page3 = mock.Mock(pk=3, title="Page 3")
+        page1 = SimpleNamespace(pk=1, title="Page 1")
+        page2 = SimpleNamespace(pk=2, title="Page 2 (error)")
+        page3 = SimpleNamespace(pk=3, title="Page 3")
         mock_page_cls.objects.filter.return_value.specific.return_value = [
             page1,
             page2,
@@ -156,8 +178,6 @@ class TestRebuildAssetsCommand:
         assert "Errors: 1" in stdout
         assert "ERROR" in stderr
 
-    @mock.patch("wagtail_asset_publisher.utils.build_page_assets")
-    @mock.patch("wagtail_asset_publisher.management.commands.rebuild_assets.Page")
     def test_output_messages_correct(self, mock_page_cls, mock_build):
         """Correct stdout messages for rebuilt/error counts.
 
@@ -168,7 +188,7 @@ class TestRebuildAssetsCommand:
         Technique: Statement coverage (C0)
         Test data: Two pages, both successful
         """
-        pages = [mock.Mock(pk=i, title=f"Page {i}") for i in range(1, 3)]
+        pages = _PAGES[:2]
         mock_page_cls.objects.filter.return_value.specific.return_value = pages
 
         stdout, stderr = self._run_command(page_ids=[1, 2])
@@ -178,8 +198,6 @@ class TestRebuildAssetsCommand:
         assert "Done. Rebuilt: 2, Errors: 0" in stdout
         assert stderr == ""
 
-    @mock.patch("wagtail_asset_publisher.utils.build_page_assets")
-    @mock.patch("wagtail_asset_publisher.management.commands.rebuild_assets.Page")
     def test_empty_page_set(self, mock_page_cls, mock_build):
         """Command handles empty page set gracefully.
 
@@ -190,8 +208,6 @@ class TestRebuildAssetsCommand:
         Technique: Boundary value analysis (zero pages)
         Test data: No matching pages
         """
-        mock_page_cls.objects.filter.return_value.specific.return_value = []
-
         stdout, _ = self._run_command(page_ids=[999])
 
         mock_build.assert_not_called()
@@ -199,8 +215,14 @@ class TestRebuildAssetsCommand:
         assert "Rebuilt: 0, Errors: 0" in stdout
 
 
+@pytest.fixture(scope="module")
+def cmd():
+    """One shared Command; _resolve_pages keeps no state on it."""
+    return Command()
+
+
 class TestResolvePages:
-    def test_page_ids_filters_by_ids_and_live(self):
+    def test_page_ids_filters_by_ids_and_live(self, cmd, mock_page_cls):
         """_resolve_pages with page_ids filters by pk__in and live=True.
 
         Purpose: Verify that _resolve_pages applies both pk and live filters
@@ -210,18 +232,11 @@ class TestResolvePages:
         Technique: Equivalence partitioning
         Test data: Page IDs [1, 2]
         """
-        cmd = Command()
-
-        with mock.patch(
-            "wagtail_asset_publisher.management.commands.rebuild_assets.Page"
-        ) as mock_page_cls:
-            mock_page_cls.objects.filter.return_value.specific.return_value = []
-
-            cmd._resolve_pages([1, 2], False)
+        cmd._resolve_pages([1, 2], False)
 
         mock_page_cls.objects.filter.assert_called_once_with(pk__in=[1, 2], live=True)
 
-    def test_rebuild_all_filters_live_only(self):
+    def test_rebuild_all_filters_live_only(self, cmd, mock_page_cls):
         """_resolve_pages with rebuild_all=True filters only by live=True.
 
         Purpose: Verify that _resolve_pages with rebuild_all flag fetches
@@ -231,19 +246,13 @@ class TestResolvePages:
         Technique: Equivalence partitioning
         Test data: No page_ids, rebuild_all=True
         """
-        cmd = Command()
-
-        with mock.patch(
-            "wagtail_asset_publisher.management.commands.rebuild_assets.Page"
-        ) as mock_page_cls:
-            mock_page_cls.objects.filter.return_value.specific.return_value = []
-
-            cmd._resolve_pages(None, True)
+        cmd._resolve_pages(None, True)
 
         mock_page_cls.objects.filter.assert_called_once_with(live=True)
 
-    @mock.patch("wagtail_asset_publisher.models.PublishedAsset")
-    def test_default_mode_uses_published_asset_ids(self, mock_published_asset):
+    def test_default_mode_uses_published_asset_ids(
+        self, cmd, mock_page_cls, mock_published_asset
+    ):
         """Default _resolve_pages uses PublishedAsset page IDs.
 
         Purpose: Verify that _resolve_pages without page_ids or rebuild_all
@@ -253,17 +262,11 @@ class TestResolvePages:
         Technique: Equivalence partitioning
         Test data: PublishedAsset records for pages 1 and 2
         """
-        cmd = Command()
         mock_published_asset.objects.values_list.return_value.distinct.return_value = [
             1,
             2,
         ]
 
-        with mock.patch(
-            "wagtail_asset_publisher.management.commands.rebuild_assets.Page"
-        ) as mock_page_cls:
-            mock_page_cls.objects.filter.return_value.specific.return_value = []
-
-            cmd._resolve_pages(None, False)
+        cmd._resolve_pages(None, False)
 
         mock_page_cls.objects.filter.assert_called_once_with(pk__in=[1, 2], live=True)
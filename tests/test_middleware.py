@@ -6,25 +6,36 @@ _escape_attr, _minify_html), invalidate_cache, and script loading
 attribute injection.
 """
 
+import asyncio
 import logging
 import sys
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.http import HttpResponse
 
+from wagtail_asset_publisher import middleware
 from wagtail_asset_publisher.extractors import compute_content_hash
 from wagtail_asset_publisher.middleware import (
     _JS_LOADING_ATTRS,
     _JS_LOADING_ORDER,
     CACHE_KEY_PREFIX,
     CACHE_TIMEOUT,
+    AssetPublisherCombinedMiddleware,
     AssetPublisherMiddleware,
+    _asset_version,
     _escape_attr,
+    _find_anchors,
     _get_page,
+    _get_page_assets,
     _get_published_assets,
     _is_preview_request,
     _minify_html,
     _process_html,
+    _splice_html_bytes,
     _strip_matching_tags,
     invalidate_cache,
 )
@@ -156,7 +167,8 @@ class TestGetPublishedAssets:
     """Tests for _get_published_assets with mocked DB and cache."""
 
     @mock.patch("wagtail_asset_publisher.middleware.cache")
-    def test_returns_cached_assets(self, mock_cache):
+    @mock.patch("wagtail_asset_publisher.models.PublishedAsset")
+    def test_returns_cached_assets(self, MockPublishedAsset, mock_cache):
         """Returns cached assets without DB query when cache hit.
 
         Purpose: Verify that the cache is checked first and DB is not queried
@@ -164,21 +176,27 @@ class TestGetPublishedAssets:
         Category: Normal case
         Target: _get_published_assets(page_id)
         Technique: Equivalence partitioning (cache hit)
-        Test data: Pre-populated cache entry
+        Test data: Pre-populated cache entry under the page's current version
         """
         cached_data = {
             "css": {"url": "https://cdn/a.css", "content_hashes": {"hash1"}},
         }
-        mock_cache.get.return_value = cached_data
+        mock_cache.get.side_effect = {
+            f"{CACHE_KEY_PREFIX}ver:42": 3,
+            f"{CACHE_KEY_PREFIX}42:v3": cached_data,
+        }.get
 
         result = _get_published_assets(42)
 
         assert result == cached_data
-        mock_cache.get.assert_called_once_with(f"{CACHE_KEY_PREFIX}42")
+        MockPublishedAsset.objects.filter.assert_not_called()
 
+    @mock.patch("wagtail_asset_publisher.middleware.time.time_ns")
     @mock.patch("wagtail_asset_publisher.middleware.cache")
     @mock.patch("wagtail_asset_publisher.models.PublishedAsset")
-    def test_queries_db_on_cache_miss_css(self, MockPublishedAsset, mock_cache):
+    def test_queries_db_on_cache_miss_css(
+        self, MockPublishedAsset, mock_cache, mock_time_ns
+    ):
         """Queries DB and populates cache on cache miss (CSS).
 
         Purpose: Verify that a cache miss triggers a DB lookup and the
@@ -189,6 +207,7 @@ class TestGetPublishedAssets:
         Test data: Empty cache, one CSS asset in DB
         """
         mock_cache.get.return_value = None
+        mock_time_ns.return_value = 1_700_000_000_000_000_000
 
         mock_asset = mock.Mock()
         mock_asset.asset_type = "css"
@@ -201,8 +220,12 @@ class TestGetPublishedAssets:
         assert "css" in result
         assert result["css"]["url"] == "https://cdn/b.css"
         assert result["css"]["content_hashes"] == {"hash1", "hash2"}
+        assert result["injection"] == (
+            '<link rel="stylesheet" href="https://cdn/b.css">\n',
+            "",
+        )
         mock_cache.set.assert_called_once_with(
-            f"{CACHE_KEY_PREFIX}42", result, CACHE_TIMEOUT
+            f"{CACHE_KEY_PREFIX}42:v1700000000000000000", result, CACHE_TIMEOUT
         )
 
     @mock.patch("wagtail_asset_publisher.middleware.cache")
@@ -303,6 +326,270 @@ class TestGetPublishedAssets:
         assert result == {}
 
 
+class TestLocalAssetCache:
+    """Tests for the process-local LRU in front of the shared cache."""
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_shared_published_assets")
+    def test_local_hit_skips_shared_cache(self, mock_shared):
+        """A second lookup at the same asset version is served locally.
+
+        Purpose: Verify that repeated lookups for the same (page, version)
+            do not reach the shared asset entry again.
+        Category: Normal case
+        Target: _get_published_assets(page_id)
+        Technique: State transition (miss -> hit)
+        Test data: Shared cache entry for page 42
+        """
+        cached_data = {"css": {"url": "https://cdn/a.css", "content_hashes": set()}}
+        mock_shared.return_value = cached_data
+
+        first = _get_published_assets(42)
+        second = _get_published_assets(42)
+
+        assert first is second
+        mock_shared.assert_called_once()
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_shared_published_assets")
+    def test_version_bump_elsewhere_misses_local_cache(self, mock_shared):
+        """A version bumped by another process bypasses the local entry.
+
+        Purpose: Verify that a rebuild published from another process
+            (e.g. a snippet publish, which creates no page revision) is
+            picked up on the next request, before the replaced files are
+            referenced again.
+        Category: Normal case
+        Target: _get_published_assets(page_id)
+        Technique: State transition (hit -> version bumped -> miss)
+        Test data: Page 42, version key incremented directly in the cache
+        """
+        mock_shared.return_value = {}
+
+        _get_published_assets(42)
+        cache.incr(f"{CACHE_KEY_PREFIX}ver:42")
+        _get_published_assets(42)
+
+        assert mock_shared.call_count == 2
+        assert len({c.args[1] for c in mock_shared.call_args_list}) == 2
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_shared_published_assets")
+    def test_invalidate_cache_drops_local_entries(self, mock_shared):
+        """invalidate_cache removes every local entry for the page.
+
+        Purpose: Verify that the publishing process sees new assets
+            immediately after invalidation.
+        Category: Normal case
+        Target: invalidate_cache(page_id)
+        Technique: State transition (hit -> invalidated -> miss)
+        Test data: Local entries for page 42 and page 43
+        """
+        mock_shared.return_value = {}
+        _get_published_assets(42)
+        _get_published_assets(43)
+
+        invalidate_cache(42)
+        _get_published_assets(42)
+        _get_published_assets(43)
+
+        assert mock_shared.call_count == 3
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_shared_published_assets")
+    def test_hashes_shared_across_pages(self, mock_shared):
+        """Equal content hashes on different pages are the same object.
+
+        Purpose: Verify that hashes are interned on local cache fill, so a
+            snippet reused across pages is held once.
+        Category: Normal case
+        Target: _get_published_assets(page_id)
+        Technique: Equivalence partitioning (shared snippet)
+        Test data: Pages 42 and 43 whose CSS and JS share one hash, built
+            from distinct string objects
+        """
+        shared = "ab12" * 2
+
+        def load(page_id, version):
+            return {
+                "css": {"url": "/a.css", "content_hashes": {"".join(shared)}},
+                "js": [{"url": "/a.js", "content_hashes": {"".join(shared)}}],
+            }
+
+        mock_shared.side_effect = load
+
+        first = _get_published_assets(42)
+        second = _get_published_assets(43)
+
+        (css_hash,) = first["css"]["content_hashes"]
+        (js_hash,) = second["js"][0]["content_hashes"]
+        assert css_hash is js_hash
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_published_assets")
+    def test_page_instance_memo(self, mock_get_assets):
+        """A reused page instance is served from its own memo.
+
+        Purpose: Verify that the second lookup on the same page object
+            skips the LRU, while a fresh instance of the page does not.
+        Category: Normal case
+        Target: _get_page_assets(page)
+        Technique: State transition (miss -> hit)
+        Test data: Two lookups on one page instance, one on a copy
+        """
+        mock_get_assets.return_value = {}
+        page = SimpleNamespace(pk=42)
+
+        _get_page_assets(page)
+        _get_page_assets(page)
+        _get_page_assets(SimpleNamespace(pk=42))
+
+        assert mock_get_assets.call_count == 2
+        mock_get_assets.assert_called_with(42, _asset_version(42))
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_published_assets")
+    def test_page_instance_memo_dropped_on_invalidate(self, mock_get_assets):
+        """invalidate_cache makes memoized page instances look up again.
+
+        Purpose: Verify that a long-lived page instance picks up newly
+            published assets in the publishing process.
+        Category: Normal case
+        Target: _get_page_assets(page), invalidate_cache(page_id)
+        Technique: State transition (hit -> invalidated -> miss)
+        Test data: One page instance, invalidation in between lookups
+        """
+        mock_get_assets.return_value = {}
+        page = SimpleNamespace(pk=42)
+
+        _get_page_assets(page)
+        invalidate_cache(42)
+        _get_page_assets(page)
+
+        assert mock_get_assets.call_count == 2
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_published_assets")
+    def test_page_instance_memo_follows_shared_version(self, mock_get_assets):
+        """A version bumped by another process makes the memo look up again.
+
+        Purpose: Verify that a long-lived page instance does not keep
+            serving asset URLs replaced by a rebuild in another process.
+        Category: Normal case
+        Target: _get_page_assets(page)
+        Technique: State transition (hit -> version bumped -> miss)
+        Test data: One page instance, version key incremented directly
+        """
+        mock_get_assets.return_value = {}
+        page = SimpleNamespace(pk=42)
+
+        _get_page_assets(page)
+        cache.incr(f"{CACHE_KEY_PREFIX}ver:42")
+        _get_page_assets(page)
+
+        assert mock_get_assets.call_count == 2
+
+
+class TestFindAnchors:
+    """Tests for _find_anchors injection point lookup."""
+
+    @pytest.mark.parametrize(
+        ("doc", "expected"),
+        [
+            pytest.param("<head></head><body></body>", (6, 19), id="FA1-well-formed"),
+            pytest.param("<body></body>", (-1, 6), id="FA2-no-head"),
+            pytest.param("<head></head>", (6, -1), id="FA3-no-body"),
+            pytest.param("<body></body></body>", (-1, 6), id="FA4-first-body-wins"),
+            pytest.param(
+                "</body><head></head>", (13, 0), id="FA5-stray-body-before-head"
+            ),
+        ],
+    )
+    def test_offsets(self, doc, expected):
+        """First </head> and </body> offsets match str.find semantics.
+
+        Purpose: Verify that the single forward scan finds the same
+            injection points as independent searches from the start.
+        Category: Normal case
+        Target: _find_anchors(doc, head_marker, body_marker)
+        Technique: Equivalence partitioning (marker layout)
+        Test data: Documents with present, missing, repeated and
+            out-of-order markers
+        """
+        assert _find_anchors(doc, "</head>", "</body>") == expected
+        assert _find_anchors(doc.encode(), b"</head>", b"</body>") == expected
+        assert expected == (doc.find("</head>"), doc.find("</body>"))
+
+
+class TestSpliceHtmlBytes:
+    """Tests for the byte-level injection fast path."""
+
+    _HTML = b"<html><head><title>t</title></head><body><p>x</p></body></html>"
+    _ASSETS = {
+        "css": {"url": "/a.css", "content_hashes": set()},
+        "js": [
+            {
+                "url": "/a.js",
+                "content_hashes": set(),
+                "loading": "defer",
+                "position": "body",
+            }
+        ],
+    }
+
+    @mock.patch("wagtail_asset_publisher.conf.get_setting", return_value=False)
+    def test_matches_text_processing(self, mock_get_setting):
+        """Byte splicing yields the same body as the decode/inject path.
+
+        Purpose: Verify the fast path is a drop-in replacement for
+            _process_html when nothing needs stripping.
+        Category: Normal case
+        Target: _splice_html_bytes(raw, charset, assets)
+        Technique: Equivalence partitioning (UTF-8, minification off)
+        Test data: HTML with </head> and </body>, CSS and deferred JS assets
+        """
+        result = _splice_html_bytes(self._HTML, "utf-8", self._ASSETS)
+
+        expected = _process_html(self._HTML.decode(), self._ASSETS).encode()
+        assert result == expected
+
+    @mock.patch("wagtail_asset_publisher.conf.get_setting", return_value=False)
+    def test_no_assets_returns_body_unchanged(self, mock_get_setting):
+        """Without assets the original bytes object is returned.
+
+        Purpose: Verify that non-asset pages are not copied at all.
+        Category: Edge case
+        Target: _splice_html_bytes(raw, charset, assets)
+        Technique: Boundary value analysis (empty assets)
+        Test data: Empty assets dict
+        """
+        assert _splice_html_bytes(self._HTML, "utf-8", {}) is self._HTML
+
+    @pytest.mark.parametrize(
+        ("minify", "charset", "html", "hashes"),
+        [
+            pytest.param(True, "utf-8", _HTML, set(), id="SB1-minify-enabled"),
+            pytest.param(False, "shift_jis", _HTML, set(), id="SB2-non-utf8"),
+            pytest.param(
+                False,
+                "utf-8",
+                _HTML.replace(b"<p>", b"<style>p{}</style><p>"),
+                {"abc"},
+                id="SB3-strip-needed",
+            ),
+        ],
+    )
+    def test_falls_back_to_text_processing(self, minify, charset, html, hashes):
+        """Cases the byte path cannot handle return None.
+
+        Purpose: Verify the caller falls back to decoding whenever the body
+            must be minified, is not UTF-8, or may contain tags to strip.
+        Category: Edge case
+        Target: _splice_html_bytes(raw, charset, assets)
+        Technique: Decision table
+        Test data: Minification on, Shift_JIS charset, inline <style> tag
+        """
+        assets = {"css": {"url": "/a.css", "content_hashes": hashes}}
+
+        with mock.patch(
+            "wagtail_asset_publisher.conf.get_setting", return_value=minify
+        ):
+            assert _splice_html_bytes(html, charset, assets) is None
+
+
 class TestProcessHtml:
     """Tests for _process_html: stripping and injection logic."""
 
@@ -381,6 +668,48 @@ class TestProcessHtml:
         assert '<link rel="stylesheet" href="https://cdn/p.css">' in result
         assert '<script src="https://cdn/p.js"></script>' in result
 
+    def test_prerendered_injection_used_verbatim(self):
+        """Pre-rendered injection blocks from the cache are spliced as-is.
+
+        Purpose: Verify that _process_html reuses the "injection" blocks
+            rendered by _get_published_assets instead of re-rendering tags.
+        Category: Normal case
+        Target: _process_html(html, assets)
+        Technique: Equivalence partitioning (cached injection present)
+        Test data: Assets whose "injection" differs from what the URLs would render
+        """
+        html = "<html><head></head><body></body></html>"
+        assets = {
+            "css": {"url": "https://cdn/p.css", "content_hashes": set()},
+            "injection": ("<!-- head -->\n", "<!-- body -->\n"),
+        }
+
+        result = _process_html(html, assets)
+
+        assert result == (
+            "<html><head><!-- head -->\n</head><body><!-- body -->\n</body></html>"
+        )
+
+    @mock.patch("wagtail_asset_publisher.middleware._strip_matching_tags")
+    def test_strip_skipped_without_inline_tags(self, mock_strip):
+        """The tag-stripping parse is skipped when no inline tags are present.
+
+        Purpose: Verify that HTML without any <style>/<script> tag is not
+            run through _strip_matching_tags.
+        Category: Normal case
+        Target: _process_html(html, assets)
+        Technique: Decision coverage (C1) - no inline tag branch
+        Test data: HTML without inline tags, CSS asset with content hashes
+        """
+        html = "<html><head></head><body><p>Hi</p></body></html>"
+        assets = {
+            "css": {"url": "https://cdn/p.css", "content_hashes": {"hash1"}},
+        }
+
+        _process_html(html, assets)
+
+        mock_strip.assert_not_called()
+
 
 class TestProcessHtmlJsLoadingAttrs:
     """Tests for JS script tag injection with loading attributes.
@@ -735,6 +1064,33 @@ class TestMiddlewareCallPassThrough:
 
         assert result is response
 
+    @mock.patch("wagtail_asset_publisher.middleware._get_published_assets")
+    @mock.patch("wagtail_asset_publisher.middleware._get_page")
+    @mock.patch("wagtail_asset_publisher.middleware._is_preview_request")
+    def test_non_html_response_skips_lookups(
+        self, mock_is_preview, mock_get_page, mock_get_assets
+    ):
+        """Non-HTML responses never reach the page or asset lookups.
+
+        Purpose: Verify that the content-type check runs before any request
+            attribute, cache or database access, so images, JSON endpoints
+            and admin AJAX calls pay only for one header read.
+        Category: Normal case
+        Target: AssetPublisherMiddleware.__call__(request)
+        Technique: Equivalence partitioning (non-HTML content type)
+        Test data: Page request whose response is application/json
+        """
+        request = mock.Mock()
+        response = mock.Mock()
+        response.get.return_value = "application/json"
+
+        middleware = AssetPublisherMiddleware(mock.Mock(return_value=response))
+
+        assert middleware(request) is response
+        mock_is_preview.assert_not_called()
+        mock_get_page.assert_not_called()
+        mock_get_assets.assert_not_called()
+
     @mock.patch("wagtail_asset_publisher.middleware._get_published_assets")
     @mock.patch("wagtail_asset_publisher.middleware._get_page")
     @mock.patch("wagtail_asset_publisher.middleware._is_preview_request")
@@ -998,10 +1354,10 @@ class TestInvalidateCache:
 
     @mock.patch("wagtail_asset_publisher.middleware.cache")
     def test_cache_invalidation(self, mock_cache):
-        """invalidate_cache removes the cached entry for a page.
+        """invalidate_cache bumps the cache version for a page.
 
-        Purpose: Verify that calling invalidate_cache deletes the correct
-            cache key so the next request fetches fresh data.
+        Purpose: Verify that calling invalidate_cache increments the correct
+            version key so the next request reads a fresh cache entry.
         Category: Normal case
         Target: invalidate_cache(page_id)
         Technique: Equivalence partitioning
@@ -1009,13 +1365,14 @@ class TestInvalidateCache:
         """
         invalidate_cache(42)
 
-        mock_cache.delete.assert_called_once_with(f"{CACHE_KEY_PREFIX}42")
+        mock_cache.incr.assert_called_once_with(f"{CACHE_KEY_PREFIX}ver:42")
+        mock_cache.set.assert_not_called()
 
     @mock.patch("wagtail_asset_publisher.middleware.cache")
     def test_cache_invalidation_different_page(self, mock_cache):
         """invalidate_cache uses correct key for different page IDs.
 
-        Purpose: Verify that the cache key is correctly composed with
+        Purpose: Verify that the version key is correctly composed with
             the given page ID.
         Category: Normal case
         Target: invalidate_cache(page_id)
@@ -1024,7 +1381,90 @@ class TestInvalidateCache:
         """
         invalidate_cache(999)
 
-        mock_cache.delete.assert_called_once_with(f"{CACHE_KEY_PREFIX}999")
+        mock_cache.incr.assert_called_once_with(f"{CACHE_KEY_PREFIX}ver:999")
+
+    @mock.patch("wagtail_asset_publisher.middleware.time.time_ns")
+    @mock.patch("wagtail_asset_publisher.middleware.cache")
+    def test_missing_version_seeded_from_clock(self, mock_cache, mock_time_ns):
+        """A page without a stored version is seeded with a timestamp.
+
+        Purpose: Verify that invalidating a page whose version key does not
+            exist (never set, or evicted) stores a version that cannot match
+            an earlier one.
+        Category: Edge case
+        Target: invalidate_cache(page_id)
+        Technique: Error guessing (cache.incr on missing key)
+        Test data: cache.incr raising ValueError
+        """
+        mock_cache.incr.side_effect = ValueError
+        mock_time_ns.return_value = 1_700_000_000_000_000_000
+
+        invalidate_cache(42)
+
+        mock_cache.set.assert_called_once_with(
+            f"{CACHE_KEY_PREFIX}ver:42", 1_700_000_000_000_000_000, None
+        )
+
+    @mock.patch("wagtail_asset_publisher.models.PublishedAsset")
+    def test_missing_version_is_a_miss(self, MockPublishedAsset):
+        """An evicted version key never falls back to version 0.
+
+        Purpose: Verify that a lookup without a stored version seeds a new
+            one instead of serving an entry cached under ``v0``.
+        Category: Edge case
+        Target: _get_published_assets(page_id)
+        Technique: Error guessing (version key evicted)
+        Test data: LocMemCache holding only a stale ``wap:42:v0`` entry
+        """
+        cache.set(f"{CACHE_KEY_PREFIX}42:v0", {"css": {"url": "/old.css"}})
+        MockPublishedAsset.objects.filter.return_value = []
+
+        result = _get_published_assets(42)
+
+        assert result == {}
+        assert cache.get(f"{CACHE_KEY_PREFIX}ver:42") is not None
+
+    @mock.patch("wagtail_asset_publisher.middleware.cache")
+    def test_concurrently_seeded_version_is_kept(self, mock_cache):
+        """A version seeded by another process first is the one used.
+
+        Purpose: Verify that losing the seeding race reads back the stored
+            version instead of using the local timestamp.
+        Category: Edge case
+        Target: _asset_version(page_id)
+        Technique: Error guessing (cache.add race)
+        Test data: cache.add returning False, stored version 5
+        """
+        mock_cache.get.side_effect = [None, 5]
+        mock_cache.add.return_value = False
+
+        assert _asset_version(42) == 5
+        mock_cache.add.assert_called_once_with(
+            f"{CACHE_KEY_PREFIX}ver:42", mock.ANY, None
+        )
+
+    @mock.patch("wagtail_asset_publisher.models.PublishedAsset")
+    def test_invalidation_moves_lookups_to_new_entry(self, MockPublishedAsset):
+        """Lookups after invalidation rebuild from the DB exactly once.
+
+        Purpose: Verify against the real cache backend that the previous
+            entry is no longer served and the rebuilt one is reused.
+        Category: Normal case
+        Target: invalidate_cache(page_id), _get_published_assets(page_id)
+        Technique: State transition (hit -> invalidated -> miss -> hit)
+        Test data: LocMemCache, page 42 with no assets
+        """
+        MockPublishedAsset.objects.filter.return_value = []
+
+        _get_published_assets(42)
+        invalidate_cache(42)
+        _get_published_assets(42)
+        invalidate_cache(42)
+        _get_published_assets(42)
+        middleware._local_cache.clear()
+        _get_published_assets(42)
+
+        assert MockPublishedAsset.objects.filter.call_count == 3
 
 
 class TestTagStripperHandlers:
@@ -1212,3 +1652,154 @@ class TestMiddlewareStreamingGuard:
         result = middleware(request)
 
         assert result is response
+
+
+class TestMiddlewareAsync:
+    """Tests for AssetPublisherMiddleware under an async middleware chain."""
+
+    def test_sync_get_response_keeps_sync_call(self):
+        """Middleware wrapping a sync handler is not marked as a coroutine.
+
+        Purpose: Verify that WSGI deployments keep the plain synchronous
+            call path.
+        Category: Normal case
+        Target: AssetPublisherMiddleware.__init__(get_response)
+        Technique: Equivalence partitioning (sync handler)
+        Test data: Mock get_response
+        """
+        middleware = AssetPublisherMiddleware(mock.Mock())
+
+        assert not iscoroutinefunction(middleware)
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_published_assets")
+    @mock.patch("wagtail_asset_publisher.middleware._get_page")
+    @mock.patch("wagtail_asset_publisher.middleware._is_preview_request")
+    def test_async_get_response_processes_html(
+        self, mock_is_preview, mock_get_page, mock_get_assets
+    ):
+        """Async handler output is processed and returned via an awaitable.
+
+        Purpose: Verify that the async path awaits the inner handler and then
+            applies the same asset injection as the sync path.
+        Category: Normal case
+        Target: AssetPublisherMiddleware.__acall__(request)
+        Technique: Equivalence partitioning (async handler)
+        Test data: Coroutine get_response returning an HTML page response
+        """
+        css_url = "/static/css/page.css"
+        request = mock.Mock()
+        response = HttpResponse(
+            "<html><head></head><body></body></html>",
+            content_type="text/html; charset=utf-8",
+        )
+        mock_is_preview.return_value = False
+        mock_get_page.return_value = mock.Mock(pk=1)
+        mock_get_assets.return_value = {
+            "css": {"url": css_url, "content_hashes": set()}
+        }
+
+        async def get_response(request):
+            return response
+
+        middleware = AssetPublisherMiddleware(get_response)
+
+        assert iscoroutinefunction(middleware)
+        result = asyncio.run(middleware(request))
+
+        assert result is response
+        assert css_url in result.content.decode()
+        assert result["Content-Length"] == str(len(result.content))
+
+    def test_async_non_html_passes_through(self):
+        """Async handler returning JSON is passed through untouched.
+
+        Purpose: Verify that the async path keeps the content-type short
+            circuit.
+        Category: Normal case
+        Target: AssetPublisherMiddleware.__acall__(request)
+        Technique: Equivalence partitioning (non-HTML content type)
+        Test data: Coroutine get_response returning application/json
+        """
+        response = mock.Mock()
+        response.get.return_value = "application/json"
+
+        async def get_response(request):
+            return response
+
+        middleware = AssetPublisherMiddleware(get_response)
+
+        assert asyncio.run(middleware(mock.Mock())) is response
+
+
+class TestCombinedMiddleware:
+    """Tests for AssetPublisherCombinedMiddleware redirect composition."""
+
+    def test_matched_redirect_returned_for_404(self):
+        """A 404 with a matching redirect returns the redirect response.
+
+        Purpose: Verify that the combined middleware behaves like Wagtail's
+            RedirectMiddleware for missing pages.
+        Category: Normal case
+        Target: AssetPublisherCombinedMiddleware.__call__(request)
+        Technique: Equivalence partitioning (404 with redirect)
+        Test data: 404 response, redirect lookup returning a 301
+        """
+        not_found = HttpResponse(status=404, content_type="text/html")
+        redirect = HttpResponse(status=301)
+        middleware = AssetPublisherCombinedMiddleware(mock.Mock(return_value=not_found))
+
+        with (
+            mock.patch.object(
+                middleware._redirects, "process_response", return_value=redirect
+            ),
+            mock.patch("wagtail_asset_publisher.middleware._get_page") as mock_page,
+        ):
+            result = middleware(mock.Mock())
+
+        assert result is redirect
+        mock_page.assert_not_called()
+
+    @mock.patch("wagtail_asset_publisher.middleware._get_page", return_value=None)
+    @mock.patch(
+        "wagtail_asset_publisher.middleware._is_preview_request", return_value=False
+    )
+    def test_unmatched_404_continues_to_asset_processing(
+        self, mock_is_preview, mock_get_page
+    ):
+        """A 404 without a redirect is processed like any other response.
+
+        Purpose: Verify that the asset pipeline still runs when no redirect
+            matches.
+        Category: Normal case
+        Target: AssetPublisherCombinedMiddleware.__call__(request)
+        Technique: Equivalence partitioning (404 without redirect)
+        Test data: 404 HTML response, redirect lookup returning it unchanged
+        """
+        not_found = HttpResponse(status=404, content_type="text/html")
+        middleware = AssetPublisherCombinedMiddleware(mock.Mock(return_value=not_found))
+
+        with mock.patch.object(
+            middleware._redirects, "process_response", return_value=not_found
+        ):
+            result = middleware(mock.Mock())
+
+        assert result is not_found
+        mock_get_page.assert_called_once()
+
+    def test_non_404_skips_redirect_lookup(self):
+        """Successful responses never trigger a redirect lookup.
+
+        Purpose: Verify that the redirect table is only queried for 404s.
+        Category: Normal case
+        Target: AssetPublisherCombinedMiddleware.__call__(request)
+        Technique: Equivalence partitioning (non-404 status)
+        Test data: 200 JSON response
+        """
+        ok = HttpResponse("{}", content_type="application/json")
+        middleware = AssetPublisherCombinedMiddleware(mock.Mock(return_value=ok))
+
+        with mock.patch.object(middleware._redirects, "process_response") as lookup:
+            result = middleware(mock.Mock())
+
+        assert result is ok
+        lookup.assert_not_called()
@@ -5,6 +5,7 @@ Pipeline: Extract -> Build -> Publish -> Record
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
@@ -353,7 +354,7 @@ class TestProcessJs:
         ):
             _process_js(page, storage, [script])
 
-            mock_pa.objects.update_or_create.assert_called_once()
+            mock_pa.objects.bulk_create.assert_called_once()
 
         mock_builder.build.assert_called_once_with(
             None, ["console.log('hello');"], "js"
@@ -465,7 +466,8 @@ class TestProcessJsLoadingGroups:
         ):
             _process_js(page, storage, [blocking_script, defer_script, module_script])
 
-            assert mock_pa.objects.update_or_create.call_count == 3
+            assert mock_pa.call_count == 3
+            mock_pa.objects.bulk_create.assert_called_once()
 
         assert storage.save.call_count == 3
         assert mock_builder.build.call_count == 3
@@ -583,19 +585,19 @@ class TestProcessJsLoadingGroups:
     )
     @mock.patch("wagtail_asset_publisher.utils.get_setting")
     @mock.patch("wagtail_asset_publisher.utils.get_builder")
-    def test_update_or_create_receives_loading_value(
+    def test_bulk_create_receives_loading_value(
         self,
         mock_get_builder,
         mock_get_setting,
         mock_hash,
         mock_invalidate,
     ):
-        """Loading value is passed to PublishedAsset.objects.update_or_create.
+        """Loading value is recorded on the bulk-created PublishedAsset.
 
         Purpose: Verify that _process_js correctly passes the loading value
             when creating or updating PublishedAsset records in the database.
         Category: Normal case
-        Target: _process_js(page, storage, scripts) -> PublishedAsset.objects.update_or_create
+        Target: _process_js(page, storage, scripts) -> PublishedAsset.objects.bulk_create
         Technique: Equivalence partitioning (loading value propagation)
         Test data: Pre-extracted script with loading="module"
         """
@@ -626,16 +628,15 @@ class TestProcessJsLoadingGroups:
         ):
             _process_js(page, storage, [script])
 
-            mock_pa.objects.update_or_create.assert_called_once_with(
+            mock_pa.assert_called_once_with(
                 page=page,
                 asset_type="js",
                 loading="module",
                 position="body",
-                defaults={
-                    "url": "/media/page-assets/js/42-mod12345-module.js",
-                    "content_hashes": ["hash_module"],
-                },
+                url="/media/page-assets/js/42-mod12345-module.js",
+                content_hashes=["hash_module"],
             )
+            mock_pa.objects.bulk_create.assert_called_once_with([mock_pa.return_value])
 
     @mock.patch("wagtail_asset_publisher.utils.invalidate_cache")
     @mock.patch(
@@ -692,7 +693,7 @@ class TestProcessJsLoadingGroups:
         ):
             _process_js(page, storage, [script1, script2])
 
-            mock_pa.objects.update_or_create.assert_called_once()
+            mock_pa.assert_called_once()
 
         mock_builder.build.assert_called_once_with(
             None, ["deferred1();", "deferred2();"], "js"
@@ -748,7 +749,8 @@ class TestProcessJsLoadingGroups:
         ):
             _process_js(page, storage, [script])
 
-            mock_pa.objects.update_or_create.assert_not_called()
+            mock_pa.assert_not_called()
+            mock_pa.objects.bulk_create.assert_not_called()
 
         storage.save.assert_not_called()
 
@@ -1658,9 +1660,7 @@ class TestFindTerser:
         Technique: Decision coverage (C1) - no BASE_DIR branch
         Test data: BASE_DIR not defined
         """
-        mock_settings_obj = mock.Mock(spec=[])
-
-        with mock.patch("django.conf.settings", mock_settings_obj):
+        with mock.patch("django.conf.settings", SimpleNamespace()):
             result = _find_terser()
 
         assert result == "/usr/local/bin/terser"
@@ -1677,9 +1677,7 @@ class TestFindTerser:
         Technique: Boundary value analysis - all paths exhausted
         Test data: terser not installed
         """
-        mock_settings_obj = mock.Mock(spec=[])
-
-        with mock.patch("django.conf.settings", mock_settings_obj):
+        with mock.patch("django.conf.settings", SimpleNamespace()):
             result = _find_terser()
 
         assert result is None
@@ -1970,7 +1968,8 @@ class TestProcessJsPositionAware:
         ):
             _process_js(page, storage, [body_blocking, head_blocking, body_defer])
 
-            assert mock_pa.objects.update_or_create.call_count == 3
+            assert mock_pa.call_count == 3
+            mock_pa.objects.bulk_create.assert_called_once()
 
         assert storage.save.call_count == 3
         assert mock_builder.build.call_count == 3
@@ -2211,7 +2210,7 @@ class TestProcessJsPositionAware:
         """Mixed (loading, position) groups create separate PublishedAsset records.
 
         Purpose: Verify that scripts with different (loading, position)
-            combinations produce separate update_or_create calls with
+            combinations produce separate PublishedAsset records with
             correct position values.
         Category: Normal case
         Target: _process_js(page, storage, scripts)
@@ -2251,8 +2250,8 @@ class TestProcessJsPositionAware:
         ):
             _process_js(page, storage, [body_script, head_script])
 
-            assert mock_pa.objects.update_or_create.call_count == 2
+            assert mock_pa.call_count == 2
 
-            calls = mock_pa.objects.update_or_create.call_args_list
+            calls = mock_pa.call_args_list
             positions = {call.kwargs["position"] for call in calls}
             assert positions == {"body", "head"}